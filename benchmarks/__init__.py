@@ -0,0 +1 @@
+"""Ad-hoc performance benchmarks; run modules with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,102 @@
+"""Compare the pandas cut-sheet export with the streaming Excel writer."""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from benchmarks.synthetic import build_synthetic_config
+from topology_generator.port_mapper import (
+    create_port_mapping,
+    save_to_excel,
+    write_port_mapping_excel,
+)
+from topology_generator.topology_generator import generate_topology
+
+WRITERS = ("pandas", "streaming")
+
+
+def run_writer(writer: str, config: dict[str, object], output_dir: str) -> dict[str, float]:
+    """Build the graph, then time one writer and report its peak RSS growth."""
+    graph = generate_topology(config)
+    baseline_rss_mb = _peak_rss_mb()
+
+    started = time.perf_counter()
+    if writer == "pandas":
+        save_to_excel(create_port_mapping(graph), output_dir, f"{writer}.xlsx")
+    else:
+        write_port_mapping_excel(graph, output_dir, f"{writer}.xlsx")
+    seconds = time.perf_counter() - started
+
+    return {
+        "seconds": seconds,
+        "peak_rss_growth_mb": _peak_rss_mb() - baseline_rss_mb,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pods", type=int, default=16)
+    parser.add_argument("--compute-per-pod", type=int, default=64)
+    parser.add_argument("--leaves-per-pod", type=int, default=8)
+    parser.add_argument("--spines", type=int, default=16)
+    parser.add_argument("--cables-per-pair", type=int, default=2)
+    args = parser.parse_args()
+
+    config = build_synthetic_config(
+        pods=args.pods,
+        compute_per_pod=args.compute_per_pod,
+        leaves_per_pod=args.leaves_per_pod,
+        spines=args.spines,
+        cables_per_pair=args.cables_per_pair,
+    )
+    # Each writer runs in a fresh process so peak RSS is not shared between them.
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for writer in WRITERS:
+            with context.Pool(1) as pool:
+                result = pool.apply(run_writer, (writer, config, output_dir))
+            size_mb = (Path(output_dir) / f"{writer}.xlsx").stat().st_size / 2**20
+            print(
+                f"{writer:<10} {result['seconds']:8.2f}s  "
+                f"+{result['peak_rss_growth_mb']:.0f} MB peak RSS  "
+                f"{size_mb:.1f} MB file"
+            )
+        if not _same_sheet_values(*(Path(output_dir) / f"{w}.xlsx" for w in WRITERS)):
+            raise SystemExit("streamed cut-sheet does not match the pandas export")
+
+
+def _same_sheet_values(reference: Path, candidate: Path) -> bool:
+    reference_book = load_workbook(reference, read_only=True)
+    candidate_book = load_workbook(candidate, read_only=True)
+    try:
+        return all(
+            expected == actual
+            for expected, actual in zip(
+                reference_book.active.iter_rows(values_only=True),
+                candidate_book.active.iter_rows(values_only=True),
+                strict=True,
+            )
+        )
+    except ValueError:
+        return False
+    finally:
+        reference_book.close()
+        candidate_book.close()
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compare cut-sheet write and read times across output formats."""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import build_synthetic_config
+from topology_generator.cutsheet_formats import (
+    OUTPUT_FORMATS,
+    port_mapping_filename,
+    write_port_mapping,
+)
+from topology_generator.topology_generator import generate_topology
+
+
+def read_port_mapping(path: Path, output_format: str) -> pd.DataFrame:
+    """Load a cut-sheet the way downstream tooling would."""
+    if output_format == "xlsx":
+        return pd.read_excel(path)
+    if output_format == "parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pods", type=int, default=16)
+    parser.add_argument("--compute-per-pod", type=int, default=64)
+    parser.add_argument("--leaves-per-pod", type=int, default=8)
+    parser.add_argument("--spines", type=int, default=16)
+    parser.add_argument("--cables-per-pair", type=int, default=2)
+    args = parser.parse_args()
+
+    graph = generate_topology(
+        build_synthetic_config(
+            pods=args.pods,
+            compute_per_pod=args.compute_per_pod,
+            leaves_per_pod=args.leaves_per_pod,
+            spines=args.spines,
+            cables_per_pair=args.cables_per_pair,
+        )
+    )
+    formats = [
+        output_format
+        for output_format in OUTPUT_FORMATS
+        if output_format != "parquet" or importlib.util.find_spec("pyarrow")
+    ]
+
+    reference: pd.DataFrame | None = None
+    with tempfile.TemporaryDirectory() as output_dir:
+        for output_format in formats:
+            path = Path(output_dir) / port_mapping_filename(output_format)
+
+            started = time.perf_counter()
+            row_count = write_port_mapping(graph, output_dir, output_format)
+            write_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            frame = read_port_mapping(path, output_format)
+            read_seconds = time.perf_counter() - started
+
+            key_columns = frame[["source_node_id", "target_node_id", "cable_number"]]
+            if reference is None:
+                reference = key_columns
+            elif not key_columns.equals(reference):
+                raise SystemExit(f"{output_format} rows do not match the xlsx export")
+            print(
+                f"{output_format:<8} rows={row_count} "
+                f"write={write_seconds:6.2f}s read={read_seconds:6.2f}s "
+                f"size={path.stat().st_size / 2**20:.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare per-bundle ``NodeUsage`` accumulation with the array-based engine."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.synthetic import build_synthetic_config
+from topology_generator.config_identifiers import normalize_identifier
+from topology_generator.expander import ExpandedTopology, expand_topology
+from topology_generator.validator import NodeUsage, build_node_usage
+
+
+def build_node_usage_per_bundle(
+    expanded_topology: ExpandedTopology,
+) -> dict[str, NodeUsage]:
+    """Reference implementation: copy a frozen ``NodeUsage`` per bundle endpoint."""
+    usage = {node_id: NodeUsage() for node_id in expanded_topology.node_ids}
+    for bundle in expanded_topology.iter_links():
+        bundle_bandwidth = bundle.num_cables * bundle.cable_bandwidth_gb
+        pool_name = normalize_identifier(bundle.port_pool)
+        for node_id, lane_units_per_cable, is_source in (
+            (bundle.source_node_id, bundle.source_lane_units_per_cable, True),
+            (bundle.target_node_id, bundle.target_lane_units_per_cable, False),
+        ):
+            node_usage = usage[node_id]
+            pool_usage = dict(node_usage.required_lane_units_by_pool)
+            pool_usage[pool_name] = pool_usage.get(pool_name, 0) + (
+                bundle.num_cables * lane_units_per_cable
+            )
+            usage[node_id] = NodeUsage(
+                required_lane_units_by_pool=pool_usage,
+                bandwidth_up_gb=node_usage.bandwidth_up_gb
+                + (bundle_bandwidth if is_source else 0.0),
+                bandwidth_down_gb=node_usage.bandwidth_down_gb
+                + (0.0 if is_source else bundle_bandwidth),
+            )
+    return usage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pods", type=int, default=32)
+    parser.add_argument("--compute-per-pod", type=int, default=64)
+    parser.add_argument("--leaves-per-pod", type=int, default=16)
+    parser.add_argument("--spines", type=int, default=32)
+    args = parser.parse_args()
+
+    expanded = expand_topology(
+        build_synthetic_config(
+            pods=args.pods,
+            compute_per_pod=args.compute_per_pod,
+            leaves_per_pod=args.leaves_per_pod,
+            spines=args.spines,
+        )
+    )
+    print(f"nodes={expanded.num_nodes} bundles={expanded.num_links}")
+
+    started = time.perf_counter()
+    reference = build_node_usage_per_bundle(expanded)
+    reference_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batched = build_node_usage(expanded)
+    batched_seconds = time.perf_counter() - started
+
+    if batched != reference:
+        raise SystemExit("batched usage does not match the per-bundle reference")
+    print(f"per-bundle: {reference_seconds:.3f}s")
+    print(f"batched:    {batched_seconds:.3f}s")
+    print(f"speedup:    {reference_seconds / batched_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""Time each pipeline stage on synthetic layouts from 1k to 128k GPUs.
+
+Every layout and size runs in a fresh process. Each stage records its wall
+time, its own peak RSS and how far that peak rose above the RSS the stage
+started with. The cut-sheet stage uses the CLI's ``write_port_mapping``
+writer in the chosen ``--output-format``.
+Results are written as JSON; pass an earlier file as ``--compare`` to flag
+stages that got slower.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypeVar
+
+from benchmarks.synthetic import (
+    build_multi_fabric_config,
+    build_multi_scope_config,
+    build_synthetic_config,
+)
+
+GPU_COUNTS = (1024, 8192, 32768, 131072)
+LAYOUTS: dict[str, Callable[[int], dict[str, object]]] = {
+    "single_fabric": lambda gpus: build_synthetic_config(
+        pods=gpus // 32,
+        compute_per_pod=32,
+        leaves_per_pod=2,
+        spines=16,
+    ),
+    "multi_fabric": build_multi_fabric_config,
+    "multi_scope": build_multi_scope_config,
+}
+STAGES = (
+    "expand_topology",
+    "validate_expanded_topology",
+    "generate_topology",
+    "write_port_mapping",
+    "visualize_topology",
+)
+OUTPUT_FORMATS = ("xlsx", "csv", "csv.gz", "parquet")
+RESULTS_FORMAT_VERSION = 3
+PROC_STATUS = Path("/proc/self/status")
+PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+_ResultT = TypeVar("_ResultT")
+
+
+def run_case(
+    layout: str,
+    gpus: int,
+    stages: tuple[str, ...],
+    output_format: str = "xlsx",
+) -> dict[str, Any]:
+    """Run the selected stages in order on one synthetic config.
+
+    Stages build on each other's outputs, so ``generate_topology`` reuses the
+    expansion and the writers reuse the graph, as in a CLI run. Heavy modules
+    are imported first, so no stage is charged for their import time or memory.
+    Writers run with ``jobs=1`` so every stage's work stays in this process.
+    """
+    from topology_generator.batch import preload_modules
+    from topology_generator.config_types import TopologyConfig
+    from topology_generator.cutsheet_formats import write_port_mapping
+    from topology_generator.expander import expand_topology
+    from topology_generator.rendering import visualize_topology
+    from topology_generator.topology_generator import generate_topology
+    from topology_generator.validator import validate_expanded_topology
+
+    preload_modules()
+    if output_format == "parquet":
+        importlib.import_module("pyarrow")
+    config = TopologyConfig.from_mapping(LAYOUTS[layout](gpus))
+    results: dict[str, dict[str, float | None]] = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        expanded_topology = _measure(
+            results, "expand_topology", expand_topology, config
+        )
+        if "validate_expanded_topology" in stages:
+            _measure(
+                results,
+                "validate_expanded_topology",
+                validate_expanded_topology,
+                expanded_topology,
+            )
+        graph = _measure(
+            results,
+            "generate_topology",
+            generate_topology,
+            config,
+            expanded_topology=expanded_topology,
+        )
+        cable_count = graph.number_of_edges()
+        if "write_port_mapping" in stages:
+            cable_count = _measure(
+                results,
+                "write_port_mapping",
+                write_port_mapping,
+                graph,
+                output_dir,
+                output_format,
+                jobs=1,
+            )
+        if "visualize_topology" in stages:
+            _measure(
+                results,
+                "visualize_topology",
+                visualize_topology,
+                graph,
+                output_dir,
+                jobs=1,
+            )
+
+    return {
+        "layout": layout,
+        "gpus": gpus,
+        "output_format": output_format,
+        "nodes": expanded_topology.num_nodes,
+        "cables": cable_count,
+        "stages": {stage: results[stage] for stage in STAGES if stage in results},
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float,
+    min_seconds: float = 0.05,
+) -> list[str]:
+    """Return a line per stage that took more than ``threshold`` times its baseline.
+
+    Stages under ``min_seconds`` in both runs are timer noise and never count.
+    """
+    baseline_cases = {
+        (case["layout"], case["gpus"], case.get("output_format")): case
+        for case in baseline["results"]
+    }
+    regressions = []
+    for case in current["results"]:
+        baseline_case = baseline_cases.get(
+            (case["layout"], case["gpus"], case.get("output_format"))
+        )
+        if baseline_case is None:
+            continue
+        for stage, measurement in case["stages"].items():
+            baseline_measurement = baseline_case["stages"].get(stage)
+            if baseline_measurement is None or (
+                max(measurement["seconds"], baseline_measurement["seconds"])
+                < min_seconds
+            ):
+                continue
+            ratio = measurement["seconds"] / max(baseline_measurement["seconds"], 1e-6)
+            if ratio > threshold:
+                regressions.append(
+                    f"{case['layout']} {case['gpus']:,} GPUs {stage}: "
+                    f"{baseline_measurement['seconds']:.2f}s -> "
+                    f"{measurement['seconds']:.2f}s ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--gpus",
+        type=int,
+        nargs="+",
+        default=list(GPU_COUNTS),
+        help="GPU counts to run; each must be a multiple of 1024",
+    )
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=STAGES,
+        default=list(STAGES),
+        help="Stages to time; expand_topology and generate_topology always run",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="xlsx",
+        help="Cut-sheet format written by the write_port_mapping stage",
+    )
+    parser.add_argument("--output", default="scale_results.json")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Slowdown ratio reported as a regression by --compare",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.05,
+        help="Stages faster than this in both runs are ignored by --compare",
+    )
+    args = parser.parse_args()
+
+    stages = tuple(args.stages)
+    # Each case runs in a fresh process so peak RSS is not shared between them.
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for layout in args.layouts:
+        for gpus in args.gpus:
+            with context.Pool(1) as pool:
+                case = pool.apply(run_case, (layout, gpus, stages, args.output_format))
+            results.append(case)
+            print(
+                f"{layout} {gpus:,} GPUs: {case['nodes']:,} nodes, {case['cables']:,} cables"
+            )
+            for stage, measurement in case["stages"].items():
+                growth_mb = measurement["peak_rss_growth_mb"]
+                print(
+                    f"  {stage:<28} {measurement['seconds']:8.2f}s  "
+                    f"{measurement['peak_rss_mb']:8.0f} MB peak RSS  "
+                    + ("(growth n/a)" if growth_mb is None else f"(+{growth_mb:.0f} MB)")
+                )
+
+    report = {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare_results(
+            baseline, report, args.threshold, args.min_seconds
+        )
+        if regressions:
+            raise SystemExit(
+                f"Stages slower than {args.threshold:g}x {args.compare}:\n"
+                + "\n".join(regressions)
+            )
+        print(f"No stage slower than {args.threshold:g}x {args.compare}")
+
+
+def _measure(
+    results: dict[str, dict[str, float | None]],
+    stage: str,
+    function: Callable[..., _ResultT],
+    *args: object,
+    **kwargs: object,
+) -> _ResultT:
+    """Call ``function`` and record its wall time and peak RSS under ``stage``.
+
+    On Linux the kernel's peak-RSS mark is reset first, so a stage that runs
+    after a hungrier one still reports its own peak. Where the mark cannot be
+    reset, ``peak_rss_mb`` is the process's peak so far and the growth is
+    ``None``.
+    """
+    start_rss_mb = _reset_peak_rss()
+    started = time.perf_counter()
+    value = function(*args, **kwargs)
+    seconds = time.perf_counter() - started
+    peak_rss_mb = _peak_rss_mb()
+    results[stage] = {
+        "seconds": round(seconds, 4),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "peak_rss_growth_mb": (
+            None if start_rss_mb is None else round(peak_rss_mb - start_rss_mb, 1)
+        ),
+    }
+    return value
+
+
+def _reset_peak_rss() -> float | None:
+    """Reset the peak-RSS mark to the current RSS and return it in MB.
+
+    Returns ``None`` where ``/proc/self/clear_refs`` is unavailable.
+    """
+    try:
+        PROC_CLEAR_REFS.write_text("5", encoding="ascii")
+    except OSError:
+        return None
+    return _proc_status_mb("VmRSS")
+
+
+def _peak_rss_mb() -> float:
+    peak_mb = _proc_status_mb("VmHWM")
+    if peak_mb is not None:
+        return peak_mb
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _proc_status_mb(field: str) -> float | None:
+    try:
+        status = PROC_STATUS.read_text(encoding="ascii")
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1]) / 2**10
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Time CLI runs for each ``--only`` mode and report which heavy modules load."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+MODES = ("validate", "graph", "render", "cutsheet", None)
+HEAVY_MODULES = ("networkx", "pandas", "openpyxl", "matplotlib")
+# Runs main() in-process so the modules it imported can be listed afterwards.
+RUN_MAIN = (
+    "import json, sys; "
+    "from topology_generator.main import main; "
+    "main(); "
+    "print(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+)
+
+
+def run_mode(mode: str | None, config: str, output_format: str) -> tuple[float, list[str]]:
+    """Run the CLI once for ``mode`` and return its wall time and heavy imports."""
+    with tempfile.TemporaryDirectory() as output_dir:
+        args = ["--config", config, "--output-dir", output_dir]
+        args += ["--output-format", output_format, "--jobs", "1"]
+        if mode is not None:
+            args += ["--only", mode]
+        started = time.perf_counter()
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import sys; sys.argv = ['topology-generator', *{args!r}]; "
+                + RUN_MAIN.format(modules=HEAVY_MODULES),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        seconds = time.perf_counter() - started
+    return seconds, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--config", default="configs/examples/two_tier_small.yaml")
+    parser.add_argument("--output-format", default="csv")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for mode in MODES:
+        runs = [
+            run_mode(mode, args.config, args.output_format)
+            for _ in range(args.repeats)
+        ]
+        median_seconds = statistics.median(seconds for seconds, _ in runs)
+        imported = runs[-1][1]
+        print(
+            f"{mode or 'all':<10} {median_seconds:6.2f}s median  "
+            f"heavy imports: {', '.join(imported) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
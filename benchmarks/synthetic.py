@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+
+def build_synthetic_config(
+    pods: int = 16,
+    compute_per_pod: int = 32,
+    leaves_per_pod: int = 8,
+    spines: int = 16,
+    cables_per_pair: int = 1,
+) -> dict[str, object]:
+    """Return a grouped three-tier config sized for benchmarking.
+
+    Port pools are sized to exactly fit the generated demand so the config
+    always validates.
+    """
+    compute_lanes = leaves_per_pod * cables_per_pair
+    leaf_lanes = (compute_per_pod + spines) * cables_per_pair
+    spine_lanes = pods * leaves_per_pod * cables_per_pair
+    return {
+        "groups": [{"name": "pod", "count": pods}],
+        "layers": [
+            _layer("compute", "pod", compute_per_pod, compute_lanes),
+            _layer("leaf", "pod", leaves_per_pod, leaf_lanes),
+            _layer("spine", "global", spines, spine_lanes),
+        ],
+        "links": [
+            _link("compute", "leaf", "same_scope_full_mesh", cables_per_pair),
+            _link("leaf", "spine", "to_global_full_mesh", cables_per_pair),
+        ],
+    }
+
+
+def build_multi_fabric_config(
+    gpu_nodes: int,
+    gpus_per_pod: int = 32,
+    leaves_per_pod: int = 2,
+    spines: int = 16,
+) -> dict[str, object]:
+    """Return a backend/frontend/oob config sharing ``gpu_nodes`` GPU nodes.
+
+    The backend is a leaf/spine fabric, the frontend has one ToR per pod and
+    the out-of-band fabric one management switch per pod. ``gpu_nodes`` must
+    be a multiple of ``gpus_per_pod``.
+    """
+    pods = gpu_nodes // gpus_per_pod
+    return {
+        "groupings": [{"name": "pod", "members_per_group": gpus_per_pod}],
+        "gpu_nodes": {
+            "total_nodes": gpu_nodes,
+            "fabric_port_pools": {
+                "backend": _port_pools(leaves_per_pod),
+                "frontend": _port_pools(1),
+                "oob": _port_pools(1),
+            },
+        },
+        "fabrics": [
+            {
+                "name": "backend",
+                "gpu_nodes_placement": "pod",
+                "layers": [
+                    _layer("leaf", "pod", leaves_per_pod, gpus_per_pod + spines),
+                    _layer("spine", "global", spines, pods * leaves_per_pod),
+                ],
+                "links": [
+                    _link("gpu_nodes", "leaf", "same_scope_full_mesh", 1),
+                    _link("leaf", "spine", "to_global_full_mesh", 1),
+                ],
+            },
+            {
+                "name": "frontend",
+                "gpu_nodes_placement": "pod",
+                "layers": [_layer("tor", "pod", 1, gpus_per_pod)],
+                "links": [_link("gpu_nodes", "tor", "same_scope_full_mesh", 1)],
+            },
+            {
+                "name": "oob",
+                "gpu_nodes_placement": "pod",
+                "layers": [_layer("mgmt", "pod", 1, gpus_per_pod)],
+                "links": [_link("gpu_nodes", "mgmt", "same_scope_full_mesh", 1)],
+            },
+        ],
+    }
+
+
+def build_multi_scope_config(
+    gpu_nodes: int,
+    gpus_per_pod: int = 1024,
+    gpus_per_rack: int = 32,
+    leaves_per_rack: int = 2,
+    spines_per_pod: int = 8,
+    super_spines: int = 16,
+) -> dict[str, object]:
+    """Return a single backend fabric spanning rack, pod and global scopes.
+
+    Rack leaves connect to pod spines with ``to_ancestor_full_mesh``, and pod
+    spines to global super-spines. ``gpu_nodes`` must be a multiple of
+    ``gpus_per_pod``, which must be a multiple of ``gpus_per_rack``.
+    """
+    pods = gpu_nodes // gpus_per_pod
+    leaves_per_pod = gpus_per_pod // gpus_per_rack * leaves_per_rack
+    return {
+        "groupings": [
+            {"name": "pod", "members_per_group": gpus_per_pod},
+            {"name": "rack", "members_per_group": gpus_per_rack},
+        ],
+        "gpu_nodes": {
+            "total_nodes": gpu_nodes,
+            "fabric_port_pools": {"backend": _port_pools(leaves_per_rack)},
+        },
+        "fabrics": [
+            {
+                "name": "backend",
+                "gpu_nodes_placement": "rack",
+                "layers": [
+                    _layer(
+                        "leaf", "rack", leaves_per_rack, gpus_per_rack + spines_per_pod
+                    ),
+                    _layer(
+                        "spine", "pod", spines_per_pod, leaves_per_pod + super_spines
+                    ),
+                    _layer(
+                        "super_spine", "global", super_spines, pods * spines_per_pod
+                    ),
+                ],
+                "links": [
+                    _link("gpu_nodes", "leaf", "same_scope_full_mesh", 1),
+                    _link("leaf", "spine", "to_ancestor_full_mesh", 1),
+                    _link("spine", "super_spine", "to_global_full_mesh", 1),
+                ],
+            }
+        ],
+    }
+
+
+def _layer(
+    name: str,
+    placement: str,
+    nodes_per_group: int,
+    total_lane_units: int,
+) -> dict[str, object]:
+    return {
+        "name": name,
+        "placement": placement,
+        "nodes_per_group": nodes_per_group,
+        "port_pools": _port_pools(total_lane_units),
+    }
+
+
+def _port_pools(total_lane_units: int) -> list[dict[str, object]]:
+    return [
+        {
+            "name": "fabric",
+            "base_lane_bandwidth_gb": 400,
+            "total_lane_units": total_lane_units,
+            "supported_port_modes": [
+                {"port_bandwidth_gb": 400, "lane_units": 1},
+            ],
+        }
+    ]
+
+
+def _link(
+    from_layer: str,
+    to_layer: str,
+    policy: str,
+    cables_per_pair: int,
+) -> dict[str, object]:
+    return {
+        "from": from_layer,
+        "to": to_layer,
+        "policy": policy,
+        "port_pool": "fabric",
+        "cables_per_pair": cables_per_pair,
+        "cable_bandwidth_gb": 400,
+    }
@@ -8,6 +8,12 @@ import yaml
 os.environ.setdefault("MPLBACKEND", "Agg")
 
 
+@pytest.fixture(autouse=True)
+def isolated_config_cache(tmp_path, monkeypatch):
+    # Keep CLI runs from reading or filling the user's real config cache.
+    monkeypatch.setenv("TOPOLOGY_GENERATOR_CACHE_DIR", str(tmp_path / "config_cache"))
+
+
 def port_pool(
     name: str,
     base_lane_bandwidth_gb: float,
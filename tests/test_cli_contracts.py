@@ -1,8 +1,11 @@
+import json
 import os
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
@@ -89,3 +92,60 @@ def test_importing_main_module_does_not_set_matplotlib_environment():
 
     assert result.returncode == 0, result.stdout + result.stderr
     assert result.stdout.strip() == '{"MPLCONFIGDIR": null, "MPLBACKEND": null}'
+
+
+@pytest.mark.parametrize(
+    ("only", "skipped_modules"),
+    [
+        (
+            "validate",
+            {
+                "networkx",
+                "pandas",
+                "openpyxl",
+                "matplotlib",
+                "topology_generator.rendering",
+                "topology_generator.port_mapper",
+            },
+        ),
+        ("graph", {"pandas", "openpyxl", "matplotlib", "topology_generator.port_mapper"}),
+        ("render", {"pandas", "openpyxl", "topology_generator.port_mapper"}),
+        ("cutsheet", {"pandas", "matplotlib", "topology_generator.rendering"}),
+        (
+            "check",
+            {
+                "networkx",
+                "pandas",
+                "openpyxl",
+                "matplotlib",
+                "topology_generator.topology_generator",
+            },
+        ),
+    ],
+)
+def test_only_stage_never_imports_skipped_stage_modules(tmp_path, only, skipped_modules):
+    stage_args = ["--check"] if only == "check" else ["--only", only]
+    argv = [
+        "topology-generator",
+        "--config",
+        "configs/examples/two_tier_small.yaml",
+        "--output-dir",
+        str(tmp_path / "outputs"),
+        *stage_args,
+    ]
+
+    result = _run_command(
+        sys.executable,
+        "-c",
+        (
+            "import json, sys; "
+            f"sys.argv = {argv!r}; "
+            "from topology_generator.main import main; "
+            "main(); "
+            "print(json.dumps(sorted(sys.modules)))"
+        ),
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    imported = set(json.loads(result.stdout.strip().splitlines()[-1]))
+    assert not imported & skipped_modules
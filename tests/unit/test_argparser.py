@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
-from topology_generator.argparser import parse_args
+import pytest
+
+from topology_generator.argparser import parse_args, parse_batch_args, parse_serve_args
 
 
 def test_parse_args_defaults():
@@ -10,6 +12,13 @@ def test_parse_args_defaults():
     assert args.config == "configs/examples/two_tier_small.yaml"
     assert args.output_dir == "output"
     assert args.timestamp is False
+    assert args.graph_backend == "networkx"
+    assert args.output_format == "xlsx"
+    assert args.jobs is None
+    assert args.only is None
+    assert args.check is False
+    assert args.cache is False
+    assert args.cache_dir is None
 
 
 def test_parse_args_custom():
@@ -44,3 +53,107 @@ def test_parse_args_has_no_filesystem_side_effects(tmp_path):
     assert args.output_dir == str(output_dir)
     assert args.timestamp is True
     assert not output_dir.exists()
+
+
+def test_parse_args_selects_graph_backend():
+    with patch("sys.argv", ["main.py", "--graph-backend", "compact"]):
+        args = parse_args()
+
+    assert args.graph_backend == "compact"
+
+
+def test_parse_args_accepts_positive_job_counts():
+    with patch("sys.argv", ["main.py", "--jobs", "4"]):
+        args = parse_args()
+
+    assert args.jobs == 4
+
+    with patch("sys.argv", ["main.py", "--jobs", "0"]), pytest.raises(SystemExit):
+        parse_args()
+
+
+def test_parse_args_selects_single_stage():
+    with patch("sys.argv", ["main.py", "--only", "validate"]):
+        args = parse_args()
+
+    assert args.only == "validate"
+
+    with patch("sys.argv", ["main.py", "--only", "report"]), pytest.raises(SystemExit):
+        parse_args()
+
+
+def test_parse_args_check_excludes_stage_selection():
+    with patch("sys.argv", ["main.py", "--check"]):
+        args = parse_args()
+
+    assert args.check is True
+
+    with (
+        patch("sys.argv", ["main.py", "--check", "--only", "graph"]),
+        pytest.raises(SystemExit),
+    ):
+        parse_args()
+
+
+def test_parse_args_configures_config_cache():
+    with patch("sys.argv", ["main.py", "--cache", "--cache-dir", "ci_cache"]):
+        args = parse_args()
+
+    assert args.cache is True
+    assert args.cache_dir == "ci_cache"
+
+
+def test_parse_batch_args_defaults():
+    with patch("sys.argv", ["main.py", "batch", "a.yaml", "configs/*.yaml"]):
+        args = parse_batch_args()
+
+    assert args.configs == ["a.yaml", "configs/*.yaml"]
+    assert args.output_dir == "output"
+    assert args.workers is None
+    assert args.jobs == 1
+    assert args.output_format == "xlsx"
+    assert args.only is None
+    assert args.cache is False
+
+
+def test_parse_batch_args_requires_configs():
+    with pytest.raises(SystemExit):
+        parse_batch_args([])
+
+    args = parse_batch_args(["a.yaml", "--workers", "3", "b.yaml", "--only", "cutsheet"])
+
+    assert args.configs == ["a.yaml", "b.yaml"]
+    assert args.workers == 3
+    assert args.only == "cutsheet"
+
+
+def test_parse_serve_args():
+    args = parse_serve_args([])
+
+    assert (
+        args.host,
+        args.port,
+        args.workers,
+        args.cache_entries,
+        args.max_body_bytes,
+    ) == ("127.0.0.1", 8765, None, 64, 16 * 2**20)
+
+    args = parse_serve_args(
+        [
+            "--port",
+            "0",
+            "--workers",
+            "2",
+            "--cache-entries",
+            "8",
+            "--max-body-bytes",
+            "1024",
+        ]
+    )
+
+    assert (args.port, args.workers, args.cache_entries, args.max_body_bytes) == (
+        0,
+        2,
+        8,
+        1024,
+    )
@@ -0,0 +1,139 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from topology_generator.batch import (
+    SUMMARY_FILENAME,
+    BatchOptions,
+    batch_output_dirs,
+    expand_config_paths,
+    run_batch,
+)
+from topology_generator.main import main
+
+
+@pytest.fixture
+def batch_configs(tmp_path, sample_config, multi_fabric_config):
+    config_dir = tmp_path / "configs"
+    config_dir.mkdir()
+    invalid_config = dict(sample_config)
+    invalid_config["links"] = [
+        {**sample_config["links"][0], "cable_bandwidth_gb": 0},
+        *sample_config["links"][1:],
+    ]
+    for name, config in (
+        ("grouped", sample_config),
+        ("invalid", invalid_config),
+        ("multi_fabric", multi_fabric_config),
+    ):
+        (config_dir / f"{name}.yaml").write_text(yaml.safe_dump(config), encoding="utf-8")
+    return config_dir
+
+
+def test_expand_config_paths_globs_in_order_without_duplicates(batch_configs):
+    config_paths = expand_config_paths(
+        [str(batch_configs / "multi_fabric.yaml"), str(batch_configs / "*.yaml")]
+    )
+
+    assert [path.name for path in config_paths] == [
+        "multi_fabric.yaml",
+        "grouped.yaml",
+        "invalid.yaml",
+    ]
+
+    with pytest.raises(ValueError, match="No config files match"):
+        expand_config_paths([str(batch_configs / "*.yml")])
+
+
+def test_batch_output_dirs_disambiguate_repeated_names(tmp_path):
+    output_dirs = batch_output_dirs(
+        [Path("a/fabric.yaml"), Path("b/fabric.yaml"), Path("b/other.yaml")],
+        tmp_path,
+    )
+
+    assert output_dirs == [tmp_path / "fabric", tmp_path / "fabric_2", tmp_path / "other"]
+
+
+def test_batch_output_dirs_skip_suffixes_taken_by_other_configs(tmp_path):
+    output_dirs = batch_output_dirs(
+        [
+            Path("a/x.yaml"),
+            Path("b/x.yaml"),
+            Path("c/x_2.yaml"),
+            Path("d/x.yaml"),
+            Path("e/x_2.yaml"),
+        ],
+        tmp_path,
+    )
+
+    assert output_dirs == [
+        tmp_path / "x",
+        tmp_path / "x_3",
+        tmp_path / "x_2",
+        tmp_path / "x_4",
+        tmp_path / "x_2_2",
+    ]
+    assert len(set(output_dirs)) == len(output_dirs)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_isolates_outputs_logs_and_failures(tmp_path, batch_configs, workers):
+    config_paths = expand_config_paths([str(batch_configs / "*.yaml")])
+
+    results = run_batch(
+        config_paths,
+        tmp_path / "outputs",
+        workers=workers,
+        options=BatchOptions(output_format="csv"),
+    )
+
+    assert [result.config_path for result in results] == config_paths
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert "cable_bandwidth_gb" in results[1].error
+    assert (tmp_path / "outputs" / "grouped" / "topology.png").exists()
+    assert (tmp_path / "outputs" / "multi_fabric" / "topology_oob.png").exists()
+    assert (tmp_path / "outputs" / "multi_fabric" / "port_mapping.csv").exists()
+    for result in results:
+        log_text = (result.output_dir / "network_topology.log").read_text(encoding="utf-8")
+        assert str(result.output_dir) in log_text
+        assert ("Error during execution" in log_text) is not result.succeeded
+
+
+def test_main_batch_prints_and_writes_summary(tmp_path, batch_configs, capsys):
+    output_dir = tmp_path / "outputs"
+    argv = [
+        "main.py",
+        "batch",
+        str(batch_configs / "grouped.yaml"),
+        str(batch_configs / "multi_fabric.yaml"),
+        "--output-dir",
+        str(output_dir),
+        "--only",
+        "cutsheet",
+        "--output-format",
+        "csv",
+        "--workers",
+        "1",
+    ]
+
+    with patch("sys.argv", argv):
+        main()
+
+    summary = json.loads((output_dir / SUMMARY_FILENAME).read_text(encoding="utf-8"))
+    assert "Batch finished: 2 of 2 configs succeeded" in capsys.readouterr().out
+    assert summary["succeeded"] == 2
+    assert summary["failed"] == 0
+    assert [Path(entry["output_dir"]).name for entry in summary["configs"]] == [
+        "grouped",
+        "multi_fabric",
+    ]
+    assert not (output_dir / "grouped" / "topology.png").exists()
+
+    with (
+        patch("sys.argv", [*argv, str(batch_configs / "invalid.yaml")]),
+        pytest.raises(SystemExit, match="1 of 3 configs failed"),
+    ):
+        main()
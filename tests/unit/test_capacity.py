@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import pytest
+
+from topology_generator.capacity import (
+    analyze_topology_capacity,
+    validate_topology_capacity,
+)
+from topology_generator.config_types import InvalidTopologyConfig
+from topology_generator.file_handler import load_config_from_file
+from topology_generator.expander import expand_topology
+from topology_generator.graph_metadata import link_bundle_attrs
+from topology_generator.topology_generator import generate_topology
+from topology_generator.validator import (
+    TopologyValidationError,
+    build_node_usage,
+    validate_expanded_topology,
+)
+
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "configs" / "examples"
+
+
+def _assert_matches_expanded_usage(config) -> None:
+    capacity = analyze_topology_capacity(config)
+    expanded = expand_topology(config)
+    usage = build_node_usage(expanded)
+
+    assert sum(layer.node_count for layer in capacity.layers) == expanded.num_nodes
+    assert sum(link.pair_count for link in capacity.links) == expanded.num_links
+
+    for expanded_layer in expanded.layers:
+        layer_capacity = capacity.layer(
+            expanded_layer.fabric_name,
+            expanded_layer.layer.name,
+        )
+        assert layer_capacity.node_count == expanded_layer.node_count
+        for node_index in range(expanded_layer.node_start, expanded_layer.node_stop):
+            assert usage[expanded.node_ids[node_index]] == layer_capacity.usage
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    [
+        "sample_config",
+        "sample_global_config",
+        "mixed_speed_config",
+        "two_pod_dense_config",
+        "multi_pod_dense_config",
+        "multi_fabric_config",
+    ],
+)
+def test_analyze_topology_capacity_matches_expanded_usage(request, fixture_name):
+    _assert_matches_expanded_usage(request.getfixturevalue(fixture_name))
+
+
+@pytest.mark.parametrize(
+    "example_path",
+    sorted(EXAMPLES_DIR.glob("*.yaml")),
+    ids=lambda path: path.name,
+)
+def test_analyze_topology_capacity_matches_examples(example_path):
+    _assert_matches_expanded_usage(load_config_from_file(example_path))
+
+
+@pytest.mark.parametrize(
+    "example_path",
+    sorted(EXAMPLES_DIR.glob("*.yaml")),
+    ids=lambda path: path.name,
+)
+def test_topology_capacity_totals_match_generated_graph(example_path):
+    config = load_config_from_file(example_path)
+    capacity = analyze_topology_capacity(config)
+    graph = generate_topology(config)
+
+    assert capacity.node_count == graph.number_of_nodes()
+    assert capacity.cable_count == sum(
+        bundle["num_cables"]
+        for _, _, attrs in graph.edges(data=True)
+        for bundle in link_bundle_attrs(attrs)
+    )
+
+
+def test_analyze_topology_capacity_reports_link_cable_counts(sample_config):
+    capacity = analyze_topology_capacity(sample_config)
+
+    assert [(link.link.from_layer, link.link.to_layer) for link in capacity.links] == [
+        ("compute", "leaf"),
+        ("leaf", "spine"),
+    ]
+    assert [link.pair_count for link in capacity.links] == [4, 4]
+    assert [link.cable_count for link in capacity.links] == [4, 4]
+
+
+def test_validate_topology_capacity_matches_expanded_errors(multi_fabric_config):
+    invalid_config = dict(multi_fabric_config)
+    invalid_fabrics = [dict(fabric) for fabric in multi_fabric_config["fabrics"]]
+    invalid_links = [dict(link) for link in invalid_fabrics[0]["links"]]
+    invalid_links[0]["cables_per_pair"] = 2
+    invalid_fabrics[0]["links"] = invalid_links
+    invalid_config["fabrics"] = invalid_fabrics
+
+    with pytest.raises(TopologyValidationError) as expanded_exc_info:
+        validate_expanded_topology(expand_topology(invalid_config))
+    with pytest.raises(TopologyValidationError) as capacity_exc_info:
+        validate_topology_capacity(invalid_config)
+
+    assert capacity_exc_info.value.errors == expanded_exc_info.value.errors
+
+
+def test_validate_topology_capacity_rejects_unsupported_bandwidth_while_parsing(
+    multi_fabric_config,
+):
+    multi_fabric_config["fabrics"][0]["links"][0]["cable_bandwidth_gb"] = 400
+
+    with pytest.raises(InvalidTopologyConfig, match="400 GB/s is not supported"):
+        validate_topology_capacity(multi_fabric_config)
+
+
+def test_validate_topology_capacity_returns_analysis_for_valid_config(sample_config):
+    capacity = validate_topology_capacity(sample_config)
+
+    leaf = capacity.layer(None, "leaf")
+    assert leaf.node_count == 2
+    assert leaf.scope_instance_count == 2
+    assert leaf.usage.required_lane_units_for_pool("fabric") == 4
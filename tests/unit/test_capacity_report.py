@@ -0,0 +1,42 @@
+from topology_generator.capacity import analyze_topology_capacity
+from topology_generator.capacity_report import format_capacity_report
+
+
+def test_format_capacity_report_lists_layers_links_and_utilization(sample_config):
+    report = format_capacity_report(analyze_topology_capacity(sample_config))
+
+    assert report == "\n".join(
+        [
+            "Topology check passed: 8 nodes, 8 cables",
+            "",
+            "Nodes per layer",
+            "  layer    placement  nodes",
+            "  compute  pod            4",
+            "  leaf     pod            2",
+            "  spine    global         2",
+            "",
+            "Cables per link",
+            "  link             port pool  GB/s  cables",
+            "  compute -> leaf  fabric      100       4",
+            "  leaf -> spine    fabric      100       4",
+            "",
+            "Cables per bandwidth class",
+            "  GB/s  cables  total GB/s",
+            "   100       8         800",
+            "",
+            "Lane utilization per node",
+            "  layer    port pool  lane units  utilization",
+            "  compute  fabric            1/1       100.0%",
+            "  leaf     fabric            4/4       100.0%",
+            "  spine    fabric            2/2       100.0%",
+        ]
+    )
+
+
+def test_format_capacity_report_groups_multi_fabric_rows_by_fabric(multi_fabric_config):
+    report = format_capacity_report(analyze_topology_capacity(multi_fabric_config))
+
+    assert report.startswith("Topology check passed: 6 nodes, 7 cables across 3 fabrics")
+    assert "  fabric    layer      placement  nodes" in report
+    assert "  oob       gpu_nodes -> mgmt  fabric       25       2" in report
+    assert "    25       2          50" in report
@@ -0,0 +1,81 @@
+import networkx as nx
+import pytest
+
+from topology_generator.compact_graph import CompactTopologyGraph
+from topology_generator.graph_metadata import has_canonical_edge_order
+from topology_generator.port_mapper import extract_port_mapping_rows
+from topology_generator.topology_generator import generate_topology, get_fabric_view
+
+
+def _assert_same_graph(expected, actual) -> None:
+    assert actual.graph == expected.graph
+    assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+    assert list(actual.edges(data=True)) == list(expected.edges(data=True))
+    for node_id in expected.nodes:
+        assert list(actual.neighbors(node_id)) == list(expected.neighbors(node_id))
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    [
+        "sample_config",
+        "sample_global_config",
+        "mixed_speed_config",
+        "two_pod_dense_config",
+        "multi_pod_dense_config",
+        "multi_fabric_config",
+    ],
+)
+def test_compact_backend_matches_networkx_graph(request, fixture_name):
+    config = request.getfixturevalue(fixture_name)
+
+    expected = generate_topology(config)
+    actual = generate_topology(config, graph_backend="compact")
+
+    assert isinstance(actual, CompactTopologyGraph)
+    _assert_same_graph(expected, actual)
+    assert extract_port_mapping_rows(actual) == extract_port_mapping_rows(expected)
+
+
+def test_compact_backend_fabric_view_matches_networkx_view(multi_fabric_config):
+    expected = generate_topology(multi_fabric_config)
+    actual = generate_topology(multi_fabric_config, graph_backend="compact")
+
+    for fabric_name in expected.graph["fabric_names"]:
+        _assert_same_graph(
+            get_fabric_view(expected, fabric_name),
+            get_fabric_view(actual, fabric_name),
+        )
+        assert has_canonical_edge_order(get_fabric_view(actual, fabric_name))
+
+    with pytest.raises(KeyError, match="Unknown fabric"):
+        get_fabric_view(actual, "missing")
+
+
+def test_compact_backend_supports_item_lookup(sample_config):
+    graph = generate_topology(sample_config, graph_backend="compact")
+
+    assert len(graph) == 8
+    assert graph.number_of_edges() == 8
+    assert "pod_1_leaf_1" in graph
+    assert graph.nodes["pod_1_leaf_1"]["layer_name"] == "leaf"
+    assert graph.has_edge("spine_1", "pod_1_leaf_1")
+    assert not graph.has_edge("pod_1_compute_1", "spine_1")
+    assert graph.edges["pod_1_leaf_1", "spine_1"]["link_bundles"][0]["source_ports"] == [3]
+
+    with pytest.raises(KeyError):
+        graph.edges["pod_1_compute_1", "spine_1"]
+
+
+def test_compact_backend_converts_to_networkx(sample_config):
+    compact_graph = generate_topology(sample_config, graph_backend="compact")
+
+    converted = compact_graph.to_networkx()
+
+    assert isinstance(converted, nx.Graph)
+    _assert_same_graph(generate_topology(sample_config), converted)
+
+
+def test_generate_topology_rejects_unknown_graph_backend(sample_config):
+    with pytest.raises(ValueError, match="Unknown graph backend"):
+        generate_topology(sample_config, graph_backend="igraph")
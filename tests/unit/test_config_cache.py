@@ -0,0 +1,160 @@
+import os
+
+import pytest
+import yaml
+
+from topology_generator import config_cache, file_handler
+from topology_generator.config_cache import ConfigCache, default_cache_dir
+from topology_generator.config_types import TopologyConfig
+from topology_generator.file_handler import load_config_from_file
+
+
+def test_config_cache_is_keyed_by_file_contents(tmp_path, sample_config):
+    cache = ConfigCache(tmp_path / "cache")
+    config = TopologyConfig.from_mapping(sample_config)
+    content = yaml.safe_dump(sample_config).encode()
+
+    assert cache.get_config(content) is None
+    cache.put_config(content, config)
+
+    assert cache.get_config(content) == config
+    assert cache.get_config(content + b"\n# edited\n") is None
+    assert cache.key_for(content) != cache.key_for(content + b" ")
+
+
+def test_load_config_from_file_skips_parsing_on_cache_hit(
+    tmp_path,
+    sample_config_file,
+    monkeypatch,
+):
+    cache = ConfigCache(tmp_path / "cache")
+    config = load_config_from_file(sample_config_file, cache)
+
+    def fail_safe_load(_content):
+        raise AssertionError("cached config was parsed again")
+
+    monkeypatch.setattr(file_handler.yaml, "safe_load", fail_safe_load)
+
+    assert load_config_from_file(sample_config_file, cache) == config
+
+
+def test_config_cache_expand_reuses_cached_expansion(
+    tmp_path,
+    sample_config_file,
+    monkeypatch,
+):
+    cache = ConfigCache(tmp_path / "cache")
+    config = load_config_from_file(sample_config_file, cache)
+    expanded = cache.expand(sample_config_file, config)
+
+    def fail_expand(_config):
+        raise AssertionError("cached expansion was recomputed")
+
+    monkeypatch.setattr(config_cache, "expand_topology", fail_expand)
+    cached = cache.expand(sample_config_file, config)
+
+    assert cached is not expanded
+    assert cached.node_ids == expanded.node_ids
+    assert cached.num_links == expanded.num_links
+
+
+def test_config_cache_expand_skips_caching_for_changed_files(
+    tmp_path,
+    sample_config,
+    sample_config_file,
+):
+    cache = ConfigCache(tmp_path / "cache")
+    config = load_config_from_file(sample_config_file, cache)
+    changed_config = dict(sample_config, groups=[{"name": "pod", "count": 3}])
+    sample_config_file.write_text(yaml.safe_dump(changed_config), encoding="utf-8")
+
+    expanded = cache.expand(sample_config_file, config)
+
+    assert expanded.num_nodes == 8
+    assert not list((tmp_path / "cache").glob("*.expanded.pickle"))
+
+
+def test_config_cache_evicts_least_recently_used_entries(tmp_path, sample_config):
+    config = TopologyConfig.from_mapping(sample_config)
+    contents = [f"# config {index}\n".encode() for index in range(3)]
+    cache = ConfigCache(tmp_path / "cache")
+    cache.put_config(contents[0], config)
+    entry_size = next((tmp_path / "cache").iterdir()).stat().st_size
+    cache.max_bytes = 2 * entry_size
+
+    cache.put_config(contents[1], config)
+    for age, content in enumerate(contents[:2]):
+        entry_path = cache.cache_dir / f"{cache.key_for(content)}.config.pickle"
+        os.utime(entry_path, ns=(age, age))
+    assert cache.get_config(contents[0]) == config
+    cache.put_config(contents[2], config)
+
+    assert cache.get_config(contents[0]) == config
+    assert cache.get_config(contents[1]) is None
+    assert cache.get_config(contents[2]) == config
+
+
+def test_config_cache_discards_unreadable_entries(tmp_path):
+    cache = ConfigCache(tmp_path / "cache")
+    content = b"layers: []\n"
+    entry_path = cache.cache_dir / f"{cache.key_for(content)}.config.pickle"
+    cache.cache_dir.mkdir()
+    entry_path.write_bytes(b"not a pickle")
+
+    assert cache.get_config(content) is None
+    assert not entry_path.exists()
+
+
+def test_config_cache_streams_chunked_entries(tmp_path):
+    cache = ConfigCache(tmp_path / "cache")
+    key = cache.key_for(b"fabric")
+
+    cache.put_chunks(key, ".rows.pickle", 3, iter([[1, 2], [3]]))
+    header, chunks = cache.get_chunks(key, ".rows.pickle", int)
+
+    assert header == 3
+    assert list(chunks) == [[1, 2], [3]]
+    assert cache.get_chunks(cache.key_for(b"other"), ".rows.pickle", int) is None
+
+
+def test_config_cache_discards_chunked_entries_with_wrong_header(tmp_path):
+    cache = ConfigCache(tmp_path / "cache")
+    key = cache.key_for(b"fabric")
+    cache.put_chunks(key, ".rows.pickle", "three", iter([[1, 2, 3]]))
+
+    assert cache.get_chunks(key, ".rows.pickle", int) is None
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def test_config_cache_keys_change_with_package_sources(tmp_path, monkeypatch):
+    cache = ConfigCache(tmp_path)
+    key = cache.key_for(b"layers: []\n")
+
+    monkeypatch.setattr(config_cache, "package_source_digest", lambda: "edited")
+
+    assert cache.key_for(b"layers: []\n") != key
+
+
+def test_default_cache_dir_honours_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOPOLOGY_GENERATOR_CACHE_DIR", str(tmp_path / "custom"))
+    assert default_cache_dir() == tmp_path / "custom"
+
+    monkeypatch.delenv("TOPOLOGY_GENERATOR_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert default_cache_dir() == tmp_path / "xdg" / "topology_generator"
+
+
+def test_config_cache_rejects_negative_size_limit(tmp_path):
+    with pytest.raises(ValueError, match="max_bytes must not be negative"):
+        ConfigCache(tmp_path, max_bytes=-1)
+
+
+def test_config_cache_write_failures_do_not_fail_loading(tmp_path, sample_config_file):
+    blocked_dir = tmp_path / "not_a_directory"
+    blocked_dir.write_text("", encoding="utf-8")
+    cache = ConfigCache(blocked_dir)
+
+    config = load_config_from_file(sample_config_file, cache)
+
+    assert config == load_config_from_file(sample_config_file)
+    assert cache.get_config(sample_config_file.read_bytes()) is None
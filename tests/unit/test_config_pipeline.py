@@ -1,5 +1,6 @@
 import pytest
 
+from topology_generator.config_identifiers import normalize_identifier
 from topology_generator.config_types import InvalidTopologyConfig, TopologyConfig
 
 
@@ -362,7 +363,31 @@ def test_topology_config_rejects_expanded_node_id_collisions():
         ],
     }
 
-    with pytest.raises(InvalidTopologyConfig, match="Expanded node IDs must be unique"):
+    with pytest.raises(InvalidTopologyConfig, match="Expanded node IDs must be unique") as exc_info:
+        TopologyConfig.from_mapping(invalid_config)
+
+    assert str(exc_info.value).endswith(
+        "layers 'compute' and 'pod_1_compute' both produce 'pod_1_compute_1'."
+    )
+
+
+def test_topology_config_rejects_fabric_qualified_node_id_collisions(
+    multi_fabric_config,
+):
+    invalid_config = dict(multi_fabric_config)
+    invalid_fabrics = [dict(fabric) for fabric in multi_fabric_config["fabrics"]]
+    invalid_layers = [dict(layer) for layer in invalid_fabrics[0]["layers"]]
+    invalid_layers[1]["name"] = "pod_1_leaf"
+    invalid_links = [dict(link) for link in invalid_fabrics[0]["links"]]
+    invalid_links[1]["to"] = "pod_1_leaf"
+    invalid_fabrics[0]["layers"] = invalid_layers
+    invalid_fabrics[0]["links"] = invalid_links
+    invalid_config["fabrics"] = invalid_fabrics
+
+    with pytest.raises(
+        InvalidTopologyConfig,
+        match="layers 'leaf' and 'pod_1_leaf' both produce 'backend__pod_1_leaf_1'",
+    ):
         TopologyConfig.from_mapping(invalid_config)
 
 
@@ -379,6 +404,26 @@ def test_topology_config_accepts_multi_fabric_gpu_nodes_schema(multi_fabric_conf
     assert config.fabric("oob").gpu_nodes_placement == "rack"
 
 
+def test_topology_config_precomputes_scope_index(multi_fabric_config):
+    config = TopologyConfig.from_mapping(multi_fabric_config)
+
+    rack_chain = config.scope_index.chain("rack")
+    assert rack_chain.scope_names == ("pod", "rack")
+    assert rack_chain.group_sizes == (2, 1)
+    assert rack_chain.instance_count == 2
+    assert rack_chain.scope_labels == (
+        ("pod_1", "pod_1_rack_1"),
+        ("pod_1", "pod_1_rack_2"),
+    )
+    assert config.scope_index.chain("RACK") is rack_chain
+    assert config.scope_indexes_for_ordinal("rack", 2) == (1, 2)
+    assert config.scope_key_for_ordinal("rack", 2) == (("pod", 1), ("rack", 2))
+    assert config.group_label_for_ordinal("pod", 2) == "pod_1"
+
+    with pytest.raises(KeyError):
+        config.scope_index.chain("row")
+
+
 def test_topology_config_rejects_mismatched_gpu_nodes_fabric_names(multi_fabric_config):
     invalid_config = dict(multi_fabric_config)
     invalid_gpu_nodes = dict(multi_fabric_config["gpu_nodes"])
@@ -447,3 +492,14 @@ def test_topology_config_accepts_normalized_fabric_port_pool_name_matches():
 
     assert parsed.gpu_nodes is not None
     assert parsed.gpu_nodes.port_pools_for_fabric("front-end")[0].total_lane_units == 1
+
+
+def test_normalize_identifier_memoizes_repeated_names():
+    normalize_identifier.cache_clear()
+
+    assert normalize_identifier(" Front-End  Fabric ") == "front_end_fabric"
+    assert normalize_identifier(" Front-End  Fabric ") == "front_end_fabric"
+
+    cache_info = normalize_identifier.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.maxsize is not None
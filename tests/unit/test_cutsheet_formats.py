@@ -0,0 +1,126 @@
+import sys
+
+import pandas as pd
+import pytest
+
+from topology_generator.cutsheet_formats import (
+    port_mapping_filename,
+    write_port_mapping,
+    write_port_mapping_blocks,
+    write_port_mapping_parquet,
+)
+from topology_generator.port_mapper import (
+    MULTI_FABRIC_PORT_MAPPING_COLUMNS,
+    create_port_mapping,
+    fabric_row_blocks,
+)
+from topology_generator.topology_generator import generate_topology
+
+
+@pytest.mark.parametrize("output_format", ["csv", "csv.gz"])
+def test_write_port_mapping_csv_matches_dataframe(
+    tmp_path,
+    multi_fabric_config,
+    output_format,
+):
+    graph = generate_topology(multi_fabric_config)
+
+    row_count = write_port_mapping(graph, tmp_path, output_format)
+
+    loaded = pd.read_csv(tmp_path / f"port_mapping.{output_format}")
+    expected = create_port_mapping(graph)
+    assert row_count == 7
+    assert list(loaded.columns) == MULTI_FABRIC_PORT_MAPPING_COLUMNS
+    pd.testing.assert_frame_equal(
+        loaded.drop(columns=["source_serial_number", "target_serial_number"]).astype(object),
+        expected.drop(columns=["source_serial_number", "target_serial_number"]).astype(object),
+    )
+    assert loaded["source_serial_number"].isna().all()
+
+
+@pytest.mark.parametrize("output_format", ["csv", "csv.gz"])
+def test_write_port_mapping_csv_parts_merge_in_fabric_order(
+    tmp_path,
+    multi_fabric_config,
+    output_format,
+):
+    graph = generate_topology(multi_fabric_config)
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+
+    write_port_mapping(graph, serial_dir, output_format, jobs=1)
+    row_count = write_port_mapping(graph, parallel_dir, output_format, jobs=2)
+
+    filename = f"port_mapping.{output_format}"
+    serial = pd.read_csv(serial_dir / filename)
+    merged = pd.read_csv(parallel_dir / filename)
+    assert row_count == 7
+    assert [path.name for path in parallel_dir.iterdir()] == [filename]
+    assert list(merged["cable_number"]) == list(range(1, 8))
+    pd.testing.assert_frame_equal(merged, serial)
+
+
+def test_write_port_mapping_csv_parts_use_fabric_output_names(
+    tmp_path,
+    multi_fabric_config,
+):
+    multi_fabric_config["fabrics"][0]["name"] = "Back/End"
+    pools = multi_fabric_config["gpu_nodes"]["fabric_port_pools"]
+    pools["Back/End"] = pools.pop("backend")
+    graph = generate_topology(multi_fabric_config)
+
+    row_count = write_port_mapping(graph, tmp_path, "csv", jobs=2)
+
+    merged = pd.read_csv(tmp_path / "port_mapping.csv")
+    assert row_count == 7
+    assert [path.name for path in tmp_path.iterdir()] == ["port_mapping.csv"]
+    assert list(merged["fabric"].unique()) == ["Back/End", "frontend", "oob"]
+
+
+@pytest.mark.parametrize("output_format", ["csv", "csv.gz"])
+def test_write_port_mapping_blocks_matches_graph_output(
+    tmp_path,
+    multi_fabric_config,
+    output_format,
+):
+    graph = generate_topology(multi_fabric_config)
+    blocks = fabric_row_blocks(graph)
+
+    write_port_mapping(graph, tmp_path / "graph", output_format, jobs=1)
+    row_count = write_port_mapping_blocks(blocks, tmp_path / "blocks", output_format)
+
+    filename = f"port_mapping.{output_format}"
+    assert row_count == 7
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "blocks" / filename),
+        pd.read_csv(tmp_path / "graph" / filename),
+    )
+
+
+def test_write_port_mapping_parquet_round_trips(tmp_path, sample_config):
+    pytest.importorskip("pyarrow")
+    graph = generate_topology(sample_config)
+
+    row_count = write_port_mapping(graph, tmp_path, "parquet")
+
+    loaded = pd.read_parquet(tmp_path / "port_mapping.parquet")
+    assert row_count == 8
+    assert list(loaded["cable_number"]) == list(range(1, 9))
+    assert loaded["source_serial_number"].isna().all()
+
+
+def test_write_port_mapping_parquet_requires_pyarrow(
+    tmp_path,
+    sample_config,
+    monkeypatch,
+):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match="Parquet output requires pyarrow"):
+        write_port_mapping_parquet(generate_topology(sample_config), tmp_path)
+
+
+def test_port_mapping_filename_rejects_unknown_formats():
+    assert port_mapping_filename("csv.gz") == "port_mapping.csv.gz"
+    with pytest.raises(ValueError, match="Unknown output format 'json'"):
+        port_mapping_filename("json")
@@ -1,7 +1,15 @@
+from dataclasses import replace
+
 import pytest
 
+from topology_generator.config_identifiers import build_grouped_node_id
 from topology_generator.config_types import InvalidTopologyConfig
-from topology_generator.expander import expand_topology
+from topology_generator.expander import (
+    ExpandedLinkBlock,
+    expand_topology,
+    iter_link_bundles,
+)
+from topology_generator.graph_metadata import node_sort_key
 
 
 def _pool(
@@ -223,3 +231,136 @@ def test_expand_topology_pairs_child_scope_nodes_only_with_containing_ancestor_s
     assert ("oob__pod_1_rack_1_leaf_1", "oob__pod_1_spine_1") in links
     assert ("oob__pod_1_rack_2_leaf_1", "oob__pod_1_spine_1") in links
     assert ("oob__pod_1_rack_1_leaf_1", "oob__pod_2_spine_1") not in links
+
+
+def test_expand_topology_stores_nodes_and_links_as_integer_columns(sample_config):
+    expanded = expand_topology(sample_config)
+
+    assert expanded.num_nodes == 8
+    assert expanded.num_links == 8
+    assert [layer.layer.name for layer in expanded.layers] == ["compute", "leaf", "spine"]
+    assert expanded.node_layer_ids.tolist() == [0, 0, 0, 0, 1, 1, 2, 2]
+    assert expanded.node_scope_ids.tolist() == [0, 0, 1, 1, 2, 3, -1, -1]
+    assert [scope.group_label for scope in expanded.scopes] == [
+        "pod_1",
+        "pod_2",
+        "pod_1",
+        "pod_2",
+    ]
+    assert expanded.pool_names == ("fabric",)
+    assert expanded.link_source_indexes.tolist() == [0, 1, 2, 3, 4, 4, 5, 5]
+    assert expanded.link_target_indexes.tolist() == [4, 4, 5, 5, 6, 7, 6, 7]
+    assert expanded.link_spec_ids.tolist() == [0, 0, 0, 0, 1, 1, 1, 1]
+    assert expanded.link_pool_ids.tolist() == [0] * 8
+    assert expanded.link_num_cables.tolist() == [1] * 8
+
+
+def test_expand_topology_dataclass_views_match_columns(multi_fabric_config):
+    expanded = expand_topology(multi_fabric_config)
+
+    assert "nodes" not in vars(expanded)
+    assert "links" not in vars(expanded)
+    assert [node.node_id for node in expanded.nodes] == list(expanded.node_ids)
+    assert expanded.nodes[0] == expanded.node(0)
+    assert [
+        (link.source_node_id, link.target_node_id) for link in expanded.links
+    ] == [
+        (expanded.node_ids[source], expanded.node_ids[target])
+        for source, target in zip(
+            expanded.link_source_indexes.tolist(),
+            expanded.link_target_indexes.tolist(),
+        )
+    ]
+
+
+def test_iter_link_bundles_streams_bundles_in_expansion_order(multi_fabric_config):
+    bundles = iter_link_bundles(multi_fabric_config)
+
+    first_bundle = next(bundles)
+    remaining_bundles = list(bundles)
+
+    assert first_bundle.fabric_name == "backend"
+    assert [first_bundle, *remaining_bundles] == list(
+        expand_topology(multi_fabric_config).links
+    )
+    assert [bundle.fabric_name for bundle in remaining_bundles] == [
+        "backend",
+        "backend",
+        "frontend",
+        "frontend",
+        "oob",
+        "oob",
+    ]
+
+
+def test_expand_topology_keeps_one_link_block_per_scope(sample_config):
+    expanded = expand_topology(sample_config)
+
+    assert [
+        (
+            block.spec_id,
+            (block.source_start, block.source_stop),
+            (block.target_start, block.target_stop),
+        )
+        for block in expanded.link_blocks
+    ] == [
+        (0, (0, 2), (4, 5)),
+        (0, (2, 4), (5, 6)),
+        (1, (4, 5), (6, 8)),
+        (1, (5, 6), (6, 8)),
+    ]
+    assert "link_source_indexes" not in vars(expanded)
+
+
+@pytest.mark.parametrize(
+    "config_fixture",
+    ["sample_config", "sample_global_config", "multi_pod_dense_config", "multi_fabric_config"],
+)
+def test_expand_topology_emits_nodes_in_cut_sheet_order(config_fixture, request):
+    expanded = expand_topology(request.getfixturevalue(config_fixture))
+
+    for fabric_name in dict.fromkeys(node.fabric_name for node in expanded.nodes):
+        fabric_nodes = [node for node in expanded.nodes if node.fabric_name == fabric_name]
+        sort_keys = [
+            node_sort_key(
+                node.node_id,
+                {
+                    "layer_index": node.layer_index,
+                    "scope_indexes": node.scope_indexes,
+                    "node_ordinal": node.node_ordinal,
+                },
+            )
+            for node in fabric_nodes
+        ]
+        assert sort_keys == sorted(sort_keys)
+    assert expanded.has_canonical_link_order
+    assert expanded.node_sort_ranks.tolist() == list(range(expanded.num_nodes))
+
+
+def test_has_canonical_link_order_detects_out_of_order_blocks(sample_config):
+    expanded = expand_topology(sample_config)
+    compute_to_leaf, *_ = expanded.link_blocks
+
+    reordered = replace(
+        expanded,
+        link_blocks=(
+            ExpandedLinkBlock(1, 0, 2, 6, 8),
+            compute_to_leaf,
+        ),
+    )
+
+    assert not reordered.has_canonical_link_order
+
+
+def test_expand_topology_interns_generated_node_ids(sample_config, multi_fabric_config):
+    expanded = expand_topology(sample_config)
+    rebuilt_node_id = build_grouped_node_id("pod", 1, "leaf", 1)
+
+    assert expanded.node_ids[4] == "pod_1_leaf_1"
+    assert expanded.node_ids[4] is rebuilt_node_id
+
+    first = expand_topology(multi_fabric_config)
+    second = expand_topology(multi_fabric_config)
+    assert all(
+        left is right for left, right in zip(first.node_ids, second.node_ids, strict=True)
+    )
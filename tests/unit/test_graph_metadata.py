@@ -1,10 +1,12 @@
 import networkx as nx
 
 from topology_generator.graph_metadata import (
+    PortRange,
     fabric_names,
     flatten_node_attrs_for_fabric,
     is_multi_fabric_graph,
     node_sort_key,
+    sort_node_items,
 )
 
 
@@ -64,3 +66,38 @@ def test_node_sort_key_matches_port_mapping_natural_order():
         "pod_10_gpu_nodes_1",
         pod_10,
     )
+
+
+def test_sort_node_items_prefers_integer_sort_ranks():
+    ranked_items = [
+        ("spine_1", {"layer_index": 1, "sort_rank": 2}),
+        ("pod_10_leaf_1", {"layer_index": 0, "sort_rank": 1}),
+        ("pod_2_leaf_1", {"layer_index": 0, "sort_rank": 0}),
+    ]
+    unranked_items = [(node_id, {"layer_index": attrs["layer_index"]}) for node_id, attrs in ranked_items]
+
+    assert [node_id for node_id, _ in sort_node_items(ranked_items)] == [
+        "pod_2_leaf_1",
+        "pod_10_leaf_1",
+        "spine_1",
+    ]
+    assert [node_id for node_id, _ in sort_node_items(unranked_items)] == [
+        "pod_2_leaf_1",
+        "pod_10_leaf_1",
+        "spine_1",
+    ]
+
+
+def test_port_range_behaves_like_the_expanded_port_list():
+    ports = PortRange.from_range(range(1, 7, 2), offset=8)
+
+    assert (ports.start, ports.stride, ports.length) == (9, 2, 3)
+    assert ports == [9, 11, 13]
+    assert [9, 11, 13] == ports
+    assert ports != [9, 11]
+    assert len(ports) == 3
+    assert ports[-1] == 13
+    assert ports[1:] == [11, 13]
+    assert ports.count(11) == 1
+    assert ports.index(13) == 2
+    assert ports.to_list() == [9, 11, 13]
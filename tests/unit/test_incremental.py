@@ -0,0 +1,224 @@
+import filecmp
+
+import pytest
+
+from topology_generator import incremental
+from topology_generator.config_cache import ConfigCache
+from topology_generator.config_types import TopologyConfig
+from topology_generator.incremental import (
+    fabric_fingerprints,
+    select_fabrics,
+    write_outputs_incremental,
+)
+from topology_generator.pipeline import write_outputs
+from topology_generator.topology_generator import generate_topology
+
+
+OUTPUT_FILES = [
+    "port_mapping.csv",
+    "topology_backend.png",
+    "topology_frontend.png",
+    "topology_oob.png",
+]
+
+
+def _with_more_mgmt_ports(config_dict):
+    edited = dict(config_dict)
+    fabrics = [dict(fabric) for fabric in config_dict["fabrics"]]
+    mgmt_layer = dict(fabrics[2]["layers"][0])
+    mgmt_layer["port_pools"] = [
+        {**mgmt_layer["port_pools"][0], "total_lane_units": 3},
+    ]
+    fabrics[2]["layers"] = [mgmt_layer]
+    edited["fabrics"] = fabrics
+    return edited
+
+
+def _with_fabric_renamed(config_dict, fabric_name):
+    edited = dict(config_dict)
+    fabrics = [dict(fabric) for fabric in config_dict["fabrics"]]
+    fabrics[2]["name"] = fabric_name
+    edited["fabrics"] = fabrics
+    return edited
+
+
+def _assert_same_outputs(actual_dir, expected_dir):
+    for filename in OUTPUT_FILES:
+        assert filecmp.cmp(actual_dir / filename, expected_dir / filename, shallow=False)
+
+
+def test_fabric_fingerprints_only_change_for_edited_fabric(multi_fabric_config):
+    original = fabric_fingerprints(TopologyConfig.from_mapping(multi_fabric_config))
+    edited = fabric_fingerprints(
+        TopologyConfig.from_mapping(_with_more_mgmt_ports(multi_fabric_config))
+    )
+
+    assert list(original) == ["backend", "frontend", "oob"]
+    assert edited["backend"] == original["backend"]
+    assert edited["frontend"] == original["frontend"]
+    assert edited["oob"] != original["oob"]
+
+
+def test_select_fabrics_keeps_fabric_outputs(multi_fabric_config):
+    config = TopologyConfig.from_mapping(multi_fabric_config)
+    full_graph = generate_topology(config)
+
+    graph = generate_topology(select_fabrics(config, ("frontend",)))
+
+    assert graph.graph["fabric_names"] == ("frontend",)
+    assert sorted(graph.edges(data="fabric")) == sorted(
+        edge for edge in full_graph.edges(data="fabric") if edge[2] == "frontend"
+    )
+
+
+def test_write_outputs_incremental_reuses_cached_fabrics(
+    tmp_path,
+    multi_fabric_config,
+    monkeypatch,
+    caplog,
+):
+    config = TopologyConfig.from_mapping(multi_fabric_config)
+    cache = ConfigCache(tmp_path / "cache")
+    (tmp_path / "full").mkdir()
+    write_outputs(generate_topology(config), tmp_path / "full", "csv", jobs=1)
+
+    cold = write_outputs_incremental(config, tmp_path / "cold", cache, "csv", jobs=1)
+
+    def fail_generate_topology(*args, **kwargs):
+        raise AssertionError("cached fabrics must not be rebuilt")
+
+    monkeypatch.setattr(
+        "topology_generator.topology_generator.generate_topology",
+        fail_generate_topology,
+    )
+    with caplog.at_level("INFO", logger=incremental.__name__):
+        warm = write_outputs_incremental(config, tmp_path / "warm", cache, "csv", jobs=1)
+
+    assert cold.row_count == warm.row_count == 7
+    assert "Reusing cached outputs for 3 of 3 fabrics; regenerating: none" in caplog.text
+    _assert_same_outputs(tmp_path / "cold", tmp_path / "full")
+    _assert_same_outputs(tmp_path / "warm", tmp_path / "full")
+
+
+def test_select_fabrics_matches_port_pools_by_normalized_name(multi_fabric_config):
+    config = TopologyConfig.from_mapping(_with_fabric_renamed(multi_fabric_config, "OOB"))
+
+    selected = select_fabrics(config, ("OOB",))
+
+    assert [fabric.name for fabric in selected.fabrics] == ["OOB"]
+    assert [pools.name for pools in selected.gpu_nodes.fabric_port_pools] == ["oob"]
+
+
+def test_write_outputs_incremental_with_non_canonical_fabric_name(
+    tmp_path,
+    multi_fabric_config,
+):
+    config = TopologyConfig.from_mapping(_with_fabric_renamed(multi_fabric_config, "OOB"))
+    (tmp_path / "full").mkdir()
+    write_outputs(generate_topology(config), tmp_path / "full", "csv", jobs=1)
+
+    timings = write_outputs_incremental(
+        config,
+        tmp_path / "outputs",
+        ConfigCache(tmp_path / "cache"),
+        "csv",
+        jobs=1,
+    )
+
+    assert timings.row_count == 7
+    _assert_same_outputs(tmp_path / "outputs", tmp_path / "full")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_write_outputs_incremental_rebuilds_only_edited_fabric(
+    tmp_path,
+    multi_fabric_config,
+    caplog,
+    jobs,
+):
+    cache = ConfigCache(tmp_path / "cache")
+    write_outputs_incremental(
+        TopologyConfig.from_mapping(multi_fabric_config),
+        tmp_path / "before",
+        cache,
+        "csv",
+        jobs=jobs,
+    )
+    edited = TopologyConfig.from_mapping(_with_more_mgmt_ports(multi_fabric_config))
+    (tmp_path / "full").mkdir()
+    write_outputs(generate_topology(edited), tmp_path / "full", "csv", jobs=1)
+
+    with caplog.at_level("INFO", logger=incremental.__name__):
+        timings = write_outputs_incremental(
+            edited,
+            tmp_path / "after",
+            cache,
+            "csv",
+            jobs=jobs,
+        )
+
+    assert "Reusing cached outputs for 2 of 3 fabrics; regenerating: oob" in caplog.text
+    assert timings.row_count == 7
+    _assert_same_outputs(tmp_path / "after", tmp_path / "full")
+
+
+def test_write_outputs_incremental_streams_rows_in_chunks(
+    tmp_path,
+    multi_fabric_config,
+    monkeypatch,
+):
+    config = TopologyConfig.from_mapping(multi_fabric_config)
+    cache = ConfigCache(tmp_path / "cache")
+    (tmp_path / "full").mkdir()
+    write_outputs(generate_topology(config), tmp_path / "full", "csv", jobs=1)
+    monkeypatch.setattr(incremental, "ROW_CHUNK_ROWS", 2)
+
+    write_outputs_incremental(config, tmp_path / "cold", cache, "csv", jobs=1)
+    warm = write_outputs_incremental(config, tmp_path / "warm", cache, "csv", jobs=1)
+
+    key = fabric_fingerprints(config)["backend"]
+    row_count, chunks = cache.get_chunks(
+        cache.key_for(key.encode()), incremental.ROWS_SUFFIX, int
+    )
+    assert row_count == 3
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert warm.row_count == 7
+    _assert_same_outputs(tmp_path / "warm", tmp_path / "full")
+
+
+def test_write_outputs_incremental_writes_outputs_when_cache_is_unwritable(
+    tmp_path,
+    multi_fabric_config,
+):
+    config = TopologyConfig.from_mapping(multi_fabric_config)
+    blocked_dir = tmp_path / "not_a_directory"
+    blocked_dir.write_text("", encoding="utf-8")
+    (tmp_path / "full").mkdir()
+    write_outputs(generate_topology(config), tmp_path / "full", "csv", jobs=1)
+
+    timings = write_outputs_incremental(
+        config,
+        tmp_path / "outputs",
+        ConfigCache(blocked_dir),
+        "csv",
+        jobs=1,
+    )
+
+    assert timings.row_count == 7
+    _assert_same_outputs(tmp_path / "outputs", tmp_path / "full")
+
+
+def test_write_outputs_incremental_skips_unrequested_stages(tmp_path, multi_fabric_config):
+    config = TopologyConfig.from_mapping(multi_fabric_config)
+
+    timings = write_outputs_incremental(
+        config,
+        tmp_path / "outputs",
+        ConfigCache(tmp_path / "cache"),
+        "csv",
+        jobs=1,
+        render=False,
+    )
+
+    assert timings.render_seconds is None
+    assert [path.name for path in (tmp_path / "outputs").iterdir()] == ["port_mapping.csv"]
@@ -29,3 +29,16 @@ def test_setup_logging_replaces_existing_handlers(tmp_path):
     assert first_logger is second_logger
     assert len(second_logger.handlers) == 2
     assert "second run" in log_contents
+
+
+def test_setup_logging_can_skip_console_output(tmp_path, capsys):
+    logger = setup_logging(tmp_path / "logs", console=False)
+    logger.info("file only")
+    for handler in logger.handlers:
+        handler.flush()
+
+    assert len(logger.handlers) == 1
+    assert "file only" not in capsys.readouterr().out
+    assert "file only" in (tmp_path / "logs" / "network_topology.log").read_text(
+        encoding="utf-8"
+    )
@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 import pandas as pd
+import pytest
 import yaml
 
 from topology_generator.main import main
@@ -43,6 +44,180 @@ def test_main_creates_outputs(tmp_path, sample_config_file):
     ]
 
 
+def test_main_supports_compact_graph_backend(tmp_path, sample_config_file):
+    output_dir = tmp_path / "outputs"
+
+    with patch(
+        "sys.argv",
+        [
+            "main.py",
+            "--config",
+            str(sample_config_file),
+            "--output-dir",
+            str(output_dir),
+            "--graph-backend",
+            "compact",
+        ],
+    ):
+        main()
+
+    assert (output_dir / "topology.png").exists()
+    assert len(pd.read_excel(output_dir / "port_mapping.xlsx")) == 8
+
+
+def test_main_writes_selected_output_format(tmp_path, sample_config_file):
+    output_dir = tmp_path / "outputs"
+
+    with patch(
+        "sys.argv",
+        [
+            "main.py",
+            "--config",
+            str(sample_config_file),
+            "--output-dir",
+            str(output_dir),
+            "--output-format",
+            "csv.gz",
+        ],
+    ):
+        main()
+
+    assert not (output_dir / "port_mapping.xlsx").exists()
+    assert len(pd.read_csv(output_dir / "port_mapping.csv.gz")) == 8
+
+
+def test_main_only_validate_writes_no_outputs(tmp_path, sample_config_file):
+    output_dir = tmp_path / "outputs"
+
+    with patch(
+        "sys.argv",
+        [
+            "main.py",
+            "--config",
+            str(sample_config_file),
+            "--output-dir",
+            str(output_dir),
+            "--only",
+            "validate",
+        ],
+    ):
+        main()
+
+    assert [path.name for path in output_dir.iterdir()] == ["network_topology.log"]
+    log_contents = (output_dir / "network_topology.log").read_text(encoding="utf-8")
+    assert "Configuration is valid" in log_contents
+
+
+def test_main_only_cutsheet_skips_rendering(tmp_path, sample_config_file):
+    output_dir = tmp_path / "outputs"
+
+    with patch(
+        "sys.argv",
+        [
+            "main.py",
+            "--config",
+            str(sample_config_file),
+            "--output-dir",
+            str(output_dir),
+            "--only",
+            "cutsheet",
+        ],
+    ):
+        main()
+
+    assert not (output_dir / "topology.png").exists()
+    assert len(pd.read_excel(output_dir / "port_mapping.xlsx")) == 8
+
+
+def test_main_check_prints_statistics_without_outputs(
+    tmp_path,
+    sample_config_file,
+    capsys,
+):
+    output_dir = tmp_path / "outputs"
+
+    with patch(
+        "sys.argv",
+        [
+            "main.py",
+            "--config",
+            str(sample_config_file),
+            "--output-dir",
+            str(output_dir),
+            "--check",
+        ],
+    ):
+        main()
+
+    stdout = capsys.readouterr().out
+    assert stdout.startswith("Topology check passed: 8 nodes, 8 cables")
+    assert "Lane utilization per node" in stdout
+    assert not output_dir.exists()
+
+
+def test_main_check_exits_with_validation_errors(tmp_path, sample_config):
+    invalid_config_path = tmp_path / "invalid.yaml"
+    invalid_config = dict(sample_config)
+    invalid_links = [dict(link) for link in sample_config["links"]]
+    invalid_links[0]["cables_per_pair"] = 4
+    invalid_config["links"] = invalid_links
+    invalid_config_path.write_text(yaml.safe_dump(invalid_config), encoding="utf-8")
+
+    with (
+        patch("sys.argv", ["main.py", "--config", str(invalid_config_path), "--check"]),
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        main()
+
+    message = str(exc_info.value)
+    assert message.startswith("Topology check failed:")
+    assert "requires 4 lane units but has 1" in message
+
+
+def test_main_reuses_cached_config_on_repeat_runs(tmp_path, sample_config_file):
+    def run(output_name, *extra_args):
+        output_dir = tmp_path / output_name
+        with patch(
+            "sys.argv",
+            [
+                "main.py",
+                "--config",
+                str(sample_config_file),
+                "--output-dir",
+                str(output_dir),
+                "--only",
+                "graph",
+                *extra_args,
+            ],
+        ):
+            main()
+        return (output_dir / "network_topology.log").read_text(encoding="utf-8")
+
+    cache_args = ("--cache-dir", str(tmp_path / "cache"))
+    assert "Loaded validated configuration from cache" not in run("first", *cache_args)
+    assert "Loaded validated configuration from cache" in run("second", *cache_args)
+    assert "Loaded validated configuration from cache" not in run("third")
+    assert len(list((tmp_path / "cache").glob("*.pickle"))) == 2
+
+
+def test_main_leaves_the_cache_untouched_by_default(tmp_path, sample_config_file):
+    with patch(
+        "sys.argv",
+        [
+            "main.py",
+            "--config",
+            str(sample_config_file),
+            "--output-dir",
+            str(tmp_path / "outputs"),
+            "--only",
+            "graph",
+        ],
+    ):
+        main()
+
+    assert not (tmp_path / "config_cache").exists()
+
+
 def test_main_logs_and_reraises_errors(tmp_path, sample_config):
     output_dir = tmp_path / "outputs"
     invalid_config_path = tmp_path / "invalid.yaml"
@@ -103,6 +278,48 @@ def test_main_creates_multi_fabric_outputs(tmp_path, multi_fabric_config):
     assert len(excel_data) == 7
 
 
+def test_main_regenerates_only_changed_fabrics(tmp_path, multi_fabric_config):
+    config_path = tmp_path / "multi_fabric.yaml"
+
+    def run(output_name, config):
+        config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+        output_dir = tmp_path / output_name
+        with patch(
+            "sys.argv",
+            [
+                "main.py",
+                "--config",
+                str(config_path),
+                "--output-dir",
+                str(output_dir),
+                "--output-format",
+                "csv",
+                "--cache",
+            ],
+        ):
+            main()
+        return (output_dir / "network_topology.log").read_text(encoding="utf-8")
+
+    assert "regenerating: backend, frontend, oob" in run("first", multi_fabric_config)
+    assert "regenerating: none" in run("second", multi_fabric_config)
+
+    edited_config = dict(multi_fabric_config)
+    edited_config["fabrics"] = [dict(fabric) for fabric in multi_fabric_config["fabrics"]]
+    tor_layer = multi_fabric_config["fabrics"][1]["layers"][0]
+    edited_config["fabrics"][1]["layers"] = [
+        {
+            **tor_layer,
+            "port_pools": [{**tor_layer["port_pools"][0], "total_lane_units": 3}],
+        }
+    ]
+    assert "Reusing cached outputs for 2 of 3 fabrics; regenerating: frontend" in run(
+        "third", edited_config
+    )
+    cutsheet = pd.read_csv(tmp_path / "third" / "port_mapping.csv")
+    assert list(cutsheet["fabric"]) == ["backend"] * 3 + ["frontend"] * 2 + ["oob"] * 2
+    assert list(cutsheet["cable_number"]) == list(range(1, 8))
+
+
 def test_main_timestamp_writes_outputs_to_resolved_directory(tmp_path, sample_config_file):
     base_output_dir = tmp_path / "outputs"
     resolved_output_dir = base_output_dir / "20260314_120000"
@@ -136,3 +353,6 @@ def test_main_timestamp_writes_outputs_to_resolved_directory(tmp_path, sample_co
         encoding="utf-8"
     )
     assert f"Created output directory: {resolved_output_dir}" in log_contents
+    assert "Successfully visualized topology in" in log_contents
+    assert "Successfully created cut-sheet/port-mapping (8 cables) in" in log_contents
+    assert "Finished in" in log_contents
@@ -0,0 +1,29 @@
+import pytest
+
+from topology_generator.parallel import map_with_graph, resolve_worker_count
+from topology_generator.topology_generator import generate_topology
+
+
+def _count_nodes_with_offset(graph, offset):
+    return graph.number_of_nodes() + offset
+
+
+def test_resolve_worker_count_caps_workers_at_task_count(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 8)
+
+    assert resolve_worker_count(None, 3) == 3
+    assert resolve_worker_count(None, 20) == 8
+    assert resolve_worker_count(2, 20) == 2
+    assert resolve_worker_count(4, 0) == 1
+    with pytest.raises(ValueError, match="jobs must be at least 1"):
+        resolve_worker_count(0, 3)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_map_with_graph_returns_results_in_task_order(sample_config, jobs):
+    graph = generate_topology(sample_config)
+
+    results = map_with_graph(graph, _count_nodes_with_offset, [3, 1, 2], jobs)
+
+    node_count = graph.number_of_nodes()
+    assert results == [node_count + 3, node_count + 1, node_count + 2]
@@ -0,0 +1,28 @@
+import pandas as pd
+import pytest
+
+from topology_generator.pipeline import write_outputs
+from topology_generator.topology_generator import generate_topology
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_write_outputs_renders_and_writes_cutsheet(
+    tmp_path,
+    multi_fabric_config,
+    caplog,
+    jobs,
+):
+    graph = generate_topology(multi_fabric_config)
+
+    with caplog.at_level("INFO", logger="topology_generator.pipeline"):
+        timings = write_outputs(graph, tmp_path, "csv", jobs=jobs)
+
+    assert timings.row_count == 7
+    assert len(pd.read_csv(tmp_path / "port_mapping.csv")) == 7
+    assert (tmp_path / "topology_backend.png").exists()
+    assert (tmp_path / "topology_oob.png").exists()
+    assert timings.render_seconds > 0
+    assert timings.cutsheet_seconds > 0
+    assert timings.total_seconds >= max(timings.render_seconds, timings.cutsheet_seconds)
+    assert "Successfully visualized topology in" in caplog.text
+    assert "Output stages finished in" in caplog.text
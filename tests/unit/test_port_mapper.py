@@ -1,16 +1,32 @@
+from pathlib import Path
+
 import networkx as nx
+import numpy as np
 import pandas as pd
 import pytest
 
+from topology_generator.graph_metadata import PortRange
 from topology_generator.port_mapper import (
     MULTI_FABRIC_PORT_MAPPING_COLUMNS,
     PORT_MAPPING_COLUMNS,
+    FabricRowBlock,
     create_port_mapping,
+    fabric_row_blocks,
     extract_port_mapping_rows,
+    iter_fabric_rows,
+    iter_numbered_blocks,
+    iter_port_mapping_values,
+    iter_shard_values,
+    plan_port_mapping_shards,
     save_to_excel,
+    write_port_mapping_excel,
+    write_port_mapping_excel_blocks,
 )
 
 
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "configs" / "examples"
+
+
 def test_extract_port_mapping_rows_preserves_layer_orientation():
     graph = nx.Graph()
     graph.add_node("pod_1_leaf_1", layer_index=1, group_label="pod_1")
@@ -46,6 +62,30 @@ def test_extract_port_mapping_rows_preserves_layer_orientation():
     ]
 
 
+def test_extract_port_mapping_rows_expands_port_ranges_per_cable():
+    graph = nx.Graph()
+    graph.add_node("leaf_1", layer_index=1, group_label="global")
+    graph.add_node("compute_1", layer_index=0, group_label="global")
+    graph.add_edge(
+        "leaf_1",
+        "compute_1",
+        source_ports=PortRange(start=5, stride=2, length=2),
+        target_ports=PortRange(start=1, stride=1, length=2),
+        source_lane_units_per_cable=2,
+        target_lane_units_per_cable=1,
+        num_cables=2,
+        cable_bandwidth_gb=800,
+    )
+
+    rows = extract_port_mapping_rows(graph)
+
+    assert [(row["source_node_id"], row["source_node_port"]) for row in rows] == [
+        ("compute_1", 1),
+        ("compute_1", 2),
+    ]
+    assert [row["target_node_port"] for row in rows] == [5, 7]
+
+
 def test_extract_port_mapping_rows_rejects_mismatched_allocations():
     graph = nx.Graph()
     graph.add_node("compute_1", layer_index=0, group_label="global")
@@ -121,6 +161,63 @@ def test_extract_port_mapping_rows_flattens_multiple_bundles_on_one_edge():
     assert [row["cable_number"] for row in rows] == [1, 2]
 
 
+@pytest.mark.parametrize("config_path", sorted(EXAMPLES_DIR.glob("*.yaml")))
+def test_generated_graph_edges_match_sorted_cut_sheet_order(config_path):
+    from topology_generator.file_handler import load_config_from_file
+    from topology_generator.topology_generator import generate_topology
+
+    graph = generate_topology(load_config_from_file(config_path))
+    rows_in_edge_order = extract_port_mapping_rows(graph)
+    graph.graph["canonical_edge_order"] = False
+
+    assert rows_in_edge_order == extract_port_mapping_rows(graph)
+
+
+def test_extract_port_mapping_rows_sorts_generated_graphs_after_edge_changes(
+    sample_config,
+):
+    from topology_generator.graph_metadata import has_canonical_edge_order
+    from topology_generator.topology_generator import generate_topology
+
+    graph = generate_topology(sample_config)
+    assert has_canonical_edge_order(graph)
+    (source, target, attrs), *_, (last_source, last_target, _) = list(
+        graph.edges(data=True)
+    )
+    # Re-adding an edge moves it to the end of edge order; dropping another
+    # changes the edge count, so the recorded order no longer applies.
+    graph.remove_edge(source, target)
+    graph.add_edge(source, target, **attrs)
+    graph.remove_edge(last_source, last_target)
+    reference = graph.copy()
+    reference.graph["canonical_edge_order"] = False
+
+    assert not has_canonical_edge_order(graph)
+    assert extract_port_mapping_rows(graph) == extract_port_mapping_rows(reference)
+
+
+def test_extract_port_mapping_rows_sorts_graphs_without_canonical_order():
+    graph = nx.Graph()
+    for node_id, layer_index in [("spine_1", 1), ("compute_2", 0), ("compute_1", 0)]:
+        graph.add_node(node_id, layer_index=layer_index, group_label="global")
+    for compute_node_id, port in [("compute_2", 2), ("compute_1", 1)]:
+        graph.add_edge(
+            "spine_1",
+            compute_node_id,
+            source_ports=[port],
+            target_ports=[1],
+            source_lane_units_per_cable=1,
+            target_lane_units_per_cable=1,
+            num_cables=1,
+            cable_bandwidth_gb=100,
+        )
+
+    rows = extract_port_mapping_rows(graph)
+
+    assert [row["source_node_id"] for row in rows] == ["compute_1", "compute_2"]
+    assert [row["target_node_port"] for row in rows] == [1, 2]
+
+
 def test_create_port_mapping_returns_expected_dataframe(sample_config):
     from topology_generator.topology_generator import generate_topology
 
@@ -158,6 +255,45 @@ def test_create_port_mapping_returns_expected_dataframe(sample_config):
     }
 
 
+def test_create_port_mapping_builds_typed_columns(multi_fabric_config):
+    from topology_generator.topology_generator import generate_topology
+
+    graph = generate_topology(multi_fabric_config)
+
+    df = create_port_mapping(graph)
+
+    assert df["source_node_id"].dtype == "category"
+    assert df["target_group"].dtype == "category"
+    assert df["fabric"].dtype == "category"
+    assert df["source_node_port"].dtype == np.int32
+    assert df["target_lane_units"].dtype == np.int32
+    assert df["cable_bandwidth_gb"].dtype == np.float64
+    assert df.astype(object).to_dict("records") == extract_port_mapping_rows(graph)
+
+
+def test_create_port_mapping_expands_explicit_port_lists():
+    graph = nx.Graph()
+    graph.add_node("leaf_1", layer_index=1, group_label="global")
+    graph.add_node("compute_1", layer_index=0, group_label="pod_1")
+    graph.add_edge(
+        "leaf_1",
+        "compute_1",
+        source_ports=[7, 2],
+        target_ports=PortRange(start=1, stride=3, length=2),
+        source_lane_units_per_cable=1,
+        target_lane_units_per_cable=1,
+        num_cables=2,
+        cable_bandwidth_gb=400,
+    )
+
+    df = create_port_mapping(graph)
+
+    assert list(df["source_node_port"]) == [1, 4]
+    assert list(df["target_node_port"]) == [7, 2]
+    assert list(df["source_group"]) == ["pod_1", "pod_1"]
+    assert list(df["cable_number"]) == [1, 2]
+
+
 def test_save_to_excel_writes_file(tmp_path):
     df = pd.DataFrame(
         [
@@ -188,6 +324,233 @@ def test_save_to_excel_writes_file(tmp_path):
     assert loaded_df.iloc[0]["source_node_id"] == "node1"
 
 
+def test_write_port_mapping_excel_matches_dataframe_export(tmp_path, multi_fabric_config):
+    from topology_generator.topology_generator import generate_topology
+
+    graph = generate_topology(multi_fabric_config)
+    save_to_excel(create_port_mapping(graph), tmp_path, "pandas.xlsx")
+
+    row_count = write_port_mapping_excel(graph, tmp_path, "streamed.xlsx")
+
+    streamed = pd.read_excel(tmp_path / "streamed.xlsx")
+    assert row_count == 7
+    assert list(streamed.columns) == MULTI_FABRIC_PORT_MAPPING_COLUMNS
+    pd.testing.assert_frame_equal(streamed, pd.read_excel(tmp_path / "pandas.xlsx"))
+
+
+def test_plan_port_mapping_shards_splits_per_fabric_with_continuous_cable_numbers(
+    multi_fabric_config,
+):
+    from topology_generator.topology_generator import generate_topology
+
+    graph = generate_topology(multi_fabric_config)
+
+    assert [
+        (shard.filename, shard.row_count, shard.first_cable_number)
+        for shard in plan_port_mapping_shards(graph, max_rows_per_sheet=2)
+    ] == [
+        ("port_mapping_backend_1.xlsx", 2, 1),
+        ("port_mapping_backend_2.xlsx", 1, 3),
+        ("port_mapping_frontend_1.xlsx", 2, 4),
+        ("port_mapping_oob_1.xlsx", 2, 6),
+    ]
+    assert [
+        shard.filename for shard in plan_port_mapping_shards(graph, max_rows_per_sheet=7)
+    ] == ["port_mapping.xlsx"]
+
+
+def test_write_port_mapping_excel_shards_use_fabric_output_names(
+    tmp_path,
+    multi_fabric_config,
+):
+    from topology_generator.topology_generator import generate_topology
+
+    multi_fabric_config["fabrics"][0]["name"] = "Back/End"
+    pools = multi_fabric_config["gpu_nodes"]["fabric_port_pools"]
+    pools["Back/End"] = pools.pop("backend")
+    graph = generate_topology(multi_fabric_config)
+
+    row_count = write_port_mapping_excel(graph, tmp_path, max_rows_per_sheet=2)
+
+    assert row_count == 7
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "port_mapping_back_end_1.xlsx",
+        "port_mapping_back_end_2.xlsx",
+        "port_mapping_frontend_1.xlsx",
+        "port_mapping_oob_1.xlsx",
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_write_port_mapping_excel_shards_rows_with_headers(
+    tmp_path,
+    multi_fabric_config,
+    jobs,
+):
+    from topology_generator.topology_generator import generate_topology
+
+    graph = generate_topology(multi_fabric_config)
+
+    write_port_mapping_excel(graph, tmp_path / "single")
+
+    row_count = write_port_mapping_excel(
+        graph,
+        tmp_path / "sharded",
+        max_rows_per_sheet=2,
+        jobs=jobs,
+    )
+
+    shard_files = sorted((tmp_path / "sharded").glob("*.xlsx"))
+    shards = [pd.read_excel(path) for path in shard_files]
+    assert row_count == 7
+    assert [path.name for path in shard_files] == [
+        "port_mapping_backend_1.xlsx",
+        "port_mapping_backend_2.xlsx",
+        "port_mapping_frontend_1.xlsx",
+        "port_mapping_oob_1.xlsx",
+    ]
+    assert all(list(df.columns) == MULTI_FABRIC_PORT_MAPPING_COLUMNS for df in shards)
+    pd.testing.assert_frame_equal(
+        pd.concat(shards, ignore_index=True),
+        pd.read_excel(tmp_path / "single" / "port_mapping.xlsx"),
+    )
+
+
+def test_iter_shard_values_skips_the_bundles_of_earlier_shards(monkeypatch):
+    from topology_generator import port_mapper
+
+    graph = nx.Graph()
+    graph.add_node("leaf_1", layer_index=1, group_label="global")
+    for index in range(1, 5):
+        graph.add_node(f"compute_{index}", layer_index=0, group_label="global")
+        graph.add_edge(
+            "leaf_1",
+            f"compute_{index}",
+            source_ports=PortRange(start=3 * index, stride=1, length=3),
+            target_ports=PortRange(start=1, stride=1, length=3),
+            source_lane_units_per_cable=1,
+            target_lane_units_per_cable=1,
+            num_cables=3,
+            cable_bandwidth_gb=400,
+        )
+    shards = plan_port_mapping_shards(graph, max_rows_per_sheet=5)
+    all_values = list(iter_port_mapping_values(graph))
+    oriented_bundles = []
+    orient_edge_allocation = port_mapper._orient_edge_allocation
+
+    def counting_orient_edge_allocation(context, source, target, attrs):
+        oriented_bundles.append((source, target))
+        return orient_edge_allocation(context, source, target, attrs)
+
+    monkeypatch.setattr(
+        port_mapper,
+        "_orient_edge_allocation",
+        counting_orient_edge_allocation,
+    )
+
+    assert [(shard.first_row, shard.row_count) for shard in shards] == [
+        (0, 5),
+        (5, 5),
+        (10, 2),
+    ]
+    assert list(iter_shard_values(graph, shards[1])) == all_values[5:10]
+    assert len(oriented_bundles) == 3
+    oriented_bundles.clear()
+    assert list(iter_shard_values(graph, shards[2])) == all_values[10:]
+    assert len(oriented_bundles) == 1
+
+
+def test_iter_shard_values_groups_fabric_edges_once_per_graph(
+    monkeypatch,
+    multi_fabric_config,
+):
+    from topology_generator import port_mapper
+    from topology_generator.topology_generator import generate_topology
+
+    graph = generate_topology(multi_fabric_config)
+    shards = plan_port_mapping_shards(graph, max_rows_per_sheet=1)
+    all_values = list(iter_port_mapping_values(graph))
+    groupings = []
+    edges_by_fabric = port_mapper._edges_by_fabric
+
+    def counting_edges_by_fabric(graph):
+        groupings.append(graph)
+        return edges_by_fabric(graph)
+
+    monkeypatch.setattr(port_mapper, "_edges_by_fabric", counting_edges_by_fabric)
+
+    values = [values for shard in shards for values in iter_shard_values(graph, shard)]
+
+    assert len(shards) == 7
+    assert values == all_values
+    assert len(groupings) == 1
+
+
+def test_excel_blocks_match_graph_workbooks(tmp_path, multi_fabric_config):
+    from topology_generator.topology_generator import generate_topology
+
+    graph = generate_topology(multi_fabric_config)
+    # One-shot iterators, as when the rows are streamed from the cache.
+    blocks = fabric_row_blocks(graph)
+
+    write_port_mapping_excel(graph, tmp_path / "graph", max_rows_per_sheet=2, jobs=1)
+    row_count = write_port_mapping_excel_blocks(
+        blocks,
+        tmp_path / "blocks",
+        max_rows_per_sheet=2,
+    )
+
+    expected_files = sorted((tmp_path / "graph").glob("*.xlsx"))
+    assert row_count == 7
+    assert [path.name for path in sorted((tmp_path / "blocks").glob("*.xlsx"))] == [
+        path.name for path in expected_files
+    ]
+    for expected_file in expected_files:
+        pd.testing.assert_frame_equal(
+            pd.read_excel(tmp_path / "blocks" / expected_file.name),
+            pd.read_excel(expected_file),
+        )
+
+
+def test_fabric_row_blocks_count_the_rows_of_each_fabric(multi_fabric_config):
+    from topology_generator.topology_generator import generate_topology
+
+    graph = generate_topology(multi_fabric_config)
+
+    blocks = fabric_row_blocks(graph)
+
+    assert {fabric_name: block.row_count for fabric_name, block in blocks.items()} == {
+        "backend": 3,
+        "frontend": 2,
+        "oob": 2,
+    }
+    for fabric_name, block in blocks.items():
+        assert list(block.rows) == list(iter_fabric_rows(graph, fabric_name))
+
+
+def test_iter_numbered_blocks_continues_numbers_across_blocks():
+    numbered = list(
+        iter_numbered_blocks(
+            [
+                FabricRowBlock(2, iter([("a",), ("b",)])),
+                FabricRowBlock(0, iter([])),
+                FabricRowBlock(1, iter([("c",)])),
+            ]
+        )
+    )
+
+    assert numbered == [("a", 1), ("b", 2), ("c", 3)]
+
+
+def test_iter_port_mapping_values_is_lazy(sample_config):
+    from topology_generator.topology_generator import generate_topology
+
+    values = iter_port_mapping_values(generate_topology(sample_config))
+
+    assert next(values)[-1] == 1
+    assert next(values)[-1] == 2
+
+
 def test_create_port_mapping_merges_multi_fabric_rows(multi_fabric_config):
     from topology_generator.topology_generator import generate_topology
 
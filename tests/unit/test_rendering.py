@@ -371,3 +371,27 @@ def test_visualize_topology_writes_multi_scope_outputs(tmp_path: Path):
     visualize_topology(graph, tmp_path)
 
     assert (tmp_path / "topology_oob.png").exists()
+
+
+def test_visualize_topology_renders_fabrics_in_parallel(
+    tmp_path: Path,
+    multi_fabric_config,
+):
+    graph = generate_topology(multi_fabric_config)
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+    serial_dir.mkdir()
+    parallel_dir.mkdir()
+
+    visualize_topology(graph, serial_dir, jobs=1)
+    visualize_topology(graph, parallel_dir, jobs=2)
+
+    serial_files = sorted(path.name for path in serial_dir.iterdir())
+    assert serial_files == [
+        "topology_backend.png",
+        "topology_frontend.png",
+        "topology_oob.png",
+    ]
+    assert sorted(path.name for path in parallel_dir.iterdir()) == serial_files
+    for name in serial_files:
+        assert (parallel_dir / name).read_bytes() == (serial_dir / name).read_bytes()
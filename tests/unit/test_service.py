@@ -0,0 +1,159 @@
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+import yaml
+
+from topology_generator.cutsheet_formats import write_port_mapping
+from topology_generator.service import LRUCache, TopologyServer, TopologyService
+from topology_generator.topology_generator import generate_topology
+
+
+@pytest.fixture(scope="module")
+def service_url():
+    with (
+        TopologyService(workers=2, max_entries=4) as service,
+        TopologyServer(("127.0.0.1", 0), service, max_body_bytes=8192) as server,
+    ):
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        thread.join()
+
+
+def _request(url, path, config=None, data=None):
+    if config is not None:
+        data = yaml.safe_dump(config).encode("utf-8")
+    request = urllib.request.Request(url + path, data=data)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.headers, exc.read()
+
+
+def test_lru_cache_evicts_least_recently_used_entries():
+    cache = LRUCache(2)
+    cache.get_or_create("a", lambda: 1)
+    cache.get_or_create("b", lambda: 2)
+    cache.get_or_create("a", lambda: 3)
+    cache.get_or_create("c", lambda: 4)
+
+    assert cache.get_or_create("a", lambda: 5) == 1
+    assert cache.get_or_create("b", lambda: 6) == 6
+
+    cache.discard("b", 2)
+    assert cache.get_or_create("b", lambda: 7) == 6
+    cache.discard("b", 6)
+    assert cache.get_or_create("b", lambda: 8) == 8
+
+
+def test_service_validates_configs(service_url, multi_fabric_config):
+    status, _, body = _request(service_url, "/validate", multi_fabric_config)
+
+    assert status == 200
+    assert json.loads(body) == {
+        "valid": True,
+        "nodes": 10,
+        "links": 7,
+        "fabrics": ["backend", "frontend", "oob"],
+    }
+
+
+def test_service_writes_cutsheets(tmp_path, service_url, multi_fabric_config):
+    write_port_mapping(generate_topology(multi_fabric_config), tmp_path, "csv", jobs=1)
+
+    status, headers, body = _request(
+        service_url, "/cutsheet?format=csv", multi_fabric_config
+    )
+
+    assert status == 200
+    assert headers["Content-Type"] == "text/csv; charset=utf-8"
+    assert 'filename="port_mapping.csv"' in headers["Content-Disposition"]
+    assert body == (tmp_path / "port_mapping.csv").read_bytes()
+
+    status, _, body = _request(service_url, "/cutsheet", multi_fabric_config)
+    assert status == 200
+    assert len(pd.read_excel(io.BytesIO(body))) == 7
+
+
+def test_service_renders_concurrent_requests_once(service_url, sample_config):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(
+            executor.map(lambda _: _request(service_url, "/render", sample_config), range(4))
+        )
+
+    assert {status for status, _, _ in responses} == {200}
+    assert len({body for _, _, body in responses}) == 1
+    assert responses[0][1]["Content-Type"] == "image/png"
+    assert responses[0][2].startswith(b"\x89PNG")
+
+
+def test_service_renders_each_fabric(service_url, multi_fabric_config):
+    diagrams = {
+        fabric_name: _request(
+            service_url, f"/render?fabric={fabric_name}", multi_fabric_config
+        )
+        for fabric_name in ("backend", "frontend", "oob")
+    }
+
+    assert {status for status, _, _ in diagrams.values()} == {200}
+    assert len({body for _, _, body in diagrams.values()}) == 3
+
+    status, _, body = _request(service_url, "/render", multi_fabric_config)
+    assert status == 400
+    assert "Pass fabric as one of backend, frontend, oob" in json.loads(body)["error"]
+
+
+def test_service_reports_request_errors(service_url, sample_config):
+    invalid_config = dict(sample_config)
+    invalid_config["links"] = [
+        {**sample_config["links"][0], "cable_bandwidth_gb": 0},
+        *sample_config["links"][1:],
+    ]
+
+    status, _, body = _request(service_url, "/validate", invalid_config)
+    assert status == 422
+    assert "cable_bandwidth_gb" in json.loads(body)["error"]
+
+    status, _, _ = _request(service_url, "/cutsheet?format=pdf", sample_config)
+    assert status == 400
+
+    status, _, _ = _request(service_url, "/generate", sample_config)
+    assert status == 404
+
+    status, _, body = _request(service_url, "/health")
+    assert status == 200
+    assert json.loads(body)["status"] == "ok"
+
+
+def test_service_rejects_oversized_bodies(service_url, sample_config):
+    padding = b"# " + b"x" * 8192 + b"\n"
+    body = padding + yaml.safe_dump(sample_config).encode("utf-8")
+
+    status, _, response = _request(service_url, "/validate", data=body)
+
+    assert status == 413
+    assert "exceeds the 8192-byte limit" in json.loads(response)["error"]
+
+    status, _, response = _request(service_url, "/validate", data=body[-8192:])
+    assert status == 400
+
+
+def test_service_reports_capacity_errors_from_workers(service_url, sample_config):
+    invalid_config = dict(sample_config)
+    invalid_config["links"] = [
+        {**sample_config["links"][0], "cables_per_pair": 2},
+        *sample_config["links"][1:],
+    ]
+
+    status, _, body = _request(service_url, "/cutsheet?format=csv", invalid_config)
+
+    assert status == 422
+    assert "lane units but has" in json.loads(body)["error"]
@@ -1,8 +1,13 @@
+import pytest
+
 from topology_generator.config_types import TopologyConfig
+from topology_generator.graph_metadata import node_sort_key
 from topology_generator.topology_generator import (
+    GRAPH_BACKENDS,
     ContiguousLaneAllocator,
     build_fabric_output_name,
     generate_topology,
+    get_fabric_names,
     get_fabric_view,
     is_multi_fabric_graph,
 )
@@ -262,6 +267,20 @@ def test_get_fabric_view_rejects_unknown_fabric(multi_fabric_config):
     assert "Unknown fabric" in str(error)
 
 
+@pytest.mark.parametrize("graph_backend", GRAPH_BACKENDS)
+def test_generate_topology_stamps_sort_ranks_in_node_sort_key_order(
+    multi_fabric_config,
+    graph_backend,
+):
+    graph = generate_topology(multi_fabric_config, graph_backend=graph_backend)
+
+    for fabric_name in get_fabric_names(graph):
+        fabric_nodes = list(get_fabric_view(graph, fabric_name).nodes(data=True))
+        by_rank = sorted(fabric_nodes, key=lambda item: item[1]["sort_rank"])
+        by_key = sorted(fabric_nodes, key=lambda item: node_sort_key(*item))
+        assert [node_id for node_id, _ in by_rank] == [node_id for node_id, _ in by_key]
+
+
 def test_build_fabric_output_name_normalizes_for_filesystem():
     assert build_fabric_output_name("front/end") == "front_end"
 
@@ -283,6 +302,17 @@ def test_contiguous_lane_allocator_is_one_based_for_single_lane_allocations():
     assert allocator.allocate(1) == 3
 
 
+def test_contiguous_lane_allocator_allocates_bundles_in_one_call():
+    allocator = ContiguousLaneAllocator(total_lane_units=8)
+
+    assert allocator.allocate(1) == 1
+    assert list(allocator.allocate_many(2, 3)) == [2, 4, 6]
+    assert allocator.allocate(1) == 8
+
+    with pytest.raises(ValueError, match="Unable to allocate 1 x 1 contiguous"):
+        allocator.allocate_many(1, 1)
+
+
 def test_contiguous_lane_allocator_rejects_exhausted_capacity():
     allocator = ContiguousLaneAllocator(total_lane_units=4)
 
@@ -1,10 +1,14 @@
 import pytest
 
+from topology_generator.capacity import validate_topology_capacity
+from topology_generator.config_types import InvalidTopologyConfig
 from topology_generator.expander import expand_topology
 from topology_generator.validator import (
     TopologyValidationError,
     build_node_usage,
+    build_node_usage_arrays,
     validate_expanded_topology,
+    validate_topology_config,
 )
 
 
@@ -140,12 +144,79 @@ def test_validate_expanded_topology_reports_pool_capacity_failures():
     assert "spine_1 port pool 'mgmt' requires 3 lane units but has 2" in str(exc_info.value)
 
 
+def test_validators_report_multi_pool_failures_node_by_node():
+    config = {
+        "groups": [],
+        "layers": [
+            {
+                "name": "leaf",
+                "placement": "global",
+                "nodes_per_group": 2,
+                "port_pools": [
+                    _pool("fabric", 400, 1, [(400, 1)]),
+                    _pool("mgmt", 100, 2, [(100, 1)]),
+                ],
+            },
+            {
+                "name": "spine",
+                "placement": "global",
+                "nodes_per_group": 2,
+                "port_pools": [
+                    _pool("fabric", 400, 1, [(400, 1)]),
+                    _pool("mgmt", 100, 2, [(100, 1)]),
+                ],
+            },
+        ],
+        "links": [
+            {
+                "from": "leaf",
+                "to": "spine",
+                "policy": "global_full_mesh",
+                "port_pool": "fabric",
+                "cables_per_pair": 1,
+                "cable_bandwidth_gb": 400,
+            },
+            {
+                "from": "leaf",
+                "to": "spine",
+                "policy": "global_full_mesh",
+                "port_pool": "mgmt",
+                "cables_per_pair": 2,
+                "cable_bandwidth_gb": 100,
+            },
+        ],
+    }
+
+    with pytest.raises(TopologyValidationError) as expanded_exc_info:
+        validate_expanded_topology(expand_topology(config))
+    with pytest.raises(TopologyValidationError) as capacity_exc_info:
+        validate_topology_capacity(config)
+
+    assert list(expanded_exc_info.value.errors) == [
+        f"{node_id} port pool {pool_name!r} requires {required} lane units but has {total}"
+        for node_id in ("leaf_1", "leaf_2", "spine_1", "spine_2")
+        for pool_name, required, total in (("fabric", 2, 1), ("mgmt", 4, 2))
+    ]
+    assert capacity_exc_info.value.errors == expanded_exc_info.value.errors
+
+
 def test_validate_expanded_topology_supports_mixed_speed_nodes(mixed_speed_config):
     usage = validate_expanded_topology(expand_topology(mixed_speed_config))
 
     assert usage["pod_1_leaf_switch_1"].required_lane_units_for_pool("fabric") == 4
 
 
+def test_build_node_usage_arrays_accumulates_per_node_columns(sample_config):
+    expanded = expand_topology(sample_config)
+    arrays = build_node_usage_arrays(expanded)
+
+    assert expanded.pool_names == ("fabric",)
+    assert arrays.required_lane_units.tolist() == [[1, 1, 1, 1, 4, 4, 2, 2]]
+    assert arrays.bandwidth_up_gb.tolist() == [100, 100, 100, 100, 200, 200, 0, 0]
+    assert arrays.bandwidth_down_gb.tolist() == [0, 0, 0, 0, 200, 200, 200, 200]
+    assert arrays.node_usage(expanded, 4) == build_node_usage(expanded)["pod_1_leaf_1"]
+
+
 def test_validate_expanded_topology_keeps_gpu_node_capacity_isolated_by_fabric(
     multi_fabric_config,
 ):
@@ -171,3 +242,36 @@ def test_validate_expanded_topology_reports_only_failing_fabric(multi_fabric_con
     assert "backend__gpu_nodes_1 port pool 'fabric' requires 2 lane units but has 1" in message
     assert "frontend__gpu_nodes_1" not in message
     assert "oob__gpu_nodes_1" not in message
+
+
+def test_validate_topology_config_matches_generation_errors(multi_fabric_config):
+    expanded = validate_topology_config(multi_fabric_config)
+    assert expanded.num_nodes == expand_topology(multi_fabric_config).num_nodes
+
+    invalid_config = dict(multi_fabric_config)
+    invalid_fabrics = [dict(fabric) for fabric in multi_fabric_config["fabrics"]]
+    invalid_links = [dict(link) for link in invalid_fabrics[0]["links"]]
+    invalid_links[0]["cables_per_pair"] = 2
+    invalid_fabrics[0]["links"] = invalid_links
+    invalid_config["fabrics"] = invalid_fabrics
+
+    with pytest.raises(TopologyValidationError, match="requires 2 lane units but has 1"):
+        validate_topology_config(invalid_config)
+
+
+def test_validate_topology_config_rejects_unsupported_bandwidth_before_expansion(
+    multi_fabric_config,
+):
+    multi_fabric_config["fabrics"][0]["links"][0]["cable_bandwidth_gb"] = 400
+
+    with pytest.raises(InvalidTopologyConfig, match="400 GB/s is not supported"):
+        validate_topology_config(multi_fabric_config)
+
+
+def test_topology_validation_error_survives_pickling():
+    import pickle
+
+    error = pickle.loads(pickle.dumps(TopologyValidationError(["b failed", "a failed"])))
+
+    assert error.errors == ("a failed", "b failed")
+    assert str(error) == "a failed\nb failed"
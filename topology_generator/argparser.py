@@ -1,4 +1,13 @@
 import argparse
+import sys
+from collections.abc import Sequence
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
 
 
 def parse_args():
@@ -8,7 +17,14 @@ def parse_args():
     Returns:
         argparse.Namespace: Parsed command line arguments.
     """
-    parser = argparse.ArgumentParser(description="Network Topology Generator")
+    parser = argparse.ArgumentParser(
+        description="Network Topology Generator",
+        epilog=(
+            "Run 'topology-generator batch --help' to generate many configs "
+            "in one process, or 'topology-generator serve --help' to serve "
+            "requests over local HTTP."
+        ),
+    )
 
     parser.add_argument(
         "--config",
@@ -30,4 +46,202 @@ def parse_args():
         help="Add timestamp to output directory",
     )
 
+    _add_output_arguments(parser)
+
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help=(
+            "Worker processes for per-fabric rendering and cut-sheet writing; "
+            "defaults to one per CPU"
+        ),
+    )
+
+    _add_cache_arguments(parser)
+
+    stage_selection = parser.add_mutually_exclusive_group()
+    _add_stage_argument(stage_selection)
+    stage_selection.add_argument(
+        "--check",
+        action="store_true",
+        help=(
+            "Validate port budgets from config arithmetic alone and print "
+            "node, cable and lane-utilization statistics; writes no files"
+        ),
+    )
+
     return parser.parse_args()
+
+
+def parse_batch_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the arguments of the ``batch`` subcommand.
+
+    Args:
+        argv: Arguments after ``batch``; defaults to ``sys.argv[2:]``.
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="topology-generator batch",
+        description=(
+            "Generate outputs for many configs in one process, each in its "
+            "own output directory with its own log"
+        ),
+    )
+
+    parser.add_argument(
+        "configs",
+        nargs="+",
+        help="Configuration YAML files or glob patterns such as 'configs/**/*.yaml'",
+    )
+
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="output",
+        help=(
+            "Base output directory; each config writes to a subdirectory "
+            "named after its file, and the batch summary is written here"
+        ),
+    )
+
+    parser.add_argument(
+        "--timestamp",
+        action="store_true",
+        help="Add timestamp to output directory",
+    )
+
+    _add_output_arguments(parser)
+
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Configs processed at once; defaults to one per CPU",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Worker processes used within each config",
+    )
+
+    _add_cache_arguments(parser)
+    _add_stage_argument(parser)
+
+    return parser.parse_intermixed_args(sys.argv[2:] if argv is None else argv)
+
+
+def parse_serve_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the arguments of the ``serve`` subcommand.
+
+    Args:
+        argv: Arguments after ``serve``; defaults to ``sys.argv[2:]``.
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="topology-generator serve",
+        description=(
+            "Serve validate, cut-sheet and render endpoints over local HTTP, "
+            "keeping modules imported and results cached between requests"
+        ),
+    )
+
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Interface to listen on",
+    )
+
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Port to listen on; 0 picks a free port",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Worker processes for CPU-heavy stages; defaults to one per CPU",
+    )
+
+    parser.add_argument(
+        "--cache-entries",
+        type=_positive_int,
+        default=64,
+        help="Configs kept in each in-memory LRU cache",
+    )
+
+    parser.add_argument(
+        "--max-body-bytes",
+        type=_positive_int,
+        default=16 * 2**20,
+        help="Largest request body accepted; larger ones get status 413",
+    )
+
+    return parser.parse_args(sys.argv[2:] if argv is None else argv)
+
+
+def _add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--graph-backend",
+        choices=("networkx", "compact"),
+        default="networkx",
+        help=(
+            "Graph storage backend; 'compact' keeps integer-indexed columns "
+            "instead of per-node attribute dicts for very large fabrics"
+        ),
+    )
+
+    parser.add_argument(
+        "--output-format",
+        choices=("xlsx", "csv", "csv.gz", "parquet"),
+        default="xlsx",
+        help="Cut-sheet file format; 'parquet' requires pyarrow",
+    )
+
+
+def _add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Cache validated configs, expansions and per-fabric outputs on disk "
+            "(at most 256 MiB) so reruns skip unchanged work"
+        ),
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help=(
+            "Cache directory; implies --cache. Defaults to "
+            "$TOPOLOGY_GENERATOR_CACHE_DIR or ~/.cache/topology_generator"
+        ),
+    )
+
+
+def _add_stage_argument(
+    parser: argparse.ArgumentParser | argparse._MutuallyExclusiveGroup,
+) -> None:
+    parser.add_argument(
+        "--only",
+        choices=("validate", "graph", "render", "cutsheet"),
+        default=None,
+        help=(
+            "Run only up to one stage: 'validate' checks the config without "
+            "building a graph, 'graph' builds it without writing outputs, "
+            "'render' and 'cutsheet' write just that output"
+        ),
+    )
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import importlib
+import json
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from os import PathLike
+from pathlib import Path
+
+from topology_generator.parallel import resolve_worker_count
+
+
+SUMMARY_FILENAME = "batch_summary.json"
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    """Settings shared by every config of a batch; see ``main.run_topology``."""
+
+    output_format: str = "xlsx"
+    graph_backend: str = "networkx"
+    jobs: int | None = 1
+    only: str | None = None
+    cache: bool = False
+    cache_dir: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    config_path: Path
+    output_dir: Path
+    seconds: float
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def expand_config_paths(patterns: Sequence[str]) -> list[Path]:
+    """Resolve config paths and glob patterns into an ordered list of files.
+
+    Each pattern's matches are sorted; a file named more than once is kept
+    at its first position. ``**`` matches nested directories.
+
+    Raises:
+        ValueError: If a path or pattern matches no file.
+    """
+    config_paths: dict[Path, None] = {}
+    for pattern in patterns:
+        if Path(pattern).is_file():
+            matches = [Path(pattern)]
+        else:
+            matches = [
+                Path(match)
+                for match in sorted(glob.glob(pattern, recursive=True))
+                if Path(match).is_file()
+            ]
+        if not matches:
+            raise ValueError(f"No config files match {pattern!r}.")
+        config_paths.update(dict.fromkeys(matches))
+    return list(config_paths)
+
+
+def batch_output_dirs(
+    config_paths: Sequence[Path],
+    output_dir: str | PathLike[str],
+) -> list[Path]:
+    """Name each config's output directory after its file name without suffix.
+
+    Later configs that share a name get ``_2``, ``_3`` and so on appended,
+    skipping any suffixed name that another config's file already has.
+    """
+    used_names = {config_path.stem for config_path in config_paths}
+    seen_stems: set[str] = set()
+    next_suffixes: dict[str, int] = {}
+    output_dirs = []
+    for config_path in config_paths:
+        name = config_path.stem
+        if name in seen_stems:
+            suffix = next_suffixes.get(config_path.stem, 2)
+            while f"{config_path.stem}_{suffix}" in used_names:
+                suffix += 1
+            name = f"{config_path.stem}_{suffix}"
+            used_names.add(name)
+            next_suffixes[config_path.stem] = suffix + 1
+        seen_stems.add(config_path.stem)
+        output_dirs.append(Path(output_dir) / name)
+    return output_dirs
+
+
+def preload_modules(only: str | None = None) -> None:
+    """Import the modules the selected stages need, once, before forking workers.
+
+    Workers forked afterwards inherit networkx, the cut-sheet writers and a
+    configured Matplotlib, so no config pays their import or the Matplotlib
+    environment probe again.
+    """
+    module_names = ["topology_generator.validator"]
+    if only != "validate":
+        module_names.append("topology_generator.topology_generator")
+    if only in (None, "cutsheet"):
+        module_names += ["topology_generator.cutsheet_formats", "openpyxl"]
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+    if only in (None, "render"):
+        from topology_generator.render_environment import load_matplotlib
+
+        importlib.import_module("topology_generator.rendering")
+        load_matplotlib()
+
+
+def run_batch(
+    config_paths: Sequence[Path],
+    output_dir: str | PathLike[str],
+    workers: int | None = None,
+    options: BatchOptions = BatchOptions(),
+) -> list[BatchResult]:
+    """Generate every config into its own subdirectory of ``output_dir``.
+
+    Configs are processed in a pool of ``workers`` processes (``None`` means
+    one per CPU) forked from this warm interpreter; with one worker they run
+    here, one after another. Each config logs only to the
+    ``network_topology.log`` in its directory. A failing config is recorded
+    in its result and does not stop the others. Results are in input order.
+    """
+    tasks = list(zip(config_paths, batch_output_dirs(config_paths, output_dir)))
+    preload_modules(options.only)
+    run_config = partial(_run_config, options=options)
+    if resolve_worker_count(workers, len(tasks)) <= 1:
+        return [run_config(task) for task in tasks]
+
+    with ProcessPoolExecutor(
+        max_workers=resolve_worker_count(workers, len(tasks))
+    ) as executor:
+        return list(executor.map(run_config, tasks))
+
+
+def format_batch_summary(results: Sequence[BatchResult], total_seconds: float) -> str:
+    """Render one line per config plus a success count and total wall time."""
+    succeeded = sum(result.succeeded for result in results)
+    rows = [
+        (
+            "ok" if result.succeeded else "FAILED",
+            f"{result.seconds:.2f}s",
+            str(result.config_path),
+            str(result.output_dir) if result.error is None else result.error.splitlines()[0],
+        )
+        for result in results
+    ]
+    widths = [max(len(row[index]) for row in rows) for index in range(3)]
+    lines = [
+        f"Batch finished: {succeeded} of {len(results)} configs succeeded "
+        f"in {total_seconds:.2f}s"
+    ]
+    for status, seconds, config_path, detail in rows:
+        lines.append(
+            f"  {status.ljust(widths[0])}  {seconds.rjust(widths[1])}  "
+            f"{config_path.ljust(widths[2])}  {detail}"
+        )
+    return "\n".join(lines)
+
+
+def write_batch_summary(
+    results: Sequence[BatchResult],
+    total_seconds: float,
+    summary_path: str | PathLike[str],
+) -> None:
+    """Write the per-config outcomes and timings as JSON for CI tooling."""
+    summary = {
+        "succeeded": sum(result.succeeded for result in results),
+        "failed": sum(not result.succeeded for result in results),
+        "total_seconds": round(total_seconds, 3),
+        "configs": [
+            {
+                "config": str(result.config_path),
+                "output_dir": str(result.output_dir),
+                "succeeded": result.succeeded,
+                "seconds": round(result.seconds, 3),
+                "error": result.error,
+            }
+            for result in results
+        ],
+    }
+    Path(summary_path).write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+
+
+def run_batch_command(args: argparse.Namespace) -> list[BatchResult]:
+    """Run ``topology-generator batch`` from arguments of ``parse_batch_args``.
+
+    Prints the summary and writes it to ``batch_summary.json`` in the output
+    directory.
+
+    Raises:
+        SystemExit: If a pattern matches nothing or any config failed.
+    """
+    from topology_generator.file_handler import ensure_output_dir, resolve_output_dir
+
+    started = time.perf_counter()
+    try:
+        config_paths = expand_config_paths(args.configs)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+
+    output_dir = ensure_output_dir(resolve_output_dir(args.output_dir, args.timestamp))
+    results = run_batch(
+        config_paths,
+        output_dir,
+        args.workers,
+        BatchOptions(
+            output_format=args.output_format,
+            graph_backend=args.graph_backend,
+            jobs=args.jobs,
+            only=args.only,
+            cache=args.cache or args.cache_dir is not None,
+            cache_dir=args.cache_dir,
+        ),
+    )
+    total_seconds = time.perf_counter() - started
+    write_batch_summary(results, total_seconds, output_dir / SUMMARY_FILENAME)
+    print(format_batch_summary(results, total_seconds))
+
+    failed = sum(not result.succeeded for result in results)
+    if failed:
+        raise SystemExit(
+            f"{failed} of {len(results)} configs failed; "
+            "see network_topology.log in their output directories."
+        )
+    return results
+
+
+def _run_config(task: tuple[Path, Path], options: BatchOptions) -> BatchResult:
+    from topology_generator.config_cache import ConfigCache
+    from topology_generator.main import run_topology
+
+    config_path, output_dir = task
+    started = time.perf_counter()
+    try:
+        run_topology(
+            config_path,
+            output_dir,
+            output_format=options.output_format,
+            graph_backend=options.graph_backend,
+            jobs=options.jobs,
+            only=options.only,
+            cache=ConfigCache(options.cache_dir) if options.cache else None,
+            console=False,
+            started=started,
+        )
+    except Exception as exc:
+        return BatchResult(
+            config_path,
+            output_dir,
+            time.perf_counter() - started,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    return BatchResult(config_path, output_dir, time.perf_counter() - started)
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from topology_generator.config_identifiers import (
+    GPU_NODES_LAYER_NAME,
+    normalize_identifier,
+)
+from topology_generator.config_types import (
+    EffectiveFabricConfig,
+    LayerConfig,
+    LinkConfig,
+    TopologyConfig,
+    ensure_topology_config,
+)
+from topology_generator.validator import NodeUsage, TopologyValidationError
+
+
+@dataclass(frozen=True)
+class LayerCapacity:
+    """Closed-form demand of one fabric layer; every node in it is identical."""
+
+    fabric_name: str | None
+    layer: LayerConfig
+    node_count: int
+    scope_instance_count: int
+    usage: NodeUsage
+
+    def lane_utilization_for_pool(self, pool_name: str) -> float:
+        total_lane_units = self.layer.port_pool(pool_name).total_lane_units
+        return self.usage.required_lane_units_for_pool(pool_name) / total_lane_units
+
+
+@dataclass(frozen=True)
+class LinkCapacity:
+    """Closed-form cable counts for one configured link."""
+
+    fabric_name: str | None
+    link: LinkConfig
+    pair_count: int
+    source_lane_units_per_cable: int | None
+    target_lane_units_per_cable: int | None
+
+    @property
+    def cable_count(self) -> int:
+        return self.pair_count * self.link.cables_per_pair
+
+    @property
+    def total_bandwidth_gb(self) -> float:
+        return self.cable_count * self.link.cable_bandwidth_gb
+
+
+@dataclass(frozen=True)
+class TopologyCapacity:
+    config: TopologyConfig
+    layers: tuple[LayerCapacity, ...]
+    links: tuple[LinkCapacity, ...]
+
+    @property
+    def node_count(self) -> int:
+        """Physical node count; GPU nodes shared by every fabric count once."""
+        node_count = sum(
+            layer_capacity.node_count
+            for layer_capacity in self.layers
+            if not _is_shared_gpu_layer(self.config, layer_capacity)
+        )
+        if self.config.gpu_nodes is not None:
+            node_count += self.config.gpu_nodes.total_nodes
+        return node_count
+
+    @property
+    def cable_count(self) -> int:
+        return sum(link_capacity.cable_count for link_capacity in self.links)
+
+    def layer(self, fabric_name: str | None, layer_name: str) -> LayerCapacity:
+        for layer_capacity in self.layers:
+            if (
+                layer_capacity.fabric_name == fabric_name
+                and layer_capacity.layer.name == layer_name
+            ):
+                return layer_capacity
+        raise KeyError((fabric_name, layer_name))
+
+
+def analyze_topology_capacity(
+    config: TopologyConfig | dict[str, object],
+) -> TopologyCapacity:
+    """Compute per-layer lane and bandwidth demand from config arithmetic alone.
+
+    Every supported policy is a full mesh between scope instances, so each node
+    of a layer sees the same fan-out and fan-in. The cost is proportional to the
+    number of layers and links, not to the number of nodes or cables.
+    """
+    topology_config = ensure_topology_config(config)
+    layers: list[LayerCapacity] = []
+    links: list[LinkCapacity] = []
+    for fabric in topology_config.iter_fabrics():
+        fabric_layers, fabric_links = _analyze_fabric(topology_config, fabric)
+        layers.extend(fabric_layers)
+        links.extend(fabric_links)
+    return TopologyCapacity(
+        config=topology_config,
+        layers=tuple(layers),
+        links=tuple(links),
+    )
+
+
+def validate_topology_capacity(
+    config: TopologyConfig | dict[str, object],
+) -> TopologyCapacity:
+    """Validate port budgets without expanding the topology.
+
+    Raises the same ``TopologyValidationError`` messages as
+    ``validate_expanded_topology``. Node IDs are only generated for layers that
+    actually fail. As there, only port-pool capacity is checked: config
+    validation already rejects cable bandwidths a port pool cannot carry.
+    """
+    capacity = analyze_topology_capacity(config)
+    errors: list[str] = []
+
+    for layer_capacity in capacity.layers:
+        failing_pools = [
+            (port_pool, required_lane_units)
+            for port_pool in layer_capacity.layer.port_pools
+            if (
+                required_lane_units := layer_capacity.usage.required_lane_units_for_pool(
+                    port_pool.name
+                )
+            )
+            > port_pool.total_lane_units
+        ]
+        if not failing_pools:
+            continue
+        for node_id in _layer_node_ids(capacity.config, layer_capacity):
+            for port_pool, required_lane_units in failing_pools:
+                errors.append(
+                    f"{node_id} port pool {port_pool.name!r} requires "
+                    f"{required_lane_units} lane units but has "
+                    f"{port_pool.total_lane_units}"
+                )
+
+    if errors:
+        raise TopologyValidationError(errors)
+
+    return capacity
+
+
+def _analyze_fabric(
+    config: TopologyConfig,
+    fabric: EffectiveFabricConfig,
+) -> tuple[list[LayerCapacity], list[LinkCapacity]]:
+    scope_counts = {
+        layer.name: _scope_instance_count(config, fabric, layer) for layer in fabric.layers
+    }
+    lane_units_by_layer: dict[str, dict[str, int]] = {
+        layer.name: {} for layer in fabric.layers
+    }
+    bandwidth_up_by_layer = {layer.name: 0.0 for layer in fabric.layers}
+    bandwidth_down_by_layer = {layer.name: 0.0 for layer in fabric.layers}
+    links: list[LinkCapacity] = []
+
+    for link in fabric.links:
+        lower_layer = fabric.layer(link.from_layer)
+        upper_layer = fabric.layer(link.to_layer)
+        lower_node_count = scope_counts[lower_layer.name] * lower_layer.nodes_per_group
+        upper_scope_count = scope_counts[upper_layer.name]
+        # Each lower node meshes with every upper node of its containing scope,
+        # and each upper node with every lower node its scope contains.
+        fan_out = upper_layer.nodes_per_group if upper_scope_count else 0
+        fan_in = lower_node_count // upper_scope_count if upper_scope_count else 0
+
+        source_lane_units_per_cable = lower_layer.lane_units_for_pool_bandwidth(
+            link.port_pool,
+            link.cable_bandwidth_gb,
+        )
+        target_lane_units_per_cable = upper_layer.lane_units_for_pool_bandwidth(
+            link.port_pool,
+            link.cable_bandwidth_gb,
+        )
+        if link.cables_per_pair == 0:
+            links.append(
+                LinkCapacity(
+                    fabric_name=fabric.name,
+                    link=link,
+                    pair_count=0,
+                    source_lane_units_per_cable=source_lane_units_per_cable,
+                    target_lane_units_per_cable=target_lane_units_per_cable,
+                )
+            )
+            continue
+
+        links.append(
+            LinkCapacity(
+                fabric_name=fabric.name,
+                link=link,
+                pair_count=lower_node_count * fan_out,
+                source_lane_units_per_cable=source_lane_units_per_cable,
+                target_lane_units_per_cable=target_lane_units_per_cable,
+            )
+        )
+
+        normalized_pool_name = normalize_identifier(link.port_pool)
+        for layer, pair_count, lane_units_per_cable in (
+            (lower_layer, fan_out, source_lane_units_per_cable),
+            (upper_layer, fan_in, target_lane_units_per_cable),
+        ):
+            if lane_units_per_cable is None or pair_count == 0:
+                continue
+            pool_usage = lane_units_by_layer[layer.name]
+            pool_usage[normalized_pool_name] = pool_usage.get(normalized_pool_name, 0) + (
+                pair_count * link.cables_per_pair * lane_units_per_cable
+            )
+
+        bandwidth_up_by_layer[lower_layer.name] += (
+            fan_out * link.cables_per_pair * link.cable_bandwidth_gb
+        )
+        bandwidth_down_by_layer[upper_layer.name] += (
+            fan_in * link.cables_per_pair * link.cable_bandwidth_gb
+        )
+
+    layers = [
+        LayerCapacity(
+            fabric_name=fabric.name,
+            layer=layer,
+            node_count=scope_counts[layer.name] * layer.nodes_per_group,
+            scope_instance_count=scope_counts[layer.name],
+            usage=NodeUsage(
+                required_lane_units_by_pool=lane_units_by_layer[layer.name],
+                bandwidth_up_gb=bandwidth_up_by_layer[layer.name],
+                bandwidth_down_gb=bandwidth_down_by_layer[layer.name],
+            ),
+        )
+        for layer in fabric.layers
+    ]
+    return layers, links
+
+
+def _scope_instance_count(
+    config: TopologyConfig,
+    fabric: EffectiveFabricConfig,
+    layer: LayerConfig,
+) -> int:
+    if layer.placement == "global":
+        return 1
+    if fabric.name is None:
+        group = config.group()
+        return group.count if group else 0
+    return config.scope_instance_count(layer.placement)
+
+
+def _is_shared_gpu_layer(config: TopologyConfig, layer_capacity: LayerCapacity) -> bool:
+    return (
+        config.is_multi_fabric
+        and normalize_identifier(layer_capacity.layer.name) == GPU_NODES_LAYER_NAME
+    )
+
+
+def _layer_node_ids(
+    config: TopologyConfig,
+    layer_capacity: LayerCapacity,
+) -> tuple[str, ...]:
+    from topology_generator.expander import layer_node_ids
+
+    return layer_node_ids(config, layer_capacity.fabric_name, layer_capacity.layer)
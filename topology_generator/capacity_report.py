@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from topology_generator.capacity import TopologyCapacity
+
+
+def format_capacity_report(capacity: TopologyCapacity) -> str:
+    """Render the ``--check`` summary as plain-text tables.
+
+    Every figure comes from ``TopologyCapacity``, so the report costs the same
+    for a 100-node and a 100k-GPU design.
+    """
+    is_multi_fabric = capacity.config.is_multi_fabric
+    fabric_header = ("fabric",) if is_multi_fabric else ()
+    summary = (
+        f"Topology check passed: {capacity.node_count:,} nodes, "
+        f"{capacity.cable_count:,} cables"
+    )
+    if is_multi_fabric:
+        summary += f" across {len(capacity.config.fabric_names)} fabrics"
+
+    node_rows = [
+        (
+            *_fabric_cell(layer_capacity.fabric_name, is_multi_fabric),
+            layer_capacity.layer.name,
+            layer_capacity.layer.placement,
+            f"{layer_capacity.node_count:,}",
+        )
+        for layer_capacity in capacity.layers
+    ]
+
+    link_rows = [
+        (
+            *_fabric_cell(link_capacity.fabric_name, is_multi_fabric),
+            f"{link_capacity.link.from_layer} -> {link_capacity.link.to_layer}",
+            link_capacity.link.port_pool,
+            _format_number(link_capacity.link.cable_bandwidth_gb),
+            f"{link_capacity.cable_count:,}",
+        )
+        for link_capacity in capacity.links
+    ]
+
+    cables_by_bandwidth: dict[float, int] = {}
+    for link_capacity in capacity.links:
+        bandwidth_gb = link_capacity.link.cable_bandwidth_gb
+        cables_by_bandwidth[bandwidth_gb] = (
+            cables_by_bandwidth.get(bandwidth_gb, 0) + link_capacity.cable_count
+        )
+    bandwidth_rows = [
+        (
+            _format_number(bandwidth_gb),
+            f"{cable_count:,}",
+            _format_number(bandwidth_gb * cable_count),
+        )
+        for bandwidth_gb, cable_count in sorted(cables_by_bandwidth.items())
+    ]
+
+    utilization_rows = [
+        (
+            *_fabric_cell(layer_capacity.fabric_name, is_multi_fabric),
+            layer_capacity.layer.name,
+            port_pool.name,
+            f"{layer_capacity.usage.required_lane_units_for_pool(port_pool.name):,}"
+            f"/{port_pool.total_lane_units:,}",
+            f"{layer_capacity.lane_utilization_for_pool(port_pool.name):.1%}",
+        )
+        for layer_capacity in capacity.layers
+        for port_pool in layer_capacity.layer.port_pools
+    ]
+
+    sections = [
+        summary,
+        _format_table(
+            "Nodes per layer",
+            (*fabric_header, "layer", "placement", "nodes"),
+            node_rows,
+        ),
+        _format_table(
+            "Cables per link",
+            (*fabric_header, "link", "port pool", "GB/s", "cables"),
+            link_rows,
+        ),
+        _format_table(
+            "Cables per bandwidth class",
+            ("GB/s", "cables", "total GB/s"),
+            bandwidth_rows,
+        ),
+        _format_table(
+            "Lane utilization per node",
+            (*fabric_header, "layer", "port pool", "lane units", "utilization"),
+            utilization_rows,
+        ),
+    ]
+    return "\n\n".join(sections)
+
+
+def _fabric_cell(fabric_name: str | None, is_multi_fabric: bool) -> tuple[str, ...]:
+    return (fabric_name or "",) if is_multi_fabric else ()
+
+
+def _format_number(value: float) -> str:
+    if float(value).is_integer():
+        return f"{int(value):,}"
+    return f"{value:,g}"
+
+
+def _format_table(
+    title: str,
+    headers: Sequence[str],
+    rows: Sequence[Sequence[str]],
+) -> str:
+    widths = [
+        max(len(cell) for cell in column) for column in zip(headers, *rows, strict=True)
+    ]
+    # Columns whose every cell is a number are right-aligned.
+    numeric = [
+        bool(rows) and all(row[index][:1].isdigit() for row in rows)
+        for index in range(len(headers))
+    ]
+    lines = [title]
+    for row in (headers, *rows):
+        cells = [
+            cell.rjust(width) if is_numeric else cell.ljust(width)
+            for cell, width, is_numeric in zip(row, widths, numeric, strict=True)
+        ]
+        lines.append("  " + "  ".join(cells).rstrip())
+    return "\n".join(lines)
@@ -0,0 +1,604 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, Literal, overload
+
+import networkx as nx
+import numpy as np
+import numpy.typing as npt
+
+from topology_generator.expander import ExpandedTopology
+from topology_generator.graph_metadata import (
+    LinkBundleAttrs,
+    PortRange,
+    build_node_attrs,
+    build_shared_gpu_node_attrs,
+    check_known_fabric,
+    has_canonical_edge_order,
+    set_canonical_edge_order,
+)
+from topology_generator.validator import NodeUsageArrays
+
+
+EDGE_INDEX_DTYPE = np.int64
+NO_EXPANDED_NODE = -1
+
+
+@dataclass(frozen=True, eq=False)
+class CompactTopologyStore:
+    """CSR-style topology storage keyed by integer graph node ids.
+
+    Graph node ``i`` is ``node_ids[i]``. Node attributes are derived on demand
+    from the expanded topology columns and the usage arrays, so no per-node
+    dict is kept. Edges are stored as parallel ``edge_sources``/``edge_targets``
+    arrays, their bundles as a CSR slice of expanded link indexes, and the
+    adjacency as a CSR of ``(neighbor, edge)`` pairs.
+    """
+
+    expanded_topology: ExpandedTopology
+    usage: NodeUsageArrays
+    node_ids: tuple[str, ...]
+    node_indexes: dict[str, int]
+    node_expanded_indptr: npt.NDArray[np.int64]
+    node_expanded_indexes: npt.NDArray[np.int64]
+    edge_sources: npt.NDArray[np.int64]
+    edge_targets: npt.NDArray[np.int64]
+    edge_fabric_names: tuple[str | None, ...]
+    edge_bundle_indptr: npt.NDArray[np.int64]
+    edge_bundle_links: npt.NDArray[np.int64]
+    link_source_ports: npt.NDArray[np.int64]
+    link_target_ports: npt.NDArray[np.int64]
+    adjacency_indptr: npt.NDArray[np.int64]
+    adjacency_nodes: npt.NDArray[np.int64]
+    adjacency_edges: npt.NDArray[np.int64]
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_sources)
+
+    def expanded_indexes_for_node(self, node: int) -> npt.NDArray[np.int64]:
+        return self.node_expanded_indexes[
+            self.node_expanded_indptr[node] : self.node_expanded_indptr[node + 1]
+        ]
+
+    def expanded_node_attrs(self, expanded_index: int) -> dict[str, Any]:
+        expanded = self.expanded_topology
+        return build_node_attrs(
+            expanded,
+            expanded.layer_for_node(expanded_index),
+            expanded_index,
+            self.usage.node_usage(expanded, expanded_index),
+        )
+
+    def graph_node_attrs(self, node: int) -> dict[str, Any]:
+        expanded_indexes = self.expanded_indexes_for_node(node)
+        first_index = int(expanded_indexes[0])
+        node_attrs = self.expanded_node_attrs(first_index)
+        if not self.expanded_topology.layer_for_node(first_index).is_shared_gpu_node:
+            return node_attrs
+
+        attrs = build_shared_gpu_node_attrs(node_attrs)
+        fabric_metrics = {}
+        for expanded_index in expanded_indexes:
+            fabric_attrs = self.expanded_node_attrs(int(expanded_index))
+            fabric_metrics[fabric_attrs["fabric"]] = fabric_attrs
+        attrs["fabric_metrics"] = fabric_metrics
+        return attrs
+
+    def edge_attrs(self, edge: int) -> dict[str, Any]:
+        link_indexes = self.edge_bundle_links[
+            self.edge_bundle_indptr[edge] : self.edge_bundle_indptr[edge + 1]
+        ]
+        return {
+            "fabric": self.edge_fabric_names[edge],
+            "link_bundles": tuple(
+                self.link_bundle_attrs(int(link_index)) for link_index in link_indexes
+            ),
+        }
+
+    def link_bundle_attrs(self, link_index: int) -> LinkBundleAttrs:
+        expanded = self.expanded_topology
+        link = expanded.link_specs[int(expanded.link_spec_ids[link_index])]
+        return {
+            "port_pool": link.port_pool,
+            "source_ports": PortRange(
+                start=int(self.link_source_ports[link_index]),
+                stride=link.source_lane_units_per_cable,
+                length=link.num_cables,
+            ),
+            "target_ports": PortRange(
+                start=int(self.link_target_ports[link_index]),
+                stride=link.target_lane_units_per_cable,
+                length=link.num_cables,
+            ),
+            "num_cables": link.num_cables,
+            "cable_bandwidth_gb": link.cable_bandwidth_gb,
+            "source_lane_units_per_cable": link.source_lane_units_per_cable,
+            "target_lane_units_per_cable": link.target_lane_units_per_cable,
+            "fabric": link.fabric_name,
+        }
+
+
+class CompactTopologyGraph:
+    """Read-only, networkx-compatible adapter over a ``CompactTopologyStore``.
+
+    Supports the ``nx.Graph`` surface used by rendering and export: ``graph``,
+    ``nodes``/``edges`` views with ``data=True``, item lookup, ``neighbors``,
+    ``has_edge`` and ``copy``. Attribute dicts are rebuilt on every access, so
+    mutating them has no effect on the stored topology.
+    """
+
+    def __init__(
+        self,
+        store: CompactTopologyStore,
+        graph_attrs: dict[str, Any] | None = None,
+        node_expanded_indexes: npt.NDArray[np.int64] | None = None,
+        edge_mask: npt.NDArray[np.bool_] | None = None,
+    ):
+        self._store = store
+        self.graph: dict[str, Any] = dict(graph_attrs or {})
+        # Fabric views pin each graph node to one expanded node and hide the
+        # edges of other fabrics.
+        self._node_expanded_indexes = node_expanded_indexes
+        self._edge_mask = edge_mask
+
+    @property
+    def store(self) -> CompactTopologyStore:
+        return self._store
+
+    @property
+    def nodes(self) -> CompactNodeView:
+        return CompactNodeView(self)
+
+    @property
+    def edges(self) -> CompactEdgeView:
+        return CompactEdgeView(self)
+
+    def __iter__(self) -> Iterator[str]:
+        node_ids = self._store.node_ids
+        return (node_ids[node] for node in self._iter_node_indexes())
+
+    def __len__(self) -> int:
+        if self._node_expanded_indexes is None:
+            return self._store.num_nodes
+        return int(np.count_nonzero(self._node_expanded_indexes != NO_EXPANDED_NODE))
+
+    def __contains__(self, node_id: object) -> bool:
+        return self._node_index(node_id) is not None
+
+    def has_node(self, node_id: object) -> bool:
+        return node_id in self
+
+    def has_edge(self, source: str, target: str) -> bool:
+        return self._edge_index(source, target) is not None
+
+    def number_of_nodes(self) -> int:
+        return len(self)
+
+    def number_of_edges(self) -> int:
+        if self._edge_mask is None:
+            return self._store.num_edges
+        return int(np.count_nonzero(self._edge_mask))
+
+    def neighbors(self, node_id: str) -> Iterator[str]:
+        node = self._require_node_index(node_id)
+        store = self._store
+        start = store.adjacency_indptr[node]
+        stop = store.adjacency_indptr[node + 1]
+        for neighbor, edge in zip(
+            store.adjacency_nodes[start:stop].tolist(),
+            store.adjacency_edges[start:stop].tolist(),
+        ):
+            if self._has_edge_index(edge) and self._has_node_index(neighbor):
+                yield store.node_ids[neighbor]
+
+    def copy(self) -> CompactTopologyGraph:
+        return CompactTopologyGraph(
+            self._store,
+            self.graph,
+            self._node_expanded_indexes,
+            self._edge_mask,
+        )
+
+    def fabric_view(self, fabric_name: str) -> CompactTopologyGraph:
+        """Return the flattened single-fabric view, like ``get_fabric_view``."""
+        if not self.graph.get("is_multi_fabric"):
+            return self.copy()
+        check_known_fabric(tuple(self.graph.get("fabric_names", ())), fabric_name)
+
+        store = self._store
+        expanded = store.expanded_topology
+        node_expanded_indexes = np.full(
+            store.num_nodes,
+            NO_EXPANDED_NODE,
+            dtype=EDGE_INDEX_DTYPE,
+        )
+        graph_node_indexes = _graph_node_indexes(store)
+        for expanded_layer in expanded.layers:
+            if expanded_layer.fabric_name != fabric_name:
+                continue
+            node_range = np.arange(
+                expanded_layer.node_start,
+                expanded_layer.node_stop,
+                dtype=EDGE_INDEX_DTYPE,
+            )
+            node_expanded_indexes[graph_node_indexes[node_range]] = node_range
+
+        fabric_graph_attrs = dict(self.graph)
+        fabric_graph_attrs["is_multi_fabric"] = False
+        fabric_graph_attrs["fabric_names"] = ()
+        fabric_graph_attrs["fabric_name"] = fabric_name
+        edge_mask = np.fromiter(
+            (edge_fabric == fabric_name for edge_fabric in store.edge_fabric_names),
+            dtype=np.bool_,
+            count=store.num_edges,
+        )
+        fabric_view = CompactTopologyGraph(
+            store,
+            fabric_graph_attrs,
+            node_expanded_indexes,
+            edge_mask,
+        )
+        set_canonical_edge_order(fabric_view, has_canonical_edge_order(self))
+        return fabric_view
+
+    def to_networkx(self) -> nx.Graph:
+        graph = nx.Graph()
+        graph.graph.update(self.graph)
+        graph.add_nodes_from(self.nodes(data=True))
+        graph.add_edges_from(self.edges(data=True))
+        return graph
+
+    def _iter_node_indexes(self) -> Iterator[int]:
+        if self._node_expanded_indexes is None:
+            return iter(range(self._store.num_nodes))
+        return iter(
+            np.flatnonzero(self._node_expanded_indexes != NO_EXPANDED_NODE).tolist()
+        )
+
+    def _iter_edge_indexes(self) -> Iterator[int]:
+        if self._edge_mask is None:
+            return iter(range(self._store.num_edges))
+        return iter(np.flatnonzero(self._edge_mask).tolist())
+
+    def _has_node_index(self, node: int) -> bool:
+        return (
+            self._node_expanded_indexes is None
+            or self._node_expanded_indexes[node] != NO_EXPANDED_NODE
+        )
+
+    def _has_edge_index(self, edge: int) -> bool:
+        return self._edge_mask is None or bool(self._edge_mask[edge])
+
+    def _node_index(self, node_id: object) -> int | None:
+        if not isinstance(node_id, str):
+            return None
+        node = self._store.node_indexes.get(node_id)
+        if node is None or not self._has_node_index(node):
+            return None
+        return node
+
+    def _require_node_index(self, node_id: str) -> int:
+        node = self._node_index(node_id)
+        if node is None:
+            raise KeyError(node_id)
+        return node
+
+    def _edge_index(self, source: str, target: str) -> int | None:
+        source_node = self._node_index(source)
+        target_node = self._node_index(target)
+        if source_node is None or target_node is None:
+            return None
+        store = self._store
+        start = store.adjacency_indptr[source_node]
+        stop = store.adjacency_indptr[source_node + 1]
+        matches = np.flatnonzero(store.adjacency_nodes[start:stop] == target_node)
+        if not len(matches):
+            return None
+        edge = int(store.adjacency_edges[start + matches[0]])
+        return edge if self._has_edge_index(edge) else None
+
+    def _node_attrs(self, node: int) -> dict[str, Any]:
+        if self._node_expanded_indexes is None:
+            return self._store.graph_node_attrs(node)
+        return self._store.expanded_node_attrs(int(self._node_expanded_indexes[node]))
+
+
+class CompactNodeView:
+    def __init__(self, graph: CompactTopologyGraph):
+        self._graph = graph
+
+    @overload
+    def __call__(self, data: Literal[False] = False) -> Iterator[str]: ...
+
+    @overload
+    def __call__(self, data: Literal[True]) -> Iterator[tuple[str, dict[str, Any]]]: ...
+
+    def __call__(
+        self,
+        data: bool = False,
+    ) -> Iterator[str] | Iterator[tuple[str, dict[str, Any]]]:
+        if not data:
+            return iter(self)
+        node_ids = self._graph.store.node_ids
+        return (
+            (node_ids[node], self._graph._node_attrs(node))
+            for node in self._graph._iter_node_indexes()
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph)
+
+    def __len__(self) -> int:
+        return len(self._graph)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._graph
+
+    def __getitem__(self, node_id: str) -> dict[str, Any]:
+        return self._graph._node_attrs(self._graph._require_node_index(node_id))
+
+
+class CompactEdgeView:
+    def __init__(self, graph: CompactTopologyGraph):
+        self._graph = graph
+
+    @overload
+    def __call__(self, data: Literal[False] = False) -> Iterator[tuple[str, str]]: ...
+
+    @overload
+    def __call__(
+        self,
+        data: Literal[True],
+    ) -> Iterator[tuple[str, str, dict[str, Any]]]: ...
+
+    def __call__(
+        self,
+        data: bool = False,
+    ) -> Iterator[tuple[str, str]] | Iterator[tuple[str, str, dict[str, Any]]]:
+        if not data:
+            return iter(self)
+        store = self._graph.store
+        return (
+            (
+                store.node_ids[int(store.edge_sources[edge])],
+                store.node_ids[int(store.edge_targets[edge])],
+                store.edge_attrs(edge),
+            )
+            for edge in self._graph._iter_edge_indexes()
+        )
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        store = self._graph.store
+        return (
+            (
+                store.node_ids[int(store.edge_sources[edge])],
+                store.node_ids[int(store.edge_targets[edge])],
+            )
+            for edge in self._graph._iter_edge_indexes()
+        )
+
+    def __len__(self) -> int:
+        return self._graph.number_of_edges()
+
+    def __contains__(self, edge: object) -> bool:
+        if not isinstance(edge, tuple) or len(edge) != 2:
+            return False
+        return self._graph.has_edge(*edge)
+
+    def __getitem__(self, edge: tuple[str, str]) -> dict[str, Any]:
+        edge_index = self._graph._edge_index(*edge)
+        if edge_index is None:
+            raise KeyError(edge)
+        return self._graph.store.edge_attrs(edge_index)
+
+
+def build_compact_graph(
+    expanded_topology: ExpandedTopology,
+    usage: NodeUsageArrays,
+    graph_attrs: dict[str, Any] | None = None,
+) -> CompactTopologyGraph:
+    """Build the compact backend with the same nodes, edges and ports as the nx one."""
+    return CompactTopologyGraph(
+        build_compact_store(expanded_topology, usage),
+        graph_attrs,
+    )
+
+
+def build_compact_store(
+    expanded_topology: ExpandedTopology,
+    usage: NodeUsageArrays,
+) -> CompactTopologyStore:
+    node_indexes: dict[str, int] = {}
+    graph_node_indexes = np.fromiter(
+        (
+            node_indexes.setdefault(graph_node_id, len(node_indexes))
+            for graph_node_id in expanded_topology.graph_node_ids
+        ),
+        dtype=EDGE_INDEX_DTYPE,
+        count=expanded_topology.num_nodes,
+    )
+    num_nodes = len(node_indexes)
+    node_expanded_indptr = _indptr(graph_node_indexes, num_nodes)
+    node_expanded_indexes = np.argsort(graph_node_indexes, kind="stable")
+
+    link_sources = graph_node_indexes[expanded_topology.link_source_indexes]
+    link_targets = graph_node_indexes[expanded_topology.link_target_indexes]
+    link_fabric_ids = _link_fabric_ids(expanded_topology)
+    fabric_names = _fabric_names(expanded_topology)
+
+    # Undirected edges are keyed on (earlier node, later node). networkx yields
+    # them from the earlier node, in order of first creation.
+    lower_nodes = np.minimum(link_sources, link_targets)
+    upper_nodes = np.maximum(link_sources, link_targets)
+    edge_keys = lower_nodes * num_nodes + upper_nodes
+    _, first_links, link_edge_keys = np.unique(
+        edge_keys,
+        return_index=True,
+        return_inverse=True,
+    )
+    edge_order = np.lexsort((first_links, lower_nodes[first_links]))
+    edge_ranks = np.empty_like(edge_order)
+    edge_ranks[edge_order] = np.arange(len(edge_order))
+    link_edges = edge_ranks[link_edge_keys.reshape(-1)]
+    edge_first_links = first_links[edge_order]
+    num_edges = len(edge_order)
+
+    edge_fabric_ids = link_fabric_ids[edge_first_links]
+    mixed_links = np.flatnonzero(link_fabric_ids != edge_fabric_ids[link_edges])
+    if len(mixed_links):
+        link_index = int(mixed_links[0])
+        edge = int(link_edges[link_index])
+        source_node_id = expanded_topology.graph_node_ids[
+            int(expanded_topology.link_source_indexes[int(edge_first_links[edge])])
+        ]
+        target_node_id = expanded_topology.graph_node_ids[
+            int(expanded_topology.link_target_indexes[int(edge_first_links[edge])])
+        ]
+        raise ValueError(
+            f"Cannot merge link bundles across fabrics on edge "
+            f"{source_node_id!r} <-> {target_node_id!r}: "
+            f"{fabric_names[int(edge_fabric_ids[edge])]!r} vs "
+            f"{fabric_names[int(link_fabric_ids[link_index])]!r}."
+        )
+
+    edge_sources = lower_nodes[edge_first_links]
+    edge_targets = upper_nodes[edge_first_links]
+    adjacency_owners = np.concatenate((edge_sources, edge_targets))
+    adjacency_nodes = np.concatenate((edge_targets, edge_sources))
+    adjacency_edges = np.concatenate((np.arange(num_edges), np.arange(num_edges)))
+    adjacency_order = np.lexsort(
+        (np.concatenate((edge_first_links, edge_first_links)), adjacency_owners)
+    )
+
+    link_source_ports, link_target_ports = _allocate_link_ports(expanded_topology)
+
+    return CompactTopologyStore(
+        expanded_topology=expanded_topology,
+        usage=usage,
+        node_ids=tuple(node_indexes),
+        node_indexes=node_indexes,
+        node_expanded_indptr=node_expanded_indptr,
+        node_expanded_indexes=node_expanded_indexes,
+        edge_sources=edge_sources,
+        edge_targets=edge_targets,
+        edge_fabric_names=tuple(
+            fabric_names[fabric_id] for fabric_id in edge_fabric_ids.tolist()
+        ),
+        edge_bundle_indptr=_indptr(link_edges, num_edges),
+        edge_bundle_links=np.argsort(link_edges, kind="stable"),
+        link_source_ports=link_source_ports,
+        link_target_ports=link_target_ports,
+        adjacency_indptr=_indptr(adjacency_owners, num_nodes),
+        adjacency_nodes=adjacency_nodes[adjacency_order],
+        adjacency_edges=adjacency_edges[adjacency_order],
+    )
+
+
+def _allocate_link_ports(
+    expanded_topology: ExpandedTopology,
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Vectorized equivalent of ``ContiguousLaneAllocator`` over all bundles.
+
+    Each ``(node, pool)`` hands out lanes in bundle order, so the first lane of
+    a bundle end is one plus the lanes consumed by earlier bundles at that end.
+    """
+    link_specs = expanded_topology.link_specs
+    num_links = len(expanded_topology.link_spec_ids)
+    if not num_links:
+        empty = np.zeros(0, dtype=EDGE_INDEX_DTYPE)
+        return empty, empty.copy()
+
+    layers = expanded_topology.layers
+    spec_ids = expanded_topology.link_spec_ids
+    source_lanes = np.array(
+        [spec.num_cables * spec.source_lane_units_per_cable for spec in link_specs],
+        dtype=EDGE_INDEX_DTYPE,
+    )[spec_ids]
+    target_lanes = np.array(
+        [spec.num_cables * spec.target_lane_units_per_cable for spec in link_specs],
+        dtype=EDGE_INDEX_DTYPE,
+    )[spec_ids]
+    source_offsets = np.array(
+        [
+            layers[spec.source_layer_id].layer.port_pool_offset(spec.port_pool)
+            for spec in link_specs
+        ],
+        dtype=EDGE_INDEX_DTYPE,
+    )[spec_ids]
+    target_offsets = np.array(
+        [
+            layers[spec.target_layer_id].layer.port_pool_offset(spec.port_pool)
+            for spec in link_specs
+        ],
+        dtype=EDGE_INDEX_DTYPE,
+    )[spec_ids]
+
+    pool_slots = expanded_topology.link_pool_ids.astype(EDGE_INDEX_DTYPE) * (
+        expanded_topology.num_nodes
+    )
+    slots = np.concatenate(
+        (
+            pool_slots + expanded_topology.link_source_indexes,
+            pool_slots + expanded_topology.link_target_indexes,
+        )
+    )
+    consumed = np.concatenate((source_lanes, target_lanes))
+    link_order = np.concatenate((np.arange(num_links), np.arange(num_links)))
+
+    order = np.lexsort((link_order, slots))
+    sorted_slots = slots[order]
+    sorted_consumed = consumed[order]
+    lanes_before = np.cumsum(sorted_consumed) - sorted_consumed
+    is_slot_start = np.empty(len(order), dtype=np.bool_)
+    is_slot_start[0] = True
+    is_slot_start[1:] = sorted_slots[1:] != sorted_slots[:-1]
+    slot_start_positions = np.maximum.accumulate(
+        np.where(is_slot_start, np.arange(len(order)), 0)
+    )
+    first_lanes = np.empty(len(order), dtype=EDGE_INDEX_DTYPE)
+    first_lanes[order] = lanes_before - lanes_before[slot_start_positions] + 1
+
+    return (
+        first_lanes[:num_links] + source_offsets,
+        first_lanes[num_links:] + target_offsets,
+    )
+
+
+def _graph_node_indexes(store: CompactTopologyStore) -> npt.NDArray[np.int64]:
+    graph_node_indexes = np.empty(
+        store.expanded_topology.num_nodes,
+        dtype=EDGE_INDEX_DTYPE,
+    )
+    graph_node_indexes[store.node_expanded_indexes] = np.repeat(
+        np.arange(store.num_nodes),
+        np.diff(store.node_expanded_indptr),
+    )
+    return graph_node_indexes
+
+
+def _fabric_names(expanded_topology: ExpandedTopology) -> tuple[str | None, ...]:
+    return tuple(dict.fromkeys(spec.fabric_name for spec in expanded_topology.link_specs))
+
+
+def _link_fabric_ids(expanded_topology: ExpandedTopology) -> npt.NDArray[np.int64]:
+    fabric_ids = {
+        fabric_name: fabric_id
+        for fabric_id, fabric_name in enumerate(_fabric_names(expanded_topology))
+    }
+    spec_fabric_ids = np.array(
+        [fabric_ids[spec.fabric_name] for spec in expanded_topology.link_specs],
+        dtype=EDGE_INDEX_DTYPE,
+    )
+    return spec_fabric_ids[expanded_topology.link_spec_ids]
+
+
+def _indptr(owners: npt.NDArray[np.int64], size: int) -> npt.NDArray[np.int64]:
+    indptr = np.zeros(size + 1, dtype=EDGE_INDEX_DTYPE)
+    np.cumsum(np.bincount(owners, minlength=size), out=indptr[1:])
+    return indptr
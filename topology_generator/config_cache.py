@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import suppress
+from functools import lru_cache
+from importlib import metadata
+from itertools import chain
+from os import PathLike
+from pathlib import Path
+from typing import TypeVar
+
+from topology_generator.config_types import TopologyConfig
+from topology_generator.expander import ExpandedTopology, expand_topology
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "TOPOLOGY_GENERATOR_CACHE_DIR"
+DEFAULT_MAX_CACHE_BYTES = 256 * 2**20
+CONFIG_SUFFIX = ".config.pickle"
+EXPANDED_SUFFIX = ".expanded.pickle"
+# Bump when the layout of the cached objects changes without a version bump.
+CACHE_FORMAT_VERSION = 1
+
+_CachedT = TypeVar("_CachedT")
+
+
+def default_cache_dir() -> Path:
+    """Return ``$TOPOLOGY_GENERATOR_CACHE_DIR`` or the user's XDG cache directory."""
+    if cache_dir := os.environ.get(CACHE_DIR_ENV):
+        return Path(cache_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "topology_generator"
+
+
+def package_version() -> str:
+    try:
+        return metadata.version("topology_generator")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=1)
+def package_source_digest() -> str:
+    """Return a hash of the package's Python sources, computed once per process.
+
+    Editable installs and source checkouts keep their version string while
+    the code changes, so the version alone cannot tell stale entries apart.
+    """
+    package_dir = Path(__file__).resolve().parent
+    digest = hashlib.sha256()
+    for source_path in sorted(package_dir.rglob("*.py")):
+        digest.update(source_path.relative_to(package_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+class ConfigCache:
+    """Content-addressed on-disk cache of parsed and validated configs.
+
+    Entries are keyed by a hash of the YAML bytes, the package version, a
+    hash of the package sources and the Python version, so an edited config,
+    an upgraded package or a modified checkout never sees a stale entry. The validated ``TopologyConfig`` and, optionally, its
+    ``ExpandedTopology`` are separate pickle files. A hit refreshes the
+    file's modification time, and once the directory grows past
+    ``max_bytes`` the least recently used files are deleted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | PathLike[str] | None = None,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    ):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def key_for(self, content: bytes) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            str(CACHE_FORMAT_VERSION),
+            package_version(),
+            package_source_digest(),
+            f"{sys.version_info.major}.{sys.version_info.minor}",
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get_config(self, content: bytes) -> TopologyConfig | None:
+        """Return the cached config for these YAML bytes, if any."""
+        return self._load(self._entry_path(content, CONFIG_SUFFIX), TopologyConfig)
+
+    def put_config(self, content: bytes, config: TopologyConfig) -> None:
+        """Cache ``config`` as the validated result of these YAML bytes."""
+        self._store(self._entry_path(content, CONFIG_SUFFIX), config)
+
+    def expand(
+        self,
+        config_path: str | PathLike[str],
+        config: TopologyConfig,
+    ) -> ExpandedTopology:
+        """Return the expansion of ``config``, from the cache when possible.
+
+        The expansion is stored in its own entry, so config-only hits never
+        load it. ``config`` must have been loaded from ``config_path``; if the
+        file changed since, the expansion is computed but not cached.
+        """
+        content = Path(config_path).read_bytes()
+        if self.get_config(content) != config:
+            return expand_topology(config)
+
+        expanded_path = self._entry_path(content, EXPANDED_SUFFIX)
+        expanded_topology = self._load(expanded_path, ExpandedTopology)
+        if expanded_topology is None:
+            expanded_topology = expand_topology(config)
+            self._store(expanded_path, expanded_topology)
+        return expanded_topology
+
+    def get(self, key: str, suffix: str, expected_type: type[_CachedT]) -> _CachedT | None:
+        """Return the ``expected_type`` entry stored under ``key`` and ``suffix``.
+
+        ``key`` should come from ``key_for``. Used for artifacts derived from
+        a config, such as the per-fabric outputs of ``incremental``.
+        """
+        return self._load(self.cache_dir / f"{key}{suffix}", expected_type)
+
+    def put(self, key: str, suffix: str, entry: object) -> None:
+        """Store ``entry`` under ``key`` and ``suffix``; see ``get``."""
+        self._store(self.cache_dir / f"{key}{suffix}", entry)
+
+    def get_chunks(
+        self,
+        key: str,
+        suffix: str,
+        header_type: type[_CachedT],
+    ) -> tuple[_CachedT, Iterator[object]] | None:
+        """Return the header and remaining chunks of an entry from ``put_chunks``.
+
+        The chunks are unpickled one at a time as the iterator advances. The
+        file is opened before returning, so a later eviction cannot remove it
+        mid-read.
+        """
+        entry_path = self.cache_dir / f"{key}{suffix}"
+        chunks = _iter_pickles(entry_path)
+        try:
+            header = next(chunks)
+        except OSError:
+            return None
+        except (pickle.UnpicklingError, StopIteration, AttributeError, ImportError):
+            logger.warning("Discarding unreadable config cache entry %s", entry_path)
+            header = None
+        if not isinstance(header, header_type):
+            chunks.close()
+            with suppress(OSError):
+                entry_path.unlink(missing_ok=True)
+            return None
+        with suppress(OSError):
+            os.utime(entry_path)
+        return header, chunks
+
+    def put_chunks(
+        self,
+        key: str,
+        suffix: str,
+        header: object,
+        chunks: Iterable[object],
+    ) -> None:
+        """Store ``header`` and then each of ``chunks`` as consecutive pickles.
+
+        The entry is written as ``chunks`` is consumed, so it never has to
+        fit in memory at once; see ``get_chunks``.
+        """
+        self._store_pickles(self.cache_dir / f"{key}{suffix}", chain((header,), chunks))
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        for entry_path in self.cache_dir.glob("*.pickle"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def _entry_path(self, content: bytes, suffix: str) -> Path:
+        return self.cache_dir / f"{self.key_for(content)}{suffix}"
+
+    def _load(self, entry_path: Path, expected_type: type[_CachedT]) -> _CachedT | None:
+        try:
+            with entry_path.open("rb") as handle:
+                entry = pickle.load(handle)
+        except OSError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            logger.warning("Discarding unreadable config cache entry %s", entry_path)
+            entry = None
+        if not isinstance(entry, expected_type):
+            with suppress(OSError):
+                entry_path.unlink(missing_ok=True)
+            return None
+        # The modification time doubles as the last-used time for eviction.
+        with suppress(OSError):
+            os.utime(entry_path)
+        return entry
+
+    def _store(self, entry_path: Path, entry: object) -> None:
+        self._store_pickles(entry_path, (entry,))
+
+    def _store_pickles(self, entry_path: Path, entries: Iterable[object]) -> None:
+        # The cache is an optimization; a read-only or full disk must never
+        # fail the run.
+        temporary_path: Path | None = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write beside the final path and rename, so concurrent runs never
+            # read a partly written entry.
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir,
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                temporary_path = Path(handle.name)
+                for entry in entries:
+                    pickle.dump(entry, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, entry_path)
+            temporary_path = None
+            self.evict()
+        except OSError as exc:
+            logger.warning("Could not write config cache entry %s: %s", entry_path, exc)
+        finally:
+            if temporary_path is not None:
+                temporary_path.unlink(missing_ok=True)
+
+
+def _iter_pickles(entry_path: Path) -> Generator[object, None, None]:
+    with entry_path.open("rb") as handle:
+        while True:
+            try:
+                yield pickle.load(handle)
+            except EOFError:
+                return
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
+import sys
 from decimal import Decimal
+from functools import lru_cache
 
 
 SUPPORTED_LINK_POLICIES = {
@@ -19,17 +21,49 @@ LEGACY_LAYER_PORT_KEYS = {
 GPU_NODES_LAYER_NAME = "gpu_nodes"
 DEFAULT_SINGLE_FABRIC_NAME = "default"
 
+# Config names, pool names, and group labels repeat heavily; the bound only
+# guards against unbounded growth from long-lived processes.
+NORMALIZED_IDENTIFIER_CACHE_SIZE = 4096
+
+_NON_IDENTIFIER_CHARS = re.compile(r"[^a-zA-Z0-9]+")
+_REPEATED_UNDERSCORES = re.compile(r"_+")
+
 
 def bandwidth_decimal(value: float) -> Decimal:
     """Convert a numeric bandwidth into a stable decimal representation."""
     return Decimal(str(value)).normalize()
 
 
+@lru_cache(maxsize=NORMALIZED_IDENTIFIER_CACHE_SIZE)
 def normalize_identifier(name: str) -> str:
     """Normalize YAML labels into stable identifiers for groups, fabrics, and nodes."""
-    normalized = re.sub(r"[^a-zA-Z0-9]+", "_", name.strip().lower())
-    normalized = re.sub(r"_+", "_", normalized)
-    return normalized.strip("_")
+    normalized = _NON_IDENTIFIER_CHARS.sub("_", name.strip().lower())
+    normalized = _REPEATED_UNDERSCORES.sub("_", normalized)
+    return sys.intern(normalized.strip("_"))
+
+
+def grouped_node_id_stem(group_name: str, group_index: int, layer_name: str) -> str:
+    """Build the ordinal-free prefix shared by one grouped layer instance."""
+    return f"{normalize_identifier(group_name)}_{group_index}_{normalize_identifier(layer_name)}"
+
+
+def group_label_node_id_stem(group_label: str, layer_name: str) -> str:
+    """Build the ordinal-free prefix shared by one resolved grouping label."""
+    return f"{normalize_identifier(group_label)}_{normalize_identifier(layer_name)}"
+
+
+def global_node_id_stem(layer_name: str) -> str:
+    """Build the ordinal-free prefix shared by a global layer."""
+    return normalize_identifier(layer_name)
+
+
+def build_node_id(stem: str, node_ordinal: int) -> str:
+    """Append a node ordinal to a node-ID stem.
+
+    Ordinals never contain ``_``, so every node ID splits back into exactly one
+    ``(stem, ordinal)`` pair.
+    """
+    return sys.intern(f"{stem}_{node_ordinal}")
 
 
 def build_grouped_node_id(
@@ -39,9 +73,9 @@ def build_grouped_node_id(
     node_ordinal: int,
 ) -> str:
     """Build a stable node ID for a single-fabric grouped layer instance."""
-    return (
-        f"{normalize_identifier(group_name)}_{group_index}_"
-        f"{normalize_identifier(layer_name)}_{node_ordinal}"
+    return build_node_id(
+        grouped_node_id_stem(group_name, group_index, layer_name),
+        node_ordinal,
     )
 
 
@@ -51,17 +85,14 @@ def build_group_label_node_id(
     node_ordinal: int,
 ) -> str:
     """Build a stable node ID for a resolved grouping label."""
-    return (
-        f"{normalize_identifier(group_label)}_"
-        f"{normalize_identifier(layer_name)}_{node_ordinal}"
-    )
+    return build_node_id(group_label_node_id_stem(group_label, layer_name), node_ordinal)
 
 
 def build_global_node_id(layer_name: str, node_ordinal: int) -> str:
     """Build a stable node ID for a global layer instance."""
-    return f"{normalize_identifier(layer_name)}_{node_ordinal}"
+    return build_node_id(global_node_id_stem(layer_name), node_ordinal)
 
 
 def build_fabric_qualified_node_id(fabric_name: str, node_id: str) -> str:
     """Build a fabric-qualified node ID that cannot collide across fabrics."""
-    return f"{normalize_identifier(fabric_name)}__{node_id}"
+    return sys.intern(f"{normalize_identifier(fabric_name)}__{node_id}")
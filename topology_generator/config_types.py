@@ -302,6 +302,121 @@ class EffectiveFabricConfig:
         raise KeyError(layer_ref)
 
 
+@dataclass(frozen=True)
+class ScopeChain:
+    """Precomputed scope path for every instance of one grouping.
+
+    ``scope_names`` and ``group_sizes`` run from the outermost grouping down to
+    ``grouping`` itself. Instance ``i`` covers physical ordinals
+    ``i * grouping.members_per_group + 1`` onwards.
+    """
+
+    grouping: GroupingConfig
+    scope_names: tuple[str, ...]
+    group_sizes: tuple[int, ...]
+    scope_indexes: tuple[tuple[int, ...], ...]
+    scope_labels: tuple[tuple[str, ...], ...]
+    scope_keys: tuple[tuple[tuple[str, int], ...], ...]
+
+    @property
+    def instance_count(self) -> int:
+        return len(self.scope_indexes)
+
+    def instance_for_ordinal(self, physical_ordinal: int) -> int:
+        return (physical_ordinal - 1) // self.grouping.members_per_group
+
+
+@dataclass(frozen=True)
+class ScopeIndex:
+    """Immutable lookup from grouping name to its precomputed ``ScopeChain``."""
+
+    chains: tuple[ScopeChain, ...]
+    _chains_by_name: Mapping[str, ScopeChain] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        chains_by_name: dict[str, ScopeChain] = {}
+        for chain in self.chains:
+            chains_by_name.setdefault(chain.grouping.name, chain)
+        for chain in self.chains:
+            chains_by_name.setdefault(normalize_identifier(chain.grouping.name), chain)
+        object.__setattr__(self, "_chains_by_name", chains_by_name)
+
+    @classmethod
+    def build(
+        cls,
+        groupings: tuple[GroupingConfig, ...],
+        total_nodes: int,
+    ) -> ScopeIndex:
+        nesting_order = sorted(
+            groupings,
+            key=lambda item: item.members_per_group,
+            reverse=True,
+        )
+        return cls(
+            chains=tuple(
+                _build_scope_chain(
+                    grouping,
+                    tuple(
+                        candidate
+                        for candidate in nesting_order
+                        if candidate.members_per_group >= grouping.members_per_group
+                    ),
+                    total_nodes,
+                )
+                for grouping in groupings
+            )
+        )
+
+    def chain(self, scope_name: str) -> ScopeChain:
+        chain = self._chains_by_name.get(scope_name)
+        if chain is None:
+            chain = self._chains_by_name.get(normalize_identifier(scope_name))
+        if chain is None:
+            raise KeyError(scope_name)
+        return chain
+
+
+def _build_scope_chain(
+    grouping: GroupingConfig,
+    ancestors: tuple[GroupingConfig, ...],
+    total_nodes: int,
+) -> ScopeChain:
+    scope_names = tuple(ancestor.name for ancestor in ancestors)
+    group_sizes = tuple(ancestor.members_per_group for ancestor in ancestors)
+    scope_indexes: list[tuple[int, ...]] = []
+    scope_labels: list[tuple[str, ...]] = []
+    scope_keys: list[tuple[tuple[str, int], ...]] = []
+    for instance in range(total_nodes // grouping.members_per_group):
+        zero_based_ordinal = instance * grouping.members_per_group
+        indexes: list[int] = []
+        labels: list[str] = []
+        previous_group_size: int | None = None
+        for scope_name, group_size in zip(scope_names, group_sizes, strict=True):
+            if previous_group_size is None:
+                local_index = (zero_based_ordinal // group_size) + 1
+            else:
+                local_index = ((zero_based_ordinal % previous_group_size) // group_size) + 1
+            part = f"{scope_name}_{local_index}"
+            labels.append(f"{labels[-1]}_{part}" if labels else part)
+            indexes.append(local_index)
+            previous_group_size = group_size
+        scope_indexes.append(tuple(indexes))
+        scope_labels.append(tuple(labels))
+        scope_keys.append(tuple(zip(scope_names, indexes, strict=True)))
+    return ScopeChain(
+        grouping=grouping,
+        scope_names=scope_names,
+        group_sizes=group_sizes,
+        scope_indexes=tuple(scope_indexes),
+        scope_labels=tuple(scope_labels),
+        scope_keys=tuple(scope_keys),
+    )
+
+
 @dataclass(frozen=True)
 class TopologyConfig(Mapping[str, Any]):
     """Validated topology configuration with dict-like compatibility."""
@@ -312,6 +427,17 @@ class TopologyConfig(Mapping[str, Any]):
     links: tuple[LinkConfig, ...]
     fabrics: tuple[FabricConfig, ...] = ()
     gpu_nodes: GpuNodesConfig | None = None
+    _scope_index: ScopeIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_scope_index",
+            ScopeIndex.build(
+                self.groupings,
+                self.gpu_nodes.total_nodes if self.gpu_nodes is not None else 0,
+            ),
+        )
 
     @classmethod
     def from_mapping(cls, raw_config: Mapping[str, Any] | Any) -> "TopologyConfig":
@@ -332,70 +458,47 @@ class TopologyConfig(Mapping[str, Any]):
     def group(self) -> GroupConfig | None:
         return self.groups[0] if self.groups else None
 
+    @property
+    def scope_index(self) -> ScopeIndex:
+        return self._scope_index
+
     def grouping(self, grouping_name: str) -> GroupingConfig:
-        normalized_grouping_name = normalize_identifier(grouping_name)
-        for grouping in self.groupings:
-            if normalize_identifier(grouping.name) == normalized_grouping_name:
-                return grouping
-        raise KeyError(grouping_name)
+        return self._scope_index.chain(grouping_name).grouping
 
     def grouping_count(self, grouping_name: str) -> int:
         if self.gpu_nodes is None:
             raise KeyError(grouping_name)
-        return self.gpu_nodes.total_nodes // self.grouping(grouping_name).members_per_group
+        return self._scope_index.chain(grouping_name).instance_count
 
     def scope_instance_count(self, scope_name: str) -> int:
         return self.grouping_count(scope_name)
 
     def scope_names_for_scope(self, scope_name: str) -> tuple[str, ...]:
-        grouping = self.grouping(scope_name)
-        return tuple(group.name for group in self._grouping_chain(grouping))
+        return self._scope_index.chain(scope_name).scope_names
 
     def scope_indexes_for_ordinal(
         self,
         scope_name: str,
         physical_ordinal: int,
     ) -> tuple[int, ...]:
-        grouping = self.grouping(scope_name)
-        zero_based_ordinal = physical_ordinal - 1
-        scope_indexes: list[int] = []
-        previous_group_size: int | None = None
-        for ancestor in self._grouping_chain(grouping):
-            if previous_group_size is None:
-                local_index = (zero_based_ordinal // ancestor.members_per_group) + 1
-            else:
-                local_index = (
-                    (zero_based_ordinal % previous_group_size)
-                    // ancestor.members_per_group
-                ) + 1
-            scope_indexes.append(local_index)
-            previous_group_size = ancestor.members_per_group
-        return tuple(scope_indexes)
+        chain = self._scope_index.chain(scope_name)
+        return chain.scope_indexes[chain.instance_for_ordinal(physical_ordinal)]
 
     def scope_labels_for_ordinal(
         self,
         scope_name: str,
         physical_ordinal: int,
     ) -> tuple[str, ...]:
-        scope_names = self.scope_names_for_scope(scope_name)
-        scope_indexes = self.scope_indexes_for_ordinal(scope_name, physical_ordinal)
-        labels: list[str] = []
-        for offset in range(1, len(scope_names) + 1):
-            parts = [
-                f"{scope_names[index]}_{scope_indexes[index]}"
-                for index in range(offset)
-            ]
-            labels.append("_".join(parts))
-        return tuple(labels)
+        chain = self._scope_index.chain(scope_name)
+        return chain.scope_labels[chain.instance_for_ordinal(physical_ordinal)]
 
     def scope_key_for_ordinal(
         self,
         scope_name: str,
         physical_ordinal: int,
     ) -> tuple[tuple[str, int], ...]:
-        scope_names = self.scope_names_for_scope(scope_name)
-        scope_indexes = self.scope_indexes_for_ordinal(scope_name, physical_ordinal)
-        return tuple(zip(scope_names, scope_indexes, strict=True))
+        chain = self._scope_index.chain(scope_name)
+        return chain.scope_keys[chain.instance_for_ordinal(physical_ordinal)]
 
     def group_label_for_group(self, grouping_name: str, group_index: int) -> str:
         grouping = self.grouping(grouping_name)
@@ -469,17 +572,6 @@ class TopologyConfig(Mapping[str, Any]):
             for fabric in self.fabrics
         )
 
-    def _grouping_chain(self, grouping: GroupingConfig) -> tuple[GroupingConfig, ...]:
-        return tuple(
-            candidate
-            for candidate in sorted(
-                self.groupings,
-                key=lambda item: item.members_per_group,
-                reverse=True,
-            )
-            if candidate.members_per_group >= grouping.members_per_group
-        )
-
     def _validate_semantics(self) -> None:
         from topology_generator.config_validation import validate_topology_config
 
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 
 from topology_generator.config_identifiers import (
     GPU_NODES_LAYER_NAME,
     SUPPORTED_LINK_POLICIES,
     build_fabric_qualified_node_id,
-    build_global_node_id,
-    build_group_label_node_id,
-    build_grouped_node_id,
+    build_node_id,
+    global_node_id_stem,
+    group_label_node_id_stem,
+    grouped_node_id_stem,
     normalize_identifier,
 )
 from topology_generator.config_types import (
@@ -422,72 +423,86 @@ def _validate_expanded_node_id_uniqueness(
     layers: Sequence[LayerConfig],
     fabric_name: str | None = None,
 ) -> None:
-    seen_node_ids: dict[str, str] = {}
-    group = config.group()
-    single_fabric_group_indexes = range(1, group.count + 1) if group else ()
+    """Reject configs whose expanded node IDs would collide, without building them.
+
+    Every node ID is ``<stem>_<ordinal>`` and ordinals contain no ``_``, so two
+    IDs are equal only when their stems are equal and their ordinals overlap.
+    Comparing one ordinal range per scope instance is enough.
+    """
+    ranges_by_stem: dict[str, list[tuple[int, int, str]]] = {}
 
     for layer in layers:
-        if layer.placement == "global":
-            node_ids = _global_node_ids(layer, fabric_name)
-        elif fabric_name is None:
-            node_ids = tuple(
-                build_grouped_node_id(layer.placement, group_index, layer.name, ordinal)
-                for group_index in single_fabric_group_indexes
-                for ordinal in range(1, layer.nodes_per_group + 1)
-            )
-        else:
-            node_ids_list: list[str] = []
-            for group_index in range(1, config.scope_instance_count(layer.placement) + 1):
-                if layer.name == GPU_NODES_LAYER_NAME:
-                    for local_ordinal in range(1, layer.nodes_per_group + 1):
-                        physical_ordinal = config.physical_node_ordinal(
-                            layer.placement,
-                            group_index,
-                            local_ordinal,
-                        )
-                        node_ids_list.append(
-                            build_fabric_qualified_node_id(
-                                fabric_name,
-                                build_global_node_id(layer.name, physical_ordinal),
-                            )
-                        )
-                    continue
-
-                group_label = config.group_label_for_group(layer.placement, group_index)
-                for ordinal in range(1, layer.nodes_per_group + 1):
-                    node_ids_list.append(
-                        build_fabric_qualified_node_id(
-                            fabric_name,
-                            build_group_label_node_id(group_label, layer.name, ordinal),
-                        )
-                    )
-            node_ids = tuple(node_ids_list)
-
-        for node_id in node_ids:
-            existing_layer = seen_node_ids.get(node_id)
-            if existing_layer is not None:
+        for stem, first_ordinal, last_ordinal in _iter_node_id_ranges(
+            config,
+            layer,
+            fabric_name,
+        ):
+            stem_ranges = ranges_by_stem.setdefault(stem, [])
+            collisions = [
+                (max(first_ordinal, existing_first), existing_layer)
+                for existing_first, existing_last, existing_layer in stem_ranges
+                if existing_first <= last_ordinal and first_ordinal <= existing_last
+            ]
+            if collisions:
+                ordinal, existing_layer = min(collisions)
                 raise InvalidTopologyConfig(
                     "Expanded node IDs must be unique after normalization; "
                     f"layers {existing_layer!r} and {layer.name!r} both produce "
-                    f"{node_id!r}."
+                    f"{build_node_id(stem, ordinal)!r}."
                 )
-            seen_node_ids[node_id] = layer.name
+            if stem_ranges and stem_ranges[-1][1:] == (first_ordinal - 1, layer.name):
+                stem_ranges[-1] = (stem_ranges[-1][0], last_ordinal, layer.name)
+            else:
+                stem_ranges.append((first_ordinal, last_ordinal, layer.name))
 
 
-def _global_node_ids(
+def _iter_node_id_ranges(
+    config: TopologyConfig,
     layer: LayerConfig,
     fabric_name: str | None,
-) -> tuple[str, ...]:
-    node_ids = tuple(
-        build_global_node_id(layer.name, ordinal)
-        for ordinal in range(1, layer.nodes_per_group + 1)
-    )
-    if fabric_name is None or layer.name == GPU_NODES_LAYER_NAME:
-        return node_ids
-    return tuple(
-        build_fabric_qualified_node_id(fabric_name, node_id)
-        for node_id in node_ids
-    )
+) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(stem, first_ordinal, last_ordinal)`` in node-ID generation order."""
+    if layer.placement == "global":
+        stem = global_node_id_stem(layer.name)
+        if fabric_name is not None and layer.name != GPU_NODES_LAYER_NAME:
+            stem = build_fabric_qualified_node_id(fabric_name, stem)
+        yield stem, 1, layer.nodes_per_group
+        return
+
+    if fabric_name is None:
+        group = config.group()
+        for group_index in range(1, group.count + 1 if group else 1):
+            yield (
+                grouped_node_id_stem(layer.placement, group_index, layer.name),
+                1,
+                layer.nodes_per_group,
+            )
+        return
+
+    for group_index in range(1, config.scope_instance_count(layer.placement) + 1):
+        if layer.name == GPU_NODES_LAYER_NAME:
+            first_ordinal = config.physical_node_ordinal(layer.placement, group_index, 1)
+            yield (
+                build_fabric_qualified_node_id(
+                    fabric_name,
+                    global_node_id_stem(layer.name),
+                ),
+                first_ordinal,
+                first_ordinal + layer.nodes_per_group - 1,
+            )
+            continue
+
+        yield (
+            build_fabric_qualified_node_id(
+                fabric_name,
+                group_label_node_id_stem(
+                    config.group_label_for_group(layer.placement, group_index),
+                    layer.name,
+                ),
+            ),
+            1,
+            layer.nodes_per_group,
+        )
 
 
 def _validate_name_uniqueness(
@@ -0,0 +1,262 @@
+import csv
+import gzip
+import shutil
+from collections.abc import Iterable, Iterator, Mapping
+from functools import partial
+from itertools import islice
+from os import PathLike
+from pathlib import Path
+from typing import Any, TextIO
+
+from topology_generator.graph_metadata import TopologyGraph, is_multi_fabric_graph
+from topology_generator.parallel import map_with_graph, resolve_worker_count
+from topology_generator.port_mapper import (
+    MULTI_FABRIC_PORT_MAPPING_COLUMNS,
+    FabricRowBlock,
+    PortMappingShard,
+    iter_numbered_blocks,
+    iter_port_mapping_values,
+    iter_shard_values,
+    plan_fabric_port_mapping_parts,
+    port_mapping_columns,
+    write_port_mapping_excel,
+    write_port_mapping_excel_blocks,
+)
+
+
+OUTPUT_FORMATS = ("xlsx", "csv", "csv.gz", "parquet")
+PARQUET_BATCH_ROWS = 65_536
+INTEGER_COLUMNS = frozenset(
+    {
+        "source_node_port",
+        "source_lane_units",
+        "target_node_port",
+        "target_lane_units",
+        "cable_number",
+    }
+)
+
+
+def port_mapping_filename(output_format: str) -> str:
+    """Return the cut-sheet file name for ``output_format``."""
+    _check_output_format(output_format)
+    return f"port_mapping.{output_format}"
+
+
+def write_port_mapping(
+    graph: TopologyGraph,
+    output_path: str | PathLike[str],
+    output_format: str = "xlsx",
+    jobs: int | None = None,
+) -> int:
+    """Stream the port mapping for ``graph`` in ``output_format``.
+
+    Returns the number of cable rows written.
+    """
+    filename = port_mapping_filename(output_format)
+    if output_format == "xlsx":
+        return write_port_mapping_excel(graph, output_path, filename, jobs=jobs)
+    if output_format == "parquet":
+        return write_port_mapping_parquet(graph, output_path, filename)
+    return write_port_mapping_csv(
+        graph,
+        output_path,
+        filename,
+        compress=output_format == "csv.gz",
+        jobs=jobs,
+    )
+
+
+def write_port_mapping_csv(
+    graph: TopologyGraph,
+    output_path: str | PathLike[str],
+    filename: str = "port_mapping.csv",
+    compress: bool = False,
+    jobs: int | None = 1,
+) -> int:
+    """Stream the port mapping as CSV, gzip-compressed when ``compress`` is set.
+
+    Empty serial-number cells are written as empty fields, matching
+    ``DataFrame.to_csv``. With ``jobs`` other than 1, multi-fabric rows are
+    extracted per fabric in a process pool and the parts are appended in
+    fabric order, so the file and its cable numbers match a serial run.
+    Returns the number of cable rows written.
+    """
+    output_file = _prepare_output_file(output_path, filename)
+    parts = (
+        plan_fabric_port_mapping_parts(graph, filename)
+        if is_multi_fabric_graph(graph)
+        else []
+    )
+    if resolve_worker_count(jobs, len(parts)) > 1:
+        return _write_csv_parts(graph, output_file, parts, compress, jobs)
+
+    with _open_csv(output_file, compress) as handle:
+        return _write_csv_rows(
+            handle,
+            port_mapping_columns(graph),
+            iter_port_mapping_values(graph),
+        )
+
+
+def write_port_mapping_parquet(
+    graph: TopologyGraph,
+    output_path: str | PathLike[str],
+    filename: str = "port_mapping.parquet",
+) -> int:
+    """Stream the port mapping into a Parquet file in fixed-size row batches.
+
+    Requires the optional ``pyarrow`` dependency. Returns the number of cable
+    rows written.
+    """
+    return _write_parquet_values(
+        _prepare_output_file(output_path, filename),
+        port_mapping_columns(graph),
+        iter_port_mapping_values(graph),
+    )
+
+
+def write_port_mapping_blocks(
+    blocks: Mapping[str, FabricRowBlock],
+    output_path: str | PathLike[str],
+    output_format: str = "xlsx",
+) -> int:
+    """Write multi-fabric cut-sheet row blocks in ``output_format``.
+
+    ``blocks`` maps each fabric, in fabric order, to its rows from
+    ``iter_fabric_rows``. Rows are streamed and numbered continuously across
+    blocks, so the file matches ``write_port_mapping`` for the graph the
+    blocks came from. Returns the number of cable rows written.
+    """
+    filename = port_mapping_filename(output_format)
+    if output_format == "xlsx":
+        return write_port_mapping_excel_blocks(blocks, output_path, filename)
+
+    output_file = _prepare_output_file(output_path, filename)
+    values = iter_numbered_blocks(blocks.values())
+    if output_format == "parquet":
+        return _write_parquet_values(
+            output_file, MULTI_FABRIC_PORT_MAPPING_COLUMNS, values
+        )
+    with _open_csv(output_file, output_format == "csv.gz") as handle:
+        return _write_csv_rows(handle, MULTI_FABRIC_PORT_MAPPING_COLUMNS, values)
+
+
+def _write_parquet_values(
+    output_file: Path,
+    columns: list[str],
+    values: Iterator[tuple[object, ...]],
+) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet output requires pyarrow; install it with "
+            "`pip install topology_generator[parquet]`."
+        ) from exc
+
+    schema = pa.schema([(column, _parquet_type(pa, column)) for column in columns])
+    row_count = 0
+    with pq.ParquetWriter(output_file, schema) as writer:
+        for batch in _iter_row_batches(values):
+            writer.write_table(
+                pa.Table.from_arrays(
+                    [
+                        pa.array(column, type=field.type)
+                        for column, field in zip(zip(*batch), schema)
+                    ],
+                    schema=schema,
+                )
+            )
+            row_count += len(batch)
+    return row_count
+
+
+def _write_csv_parts(
+    graph: TopologyGraph,
+    output_file: Path,
+    parts: list[PortMappingShard],
+    compress: bool,
+    jobs: int | None,
+) -> int:
+    part_files = [output_file.with_name(part.filename) for part in parts]
+    try:
+        row_counts = map_with_graph(
+            graph,
+            partial(_write_csv_part, output_dir=output_file.parent, compress=compress),
+            parts,
+            jobs,
+        )
+        # Concatenated gzip members form a valid gzip stream, so compressed
+        # parts are appended byte for byte as well.
+        with _open_csv(output_file, compress) as handle:
+            _write_csv_rows(handle, port_mapping_columns(graph), ())
+        with output_file.open("ab") as merged:
+            for part_file in part_files:
+                with part_file.open("rb") as part:
+                    shutil.copyfileobj(part, merged)
+    finally:
+        for part_file in part_files:
+            part_file.unlink(missing_ok=True)
+    return sum(row_counts)
+
+
+def _write_csv_part(
+    graph: TopologyGraph,
+    part: PortMappingShard,
+    output_dir: Path,
+    compress: bool,
+) -> int:
+    with _open_csv(output_dir / part.filename, compress) as handle:
+        return _write_csv_rows(handle, None, iter_shard_values(graph, part))
+
+
+def _open_csv(output_file: Path, compress: bool) -> TextIO:
+    if compress:
+        return gzip.open(output_file, "wt", encoding="utf-8", newline="")
+    return output_file.open("w", encoding="utf-8", newline="")
+
+
+def _write_csv_rows(
+    handle: TextIO,
+    columns: list[str] | None,
+    values: Iterable[tuple[object, ...]],
+) -> int:
+    writer = csv.writer(handle)
+    if columns is not None:
+        writer.writerow(columns)
+    row_count = 0
+    for row_values in values:
+        writer.writerow(row_values)
+        row_count += 1
+    return row_count
+
+
+def _parquet_type(pa: Any, column: str) -> Any:
+    if column in INTEGER_COLUMNS:
+        return pa.int64()
+    if column == "cable_bandwidth_gb":
+        return pa.float64()
+    return pa.string()
+
+
+def _iter_row_batches(
+    values: Iterator[tuple[object, ...]],
+) -> Iterator[list[tuple[object, ...]]]:
+    while batch := list(islice(values, PARQUET_BATCH_ROWS)):
+        yield batch
+
+
+def _prepare_output_file(output_path: str | PathLike[str], filename: str) -> Path:
+    output_dir = Path(output_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir / filename
+
+
+def _check_output_format(output_format: str) -> None:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unknown output format {output_format!r}; "
+            f"expected one of {', '.join(OUTPUT_FORMATS)}."
+        )
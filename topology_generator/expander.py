@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+import numpy.typing as npt
 
 from topology_generator.config_identifiers import (
     DEFAULT_SINGLE_FABRIC_NAME,
@@ -20,6 +24,10 @@ from topology_generator.config_types import (
 )
 
 
+NODE_INDEX_DTYPE = np.int32
+GLOBAL_SCOPE_ID = -1
+
+
 @dataclass(frozen=True)
 class ExpandedNode:
     node_id: str
@@ -43,13 +51,7 @@ class ExpandedNode:
 
     @property
     def supported_port_bandwidths_gb(self) -> tuple[float, ...]:
-        seen_bandwidths: list[float] = []
-        for port_pool in self.port_pools:
-            for bandwidth_gb in port_pool.supported_port_bandwidths_gb:
-                if bandwidth_gb in seen_bandwidths:
-                    continue
-                seen_bandwidths.append(bandwidth_gb)
-        return tuple(seen_bandwidths)
+        return _supported_port_bandwidths_gb(self.port_pools)
 
     def port_pool(self, pool_name: str) -> PortPoolConfig:
         for port_pool in self.port_pools:
@@ -102,72 +104,336 @@ class ExpandedLinkBundle:
 
 
 @dataclass(frozen=True)
+class ExpandedLayer:
+    """One concrete layer of one fabric and the contiguous node range it owns."""
+
+    layer_id: int
+    fabric_name: str | None
+    layer: LayerConfig
+    is_shared_gpu_node: bool
+    node_start: int
+    node_stop: int
+
+    @property
+    def node_count(self) -> int:
+        return self.node_stop - self.node_start
+
+    @cached_property
+    def supported_port_bandwidths_gb(self) -> tuple[float, ...]:
+        return _supported_port_bandwidths_gb(self.layer.port_pools)
+
+
+@dataclass(frozen=True)
+class ExpandedScope:
+    """Scope metadata shared by every node of one grouped layer instance."""
+
+    placement: str
+    group_index: int
+    scope_names: tuple[str, ...]
+    scope_indexes: tuple[int, ...]
+    scope_labels: tuple[str, ...]
+    scope_key: tuple[tuple[str, int], ...]
+
+    @property
+    def group_label(self) -> str:
+        return self.scope_labels[-1]
+
+
+@dataclass(frozen=True)
+class ExpandedLinkSpec:
+    """Per-link attributes shared by every bundle expanded from one config link."""
+
+    spec_id: int
+    fabric_name: str | None
+    port_pool: str
+    pool_id: int
+    num_cables: int
+    cable_bandwidth_gb: float
+    source_layer_id: int
+    target_layer_id: int
+    source_lane_units_per_cable: int
+    target_lane_units_per_cable: int
+
+
+@dataclass(frozen=True)
+class ExpandedLinkBlock:
+    """Full mesh between two contiguous node ranges for one link spec."""
+
+    spec_id: int
+    source_start: int
+    source_stop: int
+    target_start: int
+    target_stop: int
+
+    @property
+    def num_links(self) -> int:
+        return (self.source_stop - self.source_start) * (
+            self.target_stop - self.target_start
+        )
+
+    def source_indexes(self) -> npt.NDArray[np.int32]:
+        return np.repeat(
+            np.arange(self.source_start, self.source_stop, dtype=NODE_INDEX_DTYPE),
+            self.target_stop - self.target_start,
+        )
+
+    def target_indexes(self) -> npt.NDArray[np.int32]:
+        return np.tile(
+            np.arange(self.target_start, self.target_stop, dtype=NODE_INDEX_DTYPE),
+            self.source_stop - self.source_start,
+        )
+
+    def iter_index_pairs(self) -> Iterator[tuple[int, int]]:
+        target_indexes = range(self.target_start, self.target_stop)
+        for source_index in range(self.source_start, self.source_stop):
+            for target_index in target_indexes:
+                yield source_index, target_index
+
+
+@dataclass(frozen=True, eq=False)
 class ExpandedTopology:
+    """Columnar expanded topology.
+
+    Nodes are stored as parallel NumPy columns of small integer ids that index
+    into the shared ``layers``, ``scopes`` and ``pool_names`` tables. Link
+    bundles are stored as ``link_blocks``, one full mesh between two contiguous
+    node ranges per scope instance, and only flattened into per-bundle columns
+    when those are first accessed. The ``nodes`` and ``links`` dataclass views
+    are likewise built lazily.
+    """
+
     config: TopologyConfig
-    nodes: tuple[ExpandedNode, ...]
-    links: tuple[ExpandedLinkBundle, ...]
+    layers: tuple[ExpandedLayer, ...]
+    scopes: tuple[ExpandedScope, ...]
+    pool_names: tuple[str, ...]
+    link_specs: tuple[ExpandedLinkSpec, ...]
+    link_blocks: tuple[ExpandedLinkBlock, ...]
+    node_ids: tuple[str, ...]
+    graph_node_ids: tuple[str, ...]
+    node_layer_ids: npt.NDArray[np.int32]
+    node_scope_ids: npt.NDArray[np.int32]
+    node_ordinals: npt.NDArray[np.int32]
+    node_physical_ordinals: npt.NDArray[np.int32]
 
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
 
-def expand_topology(config: TopologyConfig | dict[str, object]) -> ExpandedTopology:
-    topology_config = ensure_topology_config(config)
-    single_group = topology_config.group()
-    single_group_indexes: tuple[int, ...] = (
-        tuple(range(1, single_group.count + 1)) if single_group else ()
-    )
-
-    expanded_nodes: list[ExpandedNode] = []
-    layer_nodes: dict[tuple[str, str], list[ExpandedNode]] = defaultdict(list)
-    scope_layer_nodes: dict[
-        tuple[str, str, tuple[tuple[str, int], ...]],
-        list[ExpandedNode],
-    ] = defaultdict(list)
-    seen_node_ids: set[str] = set()
+    @property
+    def num_links(self) -> int:
+        return sum(block.num_links for block in self.link_blocks)
+
+    @cached_property
+    def link_source_indexes(self) -> npt.NDArray[np.int32]:
+        return _concatenate([block.source_indexes() for block in self.link_blocks])
+
+    @cached_property
+    def link_target_indexes(self) -> npt.NDArray[np.int32]:
+        return _concatenate([block.target_indexes() for block in self.link_blocks])
+
+    @cached_property
+    def link_spec_ids(self) -> npt.NDArray[np.int32]:
+        return _concatenate(
+            [
+                np.full(block.num_links, block.spec_id, dtype=NODE_INDEX_DTYPE)
+                for block in self.link_blocks
+            ]
+        )
 
-    for fabric in topology_config.iter_fabrics():
-        fabric_key = _fabric_key(fabric.name)
-        for layer in fabric.layers:
-            if layer.placement == "global":
-                for ordinal in range(1, layer.nodes_per_group + 1):
-                    node = _build_expanded_node(
-                        topology_config=topology_config,
-                        layer=layer,
-                        fabric_name=fabric.name,
-                        group_index=None,
-                        node_ordinal=ordinal,
-                    )
-                    _append_expanded_node(
-                        expanded_nodes,
-                        layer_nodes[(fabric_key, layer.name)],
-                        seen_node_ids,
-                        node,
-                    )
+    @cached_property
+    def link_pool_ids(self) -> npt.NDArray[np.int32]:
+        return self._spec_column([spec.pool_id for spec in self.link_specs])
+
+    @cached_property
+    def link_num_cables(self) -> npt.NDArray[np.int32]:
+        return self._spec_column([spec.num_cables for spec in self.link_specs])
+
+    @cached_property
+    def nodes(self) -> tuple[ExpandedNode, ...]:
+        return tuple(self.node(index) for index in range(self.num_nodes))
+
+    @cached_property
+    def links(self) -> tuple[ExpandedLinkBundle, ...]:
+        return tuple(self.iter_links())
+
+    @cached_property
+    def node_sort_ranks(self) -> npt.NDArray[np.int64]:
+        """Integer rank of every node in cut-sheet order.
+
+        Ranks order nodes fabric by fabric, then by layer, scoped before
+        global, scope indexes and ordinal. Within a fabric this matches
+        ``graph_metadata.node_sort_key``.
+        """
+        fabric_ids: dict[str | None, int] = {}
+        layer_fabric_ids = np.array(
+            [
+                fabric_ids.setdefault(layer.fabric_name, len(fabric_ids))
+                for layer in self.layers
+            ],
+            dtype=np.int64,
+        )
+        layer_indexes = np.array(
+            [layer.layer.index for layer in self.layers],
+            dtype=np.int64,
+        )
+        scope_depth = max((len(scope.scope_indexes) for scope in self.scopes), default=0)
+        # The trailing row is selected by GLOBAL_SCOPE_ID (-1) for global nodes.
+        scope_indexes = np.full((len(self.scopes) + 1, scope_depth), -1, dtype=np.int64)
+        for scope_id, scope in enumerate(self.scopes):
+            scope_indexes[scope_id, : len(scope.scope_indexes)] = scope.scope_indexes
+        node_scope_indexes = scope_indexes[self.node_scope_ids]
+
+        order = np.lexsort(
+            (
+                self.node_ordinals,
+                *(node_scope_indexes[:, depth] for depth in reversed(range(scope_depth))),
+                self.node_scope_ids == GLOBAL_SCOPE_ID,
+                layer_indexes[self.node_layer_ids],
+                layer_fabric_ids[self.node_layer_ids],
+            )
+        )
+        ranks = np.empty(self.num_nodes, dtype=np.int64)
+        ranks[order] = np.arange(self.num_nodes, dtype=np.int64)
+        return ranks
+
+    @cached_property
+    def has_canonical_link_order(self) -> bool:
+        """Whether a graph built from this expansion lists edges in cut-sheet order.
+
+        Nodes are expanded layer by layer, scope by scope and ordinal by
+        ordinal, which is the cut-sheet's per-fabric node order. Graph edges
+        are then reported lower node first, with each node's upper neighbours
+        in insertion order. That order stays canonical unless a later link
+        block reaches back to upper nodes that sort before ones an earlier
+        block already linked to the same lower nodes.
+        """
+        graph_positions = self._graph_node_positions()
+        for fabric_name in dict.fromkeys(layer.fabric_name for layer in self.layers):
+            fabric_positions = np.concatenate(
+                [
+                    graph_positions[layer.node_start : layer.node_stop]
+                    for layer in self.layers
+                    if layer.fabric_name == fabric_name
+                ]
+            )
+            if np.any(np.diff(fabric_positions) <= 0):
+                return False
+
+        last_target_positions = np.full(self.num_nodes, -1, dtype=np.int64)
+        seen_blocks: set[tuple[int, int, int, int]] = set()
+        for block in self.link_blocks:
+            block_ranges = (
+                block.source_start,
+                block.source_stop,
+                block.target_start,
+                block.target_stop,
+            )
+            if block_ranges in seen_blocks:
+                continue
+            seen_blocks.add(block_ranges)
+            sources = slice(block.source_start, block.source_stop)
+            if graph_positions[block.target_start] <= last_target_positions[sources].max():
+                return False
+            last_target_positions[sources] = graph_positions[block.target_stop - 1]
+        return True
+
+    def layer_for_node(self, node_index: int) -> ExpandedLayer:
+        return self.layers[int(self.node_layer_ids[node_index])]
+
+    def scope_for_node(self, node_index: int) -> ExpandedScope | None:
+        scope_id = int(self.node_scope_ids[node_index])
+        return None if scope_id == GLOBAL_SCOPE_ID else self.scopes[scope_id]
+
+    def node(self, node_index: int) -> ExpandedNode:
+        expanded_layer = self.layer_for_node(node_index)
+        layer = expanded_layer.layer
+        scope = self.scope_for_node(node_index)
+        return ExpandedNode(
+            node_id=self.node_ids[node_index],
+            graph_node_id=self.graph_node_ids[node_index],
+            layer_index=layer.index,
+            layer_name=layer.name,
+            placement=layer.placement,
+            placement_scope=None if scope is None else scope.placement,
+            scope_names=() if scope is None else scope.scope_names,
+            scope_indexes=() if scope is None else scope.scope_indexes,
+            scope_labels=() if scope is None else scope.scope_labels,
+            scope_key=() if scope is None else scope.scope_key,
+            group_name=None if scope is None else scope.placement,
+            group_index=None if scope is None else scope.group_index,
+            group_label=None if scope is None else scope.group_label,
+            node_ordinal=int(self.node_ordinals[node_index]),
+            physical_node_ordinal=int(self.node_physical_ordinals[node_index]),
+            port_pools=layer.port_pools,
+            fabric_name=expanded_layer.fabric_name,
+            is_shared_gpu_node=expanded_layer.is_shared_gpu_node,
+        )
+
+    def iter_link_blocks(
+        self,
+        fabric_name: str | None = None,
+    ) -> Iterator[ExpandedLinkBlock]:
+        """Yield link blocks fabric by fabric and scope by scope."""
+        for block in self.link_blocks:
+            if (
+                fabric_name is not None
+                and self.link_specs[block.spec_id].fabric_name != fabric_name
+            ):
                 continue
+            yield block
+
+    def iter_links(self, fabric_name: str | None = None) -> Iterator[ExpandedLinkBundle]:
+        """Yield link bundles in expansion order without materializing them all."""
+        for block in self.iter_link_blocks(fabric_name):
+            spec = self.link_specs[block.spec_id]
+            for source_index, target_index in block.iter_index_pairs():
+                yield ExpandedLinkBundle(
+                    source_node_id=self.node_ids[source_index],
+                    target_node_id=self.node_ids[target_index],
+                    source_graph_node_id=self.graph_node_ids[source_index],
+                    target_graph_node_id=self.graph_node_ids[target_index],
+                    fabric_name=spec.fabric_name,
+                    port_pool=spec.port_pool,
+                    num_cables=spec.num_cables,
+                    cable_bandwidth_gb=spec.cable_bandwidth_gb,
+                    source_lane_units_per_cable=spec.source_lane_units_per_cable,
+                    target_lane_units_per_cable=spec.target_lane_units_per_cable,
+                )
 
-            if fabric.name is None:
-                group_indexes = single_group_indexes
-            else:
-                group_indexes = tuple(
-                    range(1, topology_config.scope_instance_count(layer.placement) + 1)
+    def _graph_node_positions(self) -> npt.NDArray[np.int64]:
+        """Map each expanded node to the index where its graph node was first added."""
+        positions = np.arange(self.num_nodes, dtype=np.int64)
+        first_indexes: dict[str, int] = {}
+        for layer in self.layers:
+            if not layer.is_shared_gpu_node:
+                continue
+            for node_index in range(layer.node_start, layer.node_stop):
+                positions[node_index] = first_indexes.setdefault(
+                    self.graph_node_ids[node_index],
+                    node_index,
                 )
+        return positions
 
-            for group_index in group_indexes:
-                for ordinal in range(1, layer.nodes_per_group + 1):
-                    node = _build_expanded_node(
-                        topology_config=topology_config,
-                        layer=layer,
-                        fabric_name=fabric.name,
-                        group_index=group_index,
-                        node_ordinal=ordinal,
-                    )
-                    _append_expanded_node(
-                        expanded_nodes,
-                        layer_nodes[(fabric_key, layer.name)],
-                        seen_node_ids,
-                        node,
-                    )
-                    scope_layer_nodes[(fabric_key, layer.name, node.scope_key)].append(node)
+    def _spec_column(self, values: list[int]) -> npt.NDArray[np.int32]:
+        if not values:
+            return np.zeros(0, dtype=NODE_INDEX_DTYPE)
+        return np.array(values, dtype=NODE_INDEX_DTYPE)[self.link_spec_ids]
+
+
+NodeRange = tuple[int, int]
+ScopeKey = tuple[tuple[str, int], ...]
+
+EMPTY_NODE_RANGE: NodeRange = (0, 0)
+
+
+def expand_topology(config: TopologyConfig | dict[str, object]) -> ExpandedTopology:
+    topology_config = ensure_topology_config(config)
+    builder = _ExpansionBuilder(topology_config)
+
+    for fabric in topology_config.iter_fabrics():
+        for layer in fabric.layers:
+            builder.add_layer(fabric.name, layer)
 
-    expanded_links: list[ExpandedLinkBundle] = []
     for fabric in topology_config.iter_fabrics():
         fabric_key = _fabric_key(fabric.name)
 
@@ -192,24 +458,25 @@ def expand_topology(config: TopologyConfig | dict[str, object]) -> ExpandedTopol
                     f"{link.port_pool!r}."
                 )
 
+            lower_key = (fabric_key, lower_layer.name)
+            upper_key = (fabric_key, upper_layer.name)
+            spec_id = builder.add_link_spec(
+                fabric_name=fabric.name,
+                port_pool=link.port_pool,
+                num_cables=link.cables_per_pair,
+                cable_bandwidth_gb=link.cable_bandwidth_gb,
+                source_layer_key=lower_key,
+                target_layer_key=upper_key,
+                source_lane_units_per_cable=source_lane_units_per_cable,
+                target_lane_units_per_cable=target_lane_units_per_cable,
+            )
+
             if link.policy == "same_scope_full_mesh":
-                for scope_key in _scope_keys_for_layer(
-                    topology_config,
-                    lower_layer,
-                    fabric.name,
-                    single_group_indexes,
-                ):
-                    expanded_links.extend(
-                        _full_mesh_link_bundles(
-                            scope_layer_nodes[(fabric_key, lower_layer.name, scope_key)],
-                            scope_layer_nodes[(fabric_key, upper_layer.name, scope_key)],
-                            fabric.name,
-                            link.port_pool,
-                            link.cables_per_pair,
-                            link.cable_bandwidth_gb,
-                            source_lane_units_per_cable,
-                            target_lane_units_per_cable,
-                        )
+                for scope_key, source_range in builder.scope_ranges[lower_key].items():
+                    builder.add_full_mesh(
+                        spec_id,
+                        source_range,
+                        builder.scope_ranges[upper_key].get(scope_key, EMPTY_NODE_RANGE),
                     )
                 continue
 
@@ -217,243 +484,320 @@ def expand_topology(config: TopologyConfig | dict[str, object]) -> ExpandedTopol
                 ancestor_depth = len(
                     topology_config.scope_names_for_scope(upper_layer.placement)
                 )
-                for scope_key in _scope_keys_for_layer(
-                    topology_config,
-                    lower_layer,
-                    fabric.name,
-                    single_group_indexes,
-                ):
-                    ancestor_scope_key = scope_key[:ancestor_depth]
-                    expanded_links.extend(
-                        _full_mesh_link_bundles(
-                            scope_layer_nodes[(fabric_key, lower_layer.name, scope_key)],
-                            scope_layer_nodes[
-                                (fabric_key, upper_layer.name, ancestor_scope_key)
-                            ],
-                            fabric.name,
-                            link.port_pool,
-                            link.cables_per_pair,
-                            link.cable_bandwidth_gb,
-                            source_lane_units_per_cable,
-                            target_lane_units_per_cable,
-                        )
+                for scope_key, source_range in builder.scope_ranges[lower_key].items():
+                    builder.add_full_mesh(
+                        spec_id,
+                        source_range,
+                        builder.scope_ranges[upper_key].get(
+                            scope_key[:ancestor_depth],
+                            EMPTY_NODE_RANGE,
+                        ),
                     )
                 continue
 
             if link.policy == "to_global_full_mesh":
-                global_nodes = layer_nodes[(fabric_key, upper_layer.name)]
-                for scope_key in _scope_keys_for_layer(
-                    topology_config,
-                    lower_layer,
-                    fabric.name,
-                    single_group_indexes,
-                ):
-                    expanded_links.extend(
-                        _full_mesh_link_bundles(
-                            scope_layer_nodes[(fabric_key, lower_layer.name, scope_key)],
-                            global_nodes,
-                            fabric.name,
-                            link.port_pool,
-                            link.cables_per_pair,
-                            link.cable_bandwidth_gb,
-                            source_lane_units_per_cable,
-                            target_lane_units_per_cable,
-                        )
+                for source_range in builder.scope_ranges[lower_key].values():
+                    builder.add_full_mesh(
+                        spec_id,
+                        source_range,
+                        builder.layer_ranges[upper_key],
                     )
                 continue
 
-            expanded_links.extend(
-                _full_mesh_link_bundles(
-                    layer_nodes[(fabric_key, lower_layer.name)],
-                    layer_nodes[(fabric_key, upper_layer.name)],
-                    fabric.name,
-                    link.port_pool,
-                    link.cables_per_pair,
-                    link.cable_bandwidth_gb,
-                    source_lane_units_per_cable,
-                    target_lane_units_per_cable,
-                )
+            builder.add_full_mesh(
+                spec_id,
+                builder.layer_ranges[lower_key],
+                builder.layer_ranges[upper_key],
             )
 
-    return ExpandedTopology(
-        config=topology_config,
-        nodes=tuple(expanded_nodes),
-        links=tuple(expanded_links),
-    )
+    return builder.build()
+
+
+def iter_link_bundles(
+    config: TopologyConfig | dict[str, object],
+) -> Iterator[ExpandedLinkBundle]:
+    """Yield expanded link bundles fabric by fabric and scope by scope.
+
+    Only the node columns and one compact block per scope instance are held in
+    memory; bundles are produced on demand, so quadratic full-mesh policies do
+    not require a complete bundle list.
+    """
+    yield from expand_topology(config).iter_links()
+
+
+def layer_node_ids(
+    config: TopologyConfig,
+    fabric_name: str | None,
+    layer: LayerConfig,
+) -> tuple[str, ...]:
+    """Return the expanded node IDs of one layer without expanding the topology."""
+    builder = _ExpansionBuilder(config)
+    builder.add_layer(fabric_name, layer)
+    return tuple(builder.node_ids)
 
 
 def _fabric_key(fabric_name: str | None) -> str:
     return fabric_name or DEFAULT_SINGLE_FABRIC_NAME
 
 
-def _build_expanded_node(
-    topology_config: TopologyConfig,
-    layer: LayerConfig,
-    fabric_name: str | None,
-    group_index: int | None,
-    node_ordinal: int,
-) -> ExpandedNode:
-    is_shared_gpu_node = fabric_name is not None and layer.name == GPU_NODES_LAYER_NAME
-
-    if group_index is None:
-        graph_node_id = build_global_node_id(layer.name, node_ordinal)
-        placement_scope = None
-        scope_names: tuple[str, ...] = ()
-        scope_indexes: tuple[int, ...] = ()
-        scope_labels: tuple[str, ...] = ()
-        scope_key: tuple[tuple[str, int], ...] = ()
-        group_name = None
-        group_label = None
-        physical_node_ordinal = node_ordinal
-    elif fabric_name is None:
-        graph_node_id = build_grouped_node_id(
-            layer.placement,
-            group_index,
-            layer.name,
-            node_ordinal,
+def _supported_port_bandwidths_gb(
+    port_pools: tuple[PortPoolConfig, ...],
+) -> tuple[float, ...]:
+    seen_bandwidths: list[float] = []
+    for port_pool in port_pools:
+        for bandwidth_gb in port_pool.supported_port_bandwidths_gb:
+            if bandwidth_gb in seen_bandwidths:
+                continue
+            seen_bandwidths.append(bandwidth_gb)
+    return tuple(seen_bandwidths)
+
+
+class _ExpansionBuilder:
+    """Accumulate expanded node and link columns in canonical expansion order."""
+
+    def __init__(self, topology_config: TopologyConfig):
+        self.config = topology_config
+        single_group = topology_config.group()
+        self.single_group_indexes: tuple[int, ...] = (
+            tuple(range(1, single_group.count + 1)) if single_group else ()
         )
-        placement_scope = layer.placement
-        scope_names = (layer.placement,)
-        scope_indexes = (group_index,)
-        group_label = f"{layer.placement}_{group_index}"
-        scope_labels = (group_label,)
-        scope_key = ((layer.placement, group_index),)
-        group_name = layer.placement
-        physical_node_ordinal = node_ordinal
-    else:
-        group_name = layer.placement
-        if is_shared_gpu_node:
-            placement_scope = layer.placement
-            physical_node_ordinal = topology_config.physical_node_ordinal(
-                layer.placement,
-                group_index,
-                node_ordinal,
-            )
-            scope_names = topology_config.scope_names_for_scope(layer.placement)
-            scope_indexes = topology_config.scope_indexes_for_ordinal(
-                layer.placement,
-                physical_node_ordinal,
-            )
-            scope_labels = topology_config.scope_labels_for_ordinal(
-                layer.placement,
-                physical_node_ordinal,
+        self.layers: list[ExpandedLayer] = []
+        self.layer_ids: dict[tuple[str, str], int] = {}
+        self.layer_ranges: dict[tuple[str, str], NodeRange] = {}
+        self.scope_ranges: dict[tuple[str, str], dict[ScopeKey, NodeRange]] = {}
+        self.scopes: list[ExpandedScope] = []
+        self.pool_ids: dict[str, int] = {}
+        self.link_specs: list[ExpandedLinkSpec] = []
+        self.node_ids: list[str] = []
+        self.graph_node_ids: list[str] = []
+        self.node_layer_ids: list[int] = []
+        self.node_scope_ids: list[int] = []
+        self.node_ordinals: list[int] = []
+        self.node_physical_ordinals: list[int] = []
+        self.link_blocks: list[ExpandedLinkBlock] = []
+
+    def add_layer(self, fabric_name: str | None, layer: LayerConfig) -> None:
+        layer_key = (_fabric_key(fabric_name), layer.name)
+        layer_id = len(self.layers)
+        is_shared_gpu_node = (
+            fabric_name is not None and layer.name == GPU_NODES_LAYER_NAME
+        )
+        node_start = len(self.node_ids)
+        scope_ranges: dict[ScopeKey, NodeRange] = {}
+
+        if layer.placement == "global":
+            for ordinal in range(1, layer.nodes_per_group + 1):
+                graph_node_id = build_global_node_id(layer.name, ordinal)
+                self._append_node(
+                    fabric_name,
+                    is_shared_gpu_node,
+                    graph_node_id,
+                    layer_id,
+                    GLOBAL_SCOPE_ID,
+                    ordinal,
+                    ordinal,
+                )
+        else:
+            for group_index in self._group_indexes(fabric_name, layer):
+                scope = self._build_scope(fabric_name, layer, group_index)
+                scope_id = len(self.scopes)
+                self.scopes.append(scope)
+                scope_start = len(self.node_ids)
+                for ordinal in range(1, layer.nodes_per_group + 1):
+                    physical_node_ordinal = ordinal
+                    if fabric_name is None:
+                        graph_node_id = build_grouped_node_id(
+                            layer.placement,
+                            group_index,
+                            layer.name,
+                            ordinal,
+                        )
+                    elif is_shared_gpu_node:
+                        physical_node_ordinal = self.config.physical_node_ordinal(
+                            layer.placement,
+                            group_index,
+                            ordinal,
+                        )
+                        graph_node_id = build_global_node_id(
+                            layer.name,
+                            physical_node_ordinal,
+                        )
+                    else:
+                        graph_node_id = build_group_label_node_id(
+                            scope.group_label,
+                            layer.name,
+                            ordinal,
+                        )
+                    self._append_node(
+                        fabric_name,
+                        is_shared_gpu_node,
+                        graph_node_id,
+                        layer_id,
+                        scope_id,
+                        ordinal,
+                        physical_node_ordinal,
+                    )
+                scope_ranges[scope.scope_key] = (scope_start, len(self.node_ids))
+
+        node_stop = len(self.node_ids)
+        self.layers.append(
+            ExpandedLayer(
+                layer_id=layer_id,
+                fabric_name=fabric_name,
+                layer=layer,
+                is_shared_gpu_node=is_shared_gpu_node,
+                node_start=node_start,
+                node_stop=node_stop,
             )
-            scope_key = topology_config.scope_key_for_ordinal(
-                layer.placement,
-                physical_node_ordinal,
+        )
+        self.layer_ids[layer_key] = layer_id
+        self.layer_ranges[layer_key] = (node_start, node_stop)
+        self.scope_ranges[layer_key] = scope_ranges
+
+    def add_link_spec(
+        self,
+        fabric_name: str | None,
+        port_pool: str,
+        num_cables: int,
+        cable_bandwidth_gb: float,
+        source_layer_key: tuple[str, str],
+        target_layer_key: tuple[str, str],
+        source_lane_units_per_cable: int,
+        target_lane_units_per_cable: int,
+    ) -> int:
+        normalized_pool_name = normalize_identifier(port_pool)
+        pool_id = self.pool_ids.setdefault(normalized_pool_name, len(self.pool_ids))
+        spec_id = len(self.link_specs)
+        self.link_specs.append(
+            ExpandedLinkSpec(
+                spec_id=spec_id,
+                fabric_name=fabric_name,
+                port_pool=port_pool,
+                pool_id=pool_id,
+                num_cables=num_cables,
+                cable_bandwidth_gb=cable_bandwidth_gb,
+                source_layer_id=self.layer_ids[source_layer_key],
+                target_layer_id=self.layer_ids[target_layer_key],
+                source_lane_units_per_cable=source_lane_units_per_cable,
+                target_lane_units_per_cable=target_lane_units_per_cable,
             )
-            group_label = scope_labels[-1]
-            graph_node_id = build_global_node_id(layer.name, physical_node_ordinal)
-        else:
-            placement_scope = layer.placement
-            physical_node_ordinal = node_ordinal
-            scope_start_ordinal = topology_config.physical_node_ordinal(
-                layer.placement,
-                group_index,
-                1,
+        )
+        return spec_id
+
+    def add_full_mesh(
+        self,
+        spec_id: int,
+        source_range: NodeRange,
+        target_range: NodeRange,
+    ) -> None:
+        block = ExpandedLinkBlock(
+            spec_id=spec_id,
+            source_start=source_range[0],
+            source_stop=source_range[1],
+            target_start=target_range[0],
+            target_stop=target_range[1],
+        )
+        if block.num_links:
+            self.link_blocks.append(block)
+
+    def build(self) -> ExpandedTopology:
+        return ExpandedTopology(
+            config=self.config,
+            layers=tuple(self.layers),
+            scopes=tuple(self.scopes),
+            pool_names=tuple(self.pool_ids),
+            link_specs=tuple(self.link_specs),
+            link_blocks=tuple(self.link_blocks),
+            node_ids=tuple(self.node_ids),
+            graph_node_ids=tuple(self.graph_node_ids),
+            node_layer_ids=np.array(self.node_layer_ids, dtype=NODE_INDEX_DTYPE),
+            node_scope_ids=np.array(self.node_scope_ids, dtype=NODE_INDEX_DTYPE),
+            node_ordinals=np.array(self.node_ordinals, dtype=NODE_INDEX_DTYPE),
+            node_physical_ordinals=np.array(
+                self.node_physical_ordinals,
+                dtype=NODE_INDEX_DTYPE,
+            ),
+        )
+
+    def _group_indexes(
+        self,
+        fabric_name: str | None,
+        layer: LayerConfig,
+    ) -> tuple[int, ...] | range:
+        if fabric_name is None:
+            return self.single_group_indexes
+        return range(1, self.config.scope_instance_count(layer.placement) + 1)
+
+    def _build_scope(
+        self,
+        fabric_name: str | None,
+        layer: LayerConfig,
+        group_index: int,
+    ) -> ExpandedScope:
+        if fabric_name is None:
+            group_label = f"{layer.placement}_{group_index}"
+            return ExpandedScope(
+                placement=layer.placement,
+                group_index=group_index,
+                scope_names=(layer.placement,),
+                scope_indexes=(group_index,),
+                scope_labels=(group_label,),
+                scope_key=((layer.placement, group_index),),
             )
-            scope_names = topology_config.scope_names_for_scope(layer.placement)
-            scope_indexes = topology_config.scope_indexes_for_ordinal(
+
+        # Every member of a nested scope instance shares its ancestry, so the
+        # scope metadata is resolved once from the first physical ordinal.
+        scope_start_ordinal = self.config.physical_node_ordinal(
+            layer.placement,
+            group_index,
+            1,
+        )
+        return ExpandedScope(
+            placement=layer.placement,
+            group_index=group_index,
+            scope_names=self.config.scope_names_for_scope(layer.placement),
+            scope_indexes=self.config.scope_indexes_for_ordinal(
                 layer.placement,
                 scope_start_ordinal,
-            )
-            scope_labels = topology_config.scope_labels_for_ordinal(
+            ),
+            scope_labels=self.config.scope_labels_for_ordinal(
                 layer.placement,
                 scope_start_ordinal,
-            )
-            scope_key = topology_config.scope_key_for_ordinal(
+            ),
+            scope_key=self.config.scope_key_for_ordinal(
                 layer.placement,
                 scope_start_ordinal,
-            )
-            group_label = scope_labels[-1]
-            graph_node_id = build_group_label_node_id(group_label, layer.name, node_ordinal)
-
-    if is_shared_gpu_node:
-        assert fabric_name is not None
-        node_id = build_fabric_qualified_node_id(fabric_name, graph_node_id)
-    elif fabric_name is None:
-        node_id = graph_node_id
-    else:
-        graph_node_id = build_fabric_qualified_node_id(fabric_name, graph_node_id)
-        node_id = graph_node_id
-
-    return ExpandedNode(
-        node_id=node_id,
-        graph_node_id=graph_node_id,
-        layer_index=layer.index,
-        layer_name=layer.name,
-        placement=layer.placement,
-        placement_scope=placement_scope,
-        scope_names=scope_names,
-        scope_indexes=scope_indexes,
-        scope_labels=scope_labels,
-        scope_key=scope_key,
-        group_name=group_name,
-        group_index=group_index,
-        group_label=group_label,
-        node_ordinal=node_ordinal,
-        physical_node_ordinal=physical_node_ordinal,
-        port_pools=layer.port_pools,
-        fabric_name=fabric_name,
-        is_shared_gpu_node=is_shared_gpu_node,
-    )
-
-
-def _append_expanded_node(
-    expanded_nodes: list[ExpandedNode],
-    layer_node_list: list[ExpandedNode],
-    seen_node_ids: set[str],
-    node: ExpandedNode,
-) -> None:
-    if node.node_id in seen_node_ids:
-        raise ValueError(f"Expanded node ID collision detected for {node.node_id!r}.")
-    seen_node_ids.add(node.node_id)
-    expanded_nodes.append(node)
-    layer_node_list.append(node)
-
-
-def _scope_keys_for_layer(
-    topology_config: TopologyConfig,
-    layer: LayerConfig,
-    fabric_name: str | None,
-    single_group_indexes: tuple[int, ...],
-) -> tuple[tuple[tuple[str, int], ...], ...]:
-    if layer.placement == "global":
-        return ()
-    if fabric_name is None:
-        return tuple(((layer.placement, group_index),) for group_index in single_group_indexes)
-    return tuple(
-        topology_config.scope_key_for_ordinal(
-            layer.placement,
-            topology_config.physical_node_ordinal(layer.placement, group_index, 1),
+            ),
         )
-        for group_index in range(1, topology_config.scope_instance_count(layer.placement) + 1)
-    )
 
+    def _append_node(
+        self,
+        fabric_name: str | None,
+        is_shared_gpu_node: bool,
+        graph_node_id: str,
+        layer_id: int,
+        scope_id: int,
+        node_ordinal: int,
+        physical_node_ordinal: int,
+    ) -> None:
+        if is_shared_gpu_node:
+            assert fabric_name is not None
+            node_id = build_fabric_qualified_node_id(fabric_name, graph_node_id)
+        elif fabric_name is None:
+            node_id = graph_node_id
+        else:
+            graph_node_id = build_fabric_qualified_node_id(fabric_name, graph_node_id)
+            node_id = graph_node_id
 
-def _full_mesh_link_bundles(
-    source_nodes: list[ExpandedNode],
-    target_nodes: list[ExpandedNode],
-    fabric_name: str | None,
-    port_pool: str,
-    num_cables: int,
-    cable_bandwidth_gb: float,
-    source_lane_units_per_cable: int,
-    target_lane_units_per_cable: int,
-) -> list[ExpandedLinkBundle]:
-    return [
-        ExpandedLinkBundle(
-            source_node_id=source.node_id,
-            target_node_id=target.node_id,
-            source_graph_node_id=source.graph_node_id,
-            target_graph_node_id=target.graph_node_id,
-            fabric_name=fabric_name,
-            port_pool=port_pool,
-            num_cables=num_cables,
-            cable_bandwidth_gb=cable_bandwidth_gb,
-            source_lane_units_per_cable=source_lane_units_per_cable,
-            target_lane_units_per_cable=target_lane_units_per_cable,
-        )
-        for source in source_nodes
-        for target in target_nodes
-    ]
+        self.node_ids.append(node_id)
+        self.graph_node_ids.append(graph_node_id)
+        self.node_layer_ids.append(layer_id)
+        self.node_scope_ids.append(scope_id)
+        self.node_ordinals.append(node_ordinal)
+        self.node_physical_ordinals.append(physical_node_ordinal)
+
+
+def _concatenate(columns: list[npt.NDArray[np.int32]]) -> npt.NDArray[np.int32]:
+    if not columns:
+        return np.zeros(0, dtype=NODE_INDEX_DTYPE)
+    return np.concatenate(columns)
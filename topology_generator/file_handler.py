@@ -1,13 +1,18 @@
+from __future__ import annotations
+
 import logging
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
 from topology_generator.config_types import InvalidTopologyConfig, TopologyConfig
 
+if TYPE_CHECKING:
+    from topology_generator.config_cache import ConfigCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,12 +33,19 @@ def ensure_output_dir(output_dir: str | PathLike[str]) -> Path:
     return output_path
 
 
-def load_config_from_file(config_path: str | PathLike[str]) -> TopologyConfig:
+def load_config_from_file(
+    config_path: str | PathLike[str],
+    cache: ConfigCache | None = None,
+) -> TopologyConfig:
     """
     Load and validate configuration from a YAML file.
 
+    With a ``cache``, a file whose exact bytes were loaded before skips YAML
+    parsing and validation, and a newly validated config is added to it.
+
     Args:
         config_path: The path to the YAML configuration file.
+        cache: Optional on-disk cache of validated configs.
 
     Returns:
         The validated configuration model.
@@ -44,9 +56,15 @@ def load_config_from_file(config_path: str | PathLike[str]) -> TopologyConfig:
     """
     config_file = Path(config_path)
     try:
-        with config_file.open("r", encoding="utf-8") as f:
-            raw_config: Any = yaml.safe_load(f)
-            return TopologyConfig.from_mapping(raw_config)
+        content = config_file.read_bytes()
+        if cache is not None:
+            cached_config = cache.get_config(content)
+            if cached_config is not None:
+                logger.info("Loaded validated configuration from cache")
+                return cached_config
+
+        raw_config: Any = yaml.safe_load(content.decode("utf-8"))
+        config = TopologyConfig.from_mapping(raw_config)
     except FileNotFoundError:
         logger.error("Configuration file not found: %s", config_file)
         raise
@@ -64,3 +82,7 @@ def load_config_from_file(config_path: str | PathLike[str]) -> TopologyConfig:
             str(exc),
         )
         raise
+
+    if cache is not None:
+        cache.put_config(content, config)
+    return config
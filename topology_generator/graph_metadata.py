@@ -1,15 +1,86 @@
 from __future__ import annotations
 
 import re
-from typing import Any, TypedDict, cast
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeAlias, TypedDict, cast, overload
 
 import networkx as nx
 
+if TYPE_CHECKING:
+    from topology_generator.compact_graph import CompactTopologyGraph
+    from topology_generator.config_types import PortPoolConfig
+    from topology_generator.expander import ExpandedLayer, ExpandedTopology
+    from topology_generator.validator import NodeUsage
+
+
+# Either backend returned by ``generate_topology``; both expose the same
+# read-only graph surface used by rendering and export.
+TopologyGraph: TypeAlias = "nx.Graph | CompactTopologyGraph"
+
+
+@dataclass(frozen=True, eq=False)
+class PortRange(Sequence[int]):
+    """Arithmetic progression of port numbers, one entry per cable.
+
+    Lane allocation always hands out evenly spaced spans, so a bundle's ports
+    are stored as ``start``/``stride``/``length`` and expanded only on demand.
+    Compares equal to any sequence holding the same ports.
+    """
+
+    start: int
+    stride: int
+    length: int
+
+    @classmethod
+    def from_range(cls, lanes: range, offset: int = 0) -> PortRange:
+        return cls(start=offset + lanes.start, stride=lanes.step, length=len(lanes))
+
+    def as_range(self) -> range:
+        return range(self.start, self.start + self.stride * self.length, self.stride)
+
+    def to_list(self) -> list[int]:
+        return list(self.as_range())
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        if isinstance(index, slice):
+            return list(self.as_range()[index])
+        return self.as_range()[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.as_range())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PortRange):
+            return self.as_range() == other.as_range()
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(other) == self.length and all(
+                left == right for left, right in zip(self.as_range(), other)
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.as_range())
+
+    def __repr__(self) -> str:
+        return f"PortRange(start={self.start}, stride={self.stride}, length={self.length})"
+
 
 class GraphAttrs(TypedDict, total=False):
     is_multi_fabric: bool
     fabric_names: tuple[str, ...]
     fabric_name: str
+    canonical_edge_order: bool
+    canonical_edge_count: int
 
 
 class PortPoolAttrs(TypedDict):
@@ -23,8 +94,8 @@ class PortPoolAttrs(TypedDict):
 
 class LinkBundleAttrs(TypedDict, total=False):
     port_pool: str
-    source_ports: list[int]
-    target_ports: list[int]
+    source_ports: PortRange | list[int]
+    target_ports: PortRange | list[int]
     num_cables: int
     cable_bandwidth_gb: float
     source_lane_units_per_cable: int
@@ -47,6 +118,7 @@ class NodeAttrs(TypedDict, total=False):
     group_order: int | None
     node_ordinal: int
     physical_node_ordinal: int
+    sort_rank: int
     aggregate_bandwidth_gb: float
     aggregate_bandwidth_down: float
     aggregate_bandwidth_up: float
@@ -76,8 +148,8 @@ class FanoutAnnotation(TypedDict):
 class OrientedEdgeAllocation(TypedDict):
     source_node_id: str
     target_node_id: str
-    source_ports: list[int]
-    target_ports: list[int]
+    source_ports: Sequence[int]
+    target_ports: Sequence[int]
     source_lane_units: int
     target_lane_units: int
 
@@ -118,6 +190,95 @@ def flatten_node_attrs_for_fabric(
     return None
 
 
+def build_shared_gpu_node_attrs(node_attrs: dict[str, Any]) -> dict[str, Any]:
+    """Build the fabric-neutral base attrs of a shared GPU node.
+
+    Fabric-specific metrics are attached under ``fabric_metrics``.
+    """
+    physical_node_ordinal = node_attrs["physical_node_ordinal"]
+    return {
+        "layer_index": node_attrs["layer_index"],
+        "layer_name": node_attrs["layer_name"],
+        "placement": node_attrs["placement"],
+        "placement_scope": None,
+        "scope_names": (),
+        "scope_indexes": (),
+        "scope_labels": (),
+        "scope_key": (),
+        "group_name": None,
+        "group_index": None,
+        "group_label": None,
+        "node_ordinal": physical_node_ordinal,
+        "physical_node_ordinal": physical_node_ordinal,
+        "sort_rank": node_attrs["sort_rank"],
+        "group_order": None,
+        "is_shared_gpu_node": True,
+        "fabric_metrics": {},
+    }
+
+
+def build_node_attrs(
+    expanded_topology: ExpandedTopology,
+    expanded_layer: ExpandedLayer,
+    node_index: int,
+    usage: NodeUsage,
+) -> dict[str, Any]:
+    """Build the attrs of one expanded node, as both graph backends expose them."""
+    layer = expanded_layer.layer
+    scope = expanded_topology.scope_for_node(node_index)
+    group_index = None if scope is None else scope.group_index
+    port_pools = _build_port_pool_attrs(layer.port_pools, usage)
+    return {
+        "layer_index": layer.index,
+        "layer_name": layer.name,
+        "placement": layer.placement,
+        "placement_scope": None if scope is None else scope.placement,
+        "scope_names": () if scope is None else scope.scope_names,
+        "scope_indexes": () if scope is None else scope.scope_indexes,
+        "scope_labels": () if scope is None else scope.scope_labels,
+        "scope_key": () if scope is None else scope.scope_key,
+        "group_name": None if scope is None else scope.placement,
+        "group_index": group_index,
+        "group_label": None if scope is None else scope.group_label,
+        "group_order": group_index,
+        "node_ordinal": int(expanded_topology.node_ordinals[node_index]),
+        "physical_node_ordinal": int(
+            expanded_topology.node_physical_ordinals[node_index]
+        ),
+        "sort_rank": int(expanded_topology.node_sort_ranks[node_index]),
+        "aggregate_bandwidth_gb": usage.total_bandwidth_gb,
+        "aggregate_bandwidth_down": usage.bandwidth_down_gb,
+        "aggregate_bandwidth_up": usage.bandwidth_up_gb,
+        "port_pools": port_pools,
+        "supported_port_bandwidths_gb": expanded_layer.supported_port_bandwidths_gb,
+        "used_bandwidth_gb": usage.total_bandwidth_gb,
+        "fabric": expanded_layer.fabric_name,
+        "is_shared_gpu_node": expanded_layer.is_shared_gpu_node,
+    }
+
+
+def _build_port_pool_attrs(
+    port_pools: tuple[PortPoolConfig, ...],
+    usage: NodeUsage,
+) -> tuple[PortPoolAttrs, ...]:
+    pool_attrs: list[PortPoolAttrs] = []
+    lane_offset = 0
+    for port_pool in port_pools:
+        used_lane_units = usage.required_lane_units_for_pool(port_pool.name)
+        pool_attrs.append(
+            {
+                "name": port_pool.name,
+                "total_lane_units": port_pool.total_lane_units,
+                "used_lane_units": used_lane_units,
+                "port_offset": lane_offset,
+                "base_lane_bandwidth_gb": port_pool.base_lane_bandwidth_gb,
+                "supported_port_bandwidths_gb": port_pool.supported_port_bandwidths_gb,
+            }
+        )
+        lane_offset += port_pool.total_lane_units
+    return tuple(pool_attrs)
+
+
 def is_multi_fabric_graph(graph: nx.Graph) -> bool:
     return bool(graph_attrs(graph).get("is_multi_fabric"))
 
@@ -126,6 +287,37 @@ def fabric_names(graph: nx.Graph) -> tuple[str, ...]:
     return tuple(graph_attrs(graph).get("fabric_names", ()))
 
 
+def check_known_fabric(known_fabrics: tuple[str, ...], fabric_name: str) -> None:
+    if fabric_name not in known_fabrics:
+        raise KeyError(
+            f"Unknown fabric {fabric_name!r}; available fabrics are {known_fabrics!r}."
+        )
+
+
+def set_canonical_edge_order(graph: TopologyGraph, in_order: bool) -> None:
+    """Record whether ``graph.edges()`` yields bundles in cut-sheet order.
+
+    The graph's current edge count is recorded with the flag.
+    """
+    metadata = graph_attrs(graph)
+    metadata["canonical_edge_order"] = in_order
+    metadata["canonical_edge_count"] = graph.number_of_edges()
+
+
+def has_canonical_edge_order(graph: TopologyGraph) -> bool:
+    """Whether ``graph.edges()`` already yields bundles in cut-sheet order.
+
+    The flag only holds for graphs left as ``generate_topology`` built them.
+    It is ignored once the edge count differs from the one recorded with it,
+    so adding or removing edges falls back to sorting. Edits that keep the
+    count, such as removing an edge and adding it back, are not detected.
+    """
+    metadata = graph_attrs(graph)
+    return bool(metadata.get("canonical_edge_order")) and metadata.get(
+        "canonical_edge_count"
+    ) == graph.number_of_edges()
+
+
 def fabric_name_for_edge(attrs: EdgeAttrs | dict[str, object]) -> str | None:
     fabric = attrs.get("fabric")
     return fabric if isinstance(fabric, str) else None
@@ -186,6 +378,20 @@ def natural_sort_key(value: str) -> tuple[object, ...]:
     return tuple(int(part) if part.isdigit() else part for part in parts)
 
 
+def sort_node_items(
+    node_items: Iterable[tuple[str, Any]],
+) -> list[tuple[str, Any]]:
+    """Sort ``(node_id, attrs)`` pairs into canonical node order.
+
+    Uses the integer ``sort_rank`` stamped by ``generate_topology`` when every
+    node carries one, and falls back to ``node_sort_key`` otherwise.
+    """
+    items = list(node_items)
+    if all("sort_rank" in attrs for _, attrs in items):
+        return sorted(items, key=lambda item: item[1]["sort_rank"])
+    return sorted(items, key=lambda item: node_sort_key(item[0], item[1]))
+
+
 def node_sort_key(
     node_id: str,
     attrs: NodeAttrs | dict[str, object],
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections.abc import Iterator
+from dataclasses import replace
+from itertools import chain, islice
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from topology_generator.config_cache import ConfigCache
+from topology_generator.config_identifiers import normalize_identifier
+from topology_generator.config_types import TopologyConfig
+from topology_generator.pipeline import OutputTimings
+from topology_generator.topology_generator import build_fabric_output_name
+
+if TYPE_CHECKING:
+    from topology_generator.port_mapper import FabricRowBlock
+
+
+logger = logging.getLogger(__name__)
+
+ROWS_SUFFIX = ".fabric-rows.pickle"
+DIAGRAM_SUFFIX = ".fabric-diagram.pickle"
+# Rows are cached and read back in chunks of this many, so no fabric's
+# cut-sheet is ever held in memory whole.
+ROW_CHUNK_ROWS = 10_000
+
+
+def select_fabrics(
+    config: TopologyConfig,
+    fabric_names: tuple[str, ...],
+) -> TopologyConfig:
+    """Return ``config`` reduced to ``fabric_names`` and their GPU port pools.
+
+    The shared groupings and GPU node count are kept, so every kept fabric
+    expands to the same nodes, cables and ports as in the full config. Names
+    are compared normalized, as ``GpuNodesConfig.port_pools_for_fabric``
+    resolves them.
+    """
+    if config.gpu_nodes is None:
+        raise ValueError("Only multi-fabric configs can be split by fabric.")
+    kept = {normalize_identifier(fabric_name) for fabric_name in fabric_names}
+    return replace(
+        config,
+        fabrics=tuple(
+            fabric
+            for fabric in config.fabrics
+            if normalize_identifier(fabric.name) in kept
+        ),
+        gpu_nodes=replace(
+            config.gpu_nodes,
+            fabric_port_pools=tuple(
+                fabric_port_pools
+                for fabric_port_pools in config.gpu_nodes.fabric_port_pools
+                if normalize_identifier(fabric_port_pools.name) in kept
+            ),
+        ),
+    )
+
+
+def fabric_fingerprints(config: TopologyConfig) -> dict[str, str]:
+    """Return a digest of every input that shapes each fabric's outputs.
+
+    A fabric's digest covers its ``EffectiveFabricConfig`` (whose GPU layer
+    carries the fabric's ``gpu_nodes`` port pools), the shared groupings and
+    the GPU node count, so editing one fabric leaves the others' digests
+    unchanged.
+    """
+    if config.gpu_nodes is None:
+        raise ValueError("Only multi-fabric configs have per-fabric fingerprints.")
+    shared = repr((config.groupings, config.gpu_nodes.total_nodes))
+    return {
+        fabric.name: hashlib.sha256(repr((fabric, shared)).encode()).hexdigest()
+        for fabric in config.iter_fabrics()
+        if fabric.name is not None
+    }
+
+
+def write_outputs_incremental(
+    config: TopologyConfig,
+    output_dir: str | PathLike[str],
+    cache: ConfigCache,
+    output_format: str = "xlsx",
+    jobs: int | None = None,
+    graph_backend: str = "networkx",
+    render: bool = True,
+    cutsheet: bool = True,
+) -> OutputTimings:
+    """Write the outputs of a multi-fabric config, rebuilding only changed fabrics.
+
+    Each fabric's diagram and cut-sheet rows are cached under its
+    fingerprint. Fabrics without cached outputs are expanded, built and
+    rendered together as one smaller config; the rest are copied from the
+    cache. The cut-sheet is then streamed from the cached rows in fabric
+    order, numbering cables continuously, so every file matches a full run.
+    Rows are written to and read from the cache in chunks, so memory stays
+    flat as with ``write_port_mapping``.
+    """
+    started = time.perf_counter()
+    if cutsheet:
+        from topology_generator.cutsheet_formats import (
+            port_mapping_filename,
+            write_port_mapping_blocks,
+        )
+
+        # Reject an unknown format before any fabric is rebuilt.
+        port_mapping_filename(output_format)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    keys = {
+        fabric_name: cache.key_for(fingerprint.encode())
+        for fabric_name, fingerprint in fabric_fingerprints(config).items()
+    }
+
+    diagrams: dict[str, bytes | None] = {}
+    blocks: dict[str, FabricRowBlock | None] = {}
+    for fabric_name, key in keys.items():
+        if render:
+            diagrams[fabric_name] = cache.get(key, DIAGRAM_SUFFIX, bytes)
+        if cutsheet:
+            # Open every hit now, before new entries can evict it.
+            blocks[fabric_name] = _cached_rows(cache, key)
+    stale = tuple(
+        fabric_name
+        for fabric_name in keys
+        if diagrams.get(fabric_name, b"") is None
+        or blocks.get(fabric_name, []) is None
+    )
+    logger.info(
+        "Reusing cached outputs for %d of %d fabrics; regenerating: %s",
+        len(keys) - len(stale),
+        len(keys),
+        ", ".join(stale) or "none",
+    )
+
+    render_seconds: float | None = None
+    if stale:
+        from topology_generator.topology_generator import generate_topology
+
+        stage_started = time.perf_counter()
+        graph = generate_topology(
+            select_fabrics(config, stale),
+            graph_backend=graph_backend,
+        )
+        logger.info(
+            "Successfully generated topology for %d fabrics in %.2fs",
+            len(stale),
+            time.perf_counter() - stage_started,
+        )
+        if render:
+            from topology_generator.rendering import visualize_topology
+
+            stage_started = time.perf_counter()
+            visualize_topology(graph, output_dir, jobs=jobs)
+            render_seconds = time.perf_counter() - stage_started
+            for fabric_name in stale:
+                diagram = _diagram_path(output_dir, fabric_name).read_bytes()
+                cache.put(keys[fabric_name], DIAGRAM_SUFFIX, diagram)
+                diagrams[fabric_name] = diagram
+        if cutsheet:
+            from topology_generator.port_mapper import fabric_row_blocks
+
+            for fabric_name, graph_block in fabric_row_blocks(graph).items():
+                cache.put_chunks(
+                    keys[fabric_name],
+                    ROWS_SUFFIX,
+                    graph_block.row_count,
+                    _iter_row_chunks(iter(graph_block.rows)),
+                )
+                blocks[fabric_name] = _cached_rows(cache, keys[fabric_name])
+            uncached = [fabric_name for fabric_name in stale if blocks[fabric_name] is None]
+            if uncached:
+                # The cache could not keep these rows; stream them from the graph.
+                graph_blocks = fabric_row_blocks(graph)
+                for fabric_name in uncached:
+                    blocks[fabric_name] = graph_blocks[fabric_name]
+
+    if render:
+        stage_started = time.perf_counter()
+        for fabric_name, cached_diagram in diagrams.items():
+            if fabric_name in stale:
+                continue
+            # Fabrics missing a cached diagram are stale and were rendered above.
+            assert cached_diagram is not None
+            _diagram_path(output_dir, fabric_name).write_bytes(cached_diagram)
+        render_seconds = (render_seconds or 0.0) + time.perf_counter() - stage_started
+        logger.info("Successfully visualized topology in %.2fs", render_seconds)
+
+    row_count: int | None = None
+    cutsheet_seconds: float | None = None
+    if cutsheet:
+        stage_started = time.perf_counter()
+        fabric_blocks: dict[str, FabricRowBlock] = {}
+        for fabric_name, block in blocks.items():
+            # Fabrics missing cached rows are stale and were rebuilt above.
+            assert block is not None
+            fabric_blocks[fabric_name] = block
+        row_count = write_port_mapping_blocks(fabric_blocks, output_dir, output_format)
+        cutsheet_seconds = time.perf_counter() - stage_started
+        logger.info(
+            "Successfully created cut-sheet/port-mapping (%d cables) in %.2fs",
+            row_count,
+            cutsheet_seconds,
+        )
+
+    timings = OutputTimings(
+        render_seconds=render_seconds,
+        cutsheet_seconds=cutsheet_seconds,
+        total_seconds=time.perf_counter() - started,
+        row_count=row_count,
+    )
+    logger.info("Output stages finished in %.2fs", timings.total_seconds)
+    return timings
+
+
+def _cached_rows(cache: ConfigCache, key: str) -> FabricRowBlock | None:
+    from topology_generator.port_mapper import FabricRowBlock
+
+    entry = cache.get_chunks(key, ROWS_SUFFIX, int)
+    if entry is None:
+        return None
+    row_count, chunks = entry
+    rows = chain.from_iterable(cast(Iterator[list[tuple[object, ...]]], chunks))
+    return FabricRowBlock(row_count, rows)
+
+
+def _iter_row_chunks(
+    rows: Iterator[tuple[object, ...]],
+) -> Iterator[list[tuple[object, ...]]]:
+    while chunk := list(islice(rows, ROW_CHUNK_ROWS)):
+        yield chunk
+
+
+def _diagram_path(output_dir: Path, fabric_name: str) -> Path:
+    return output_dir / f"topology_{build_fabric_output_name(fabric_name)}.png"
@@ -8,7 +8,10 @@ from topology_generator.file_handler import ensure_output_dir
 LOGGER_NAME = "topology_generator"
 
 
-def setup_logging(output_dir: str | PathLike[str]) -> logging.Logger:
+def setup_logging(
+    output_dir: str | PathLike[str],
+    console: bool = True,
+) -> logging.Logger:
     """
     Set up logging configuration for the application.
 
@@ -17,6 +20,7 @@ def setup_logging(output_dir: str | PathLike[str]) -> logging.Logger:
 
     Args:
         output_dir: Final output directory for generated files.
+        console: Also log to stdout; batch runs only write the log file.
 
     Returns:
         logging.Logger: Configured logger instance.
@@ -32,12 +36,12 @@ def setup_logging(output_dir: str | PathLike[str]) -> logging.Logger:
 
     formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
-    stream_handler = logging.StreamHandler(sys.stdout)
-    stream_handler.setFormatter(formatter)
+    if console:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
 
     file_handler = logging.FileHandler(output_path / "network_topology.log", mode="w")
     file_handler.setFormatter(formatter)
-
-    logger.addHandler(stream_handler)
     logger.addHandler(file_handler)
     return logger
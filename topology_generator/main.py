@@ -1,4 +1,12 @@
-from topology_generator.argparser import parse_args
+import sys
+import time
+from os import PathLike
+from typing import TYPE_CHECKING
+
+from topology_generator.argparser import parse_args, parse_batch_args, parse_serve_args
+
+if TYPE_CHECKING:
+    from topology_generator.config_cache import ConfigCache
 
 
 def main():
@@ -6,53 +14,182 @@ def main():
     Main entry point for the network topology generator application.
 
     Orchestrates the entire workflow:
-    1. Parse command line arguments
+    1. Parse command line arguments (``--check`` stops after ``run_check``,
+       ``batch`` hands over to ``batch.run_batch`` and ``serve`` to
+       ``service.serve``)
     2. Set up logging
-    3. Load configuration
-    4. Generate network topology
-    5. Visualize the topology
-    6. Create port mapping documentation
-    7. Write generated outputs
+    3. Load configuration, from the validated-config cache with ``--cache``
+    4. Generate network topology, or only validate it with ``--only validate``
+    5. Visualize the topology and, concurrently, write the port mapping;
+       ``--only`` skips the stages that are not needed. With the cache, a
+       multi-fabric config only rebuilds fabrics that changed since a
+       previous run
+    6. Log per-stage and total wall-clock times
     """
+    started = time.perf_counter()
+    if sys.argv[1:2] == ["batch"]:
+        from topology_generator.batch import run_batch_command
+
+        run_batch_command(parse_batch_args())
+        return
+    if sys.argv[1:2] == ["serve"]:
+        from topology_generator.service import run_serve_command
+
+        run_serve_command(parse_serve_args())
+        return
+
     # Parse command line arguments
     args = parse_args()
-    from topology_generator.file_handler import load_config_from_file, resolve_output_dir
-    from topology_generator.logger import setup_logging
+    if args.check:
+        run_check(args.config, _config_cache(args.cache, args.cache_dir))
+        return
+
+    from topology_generator.file_handler import resolve_output_dir
+
+    run_topology(
+        args.config,
+        resolve_output_dir(args.output_dir, args.timestamp),
+        output_format=args.output_format,
+        graph_backend=args.graph_backend,
+        jobs=args.jobs,
+        only=args.only,
+        cache=_config_cache(args.cache, args.cache_dir),
+        started=started,
+    )
+
+
+def run_topology(
+    config_path: str | PathLike[str],
+    output_dir: str | PathLike[str],
+    output_format: str = "xlsx",
+    graph_backend: str = "networkx",
+    jobs: int | None = None,
+    only: str | None = None,
+    cache: "ConfigCache | None" = None,
+    console: bool = True,
+    started: float | None = None,
+) -> None:
+    """
+    Generate the outputs of one config into ``output_dir`` and log to it.
 
-    output_dir = resolve_output_dir(args.output_dir, args.timestamp)
+    Runs steps 2-6 of ``main``. ``started`` is the ``time.perf_counter()``
+    value the reported total is measured from; it defaults to now.
+    """
+    if started is None:
+        started = time.perf_counter()
+
+    from topology_generator.file_handler import load_config_from_file
+    from topology_generator.logger import setup_logging
 
     # Set up logging with the output directory
-    logger = setup_logging(output_dir)
+    logger = setup_logging(output_dir, console=console)
     logger.info("Created output directory: %s", output_dir)
 
     try:
-        # Load configuration from file
-        config = load_config_from_file(args.config)
+        # Load configuration from file, reusing a cached validated copy
+        config = load_config_from_file(config_path, cache=cache)
+
+        if only == "validate":
+            # Expand and check the config without importing a graph backend
+            from topology_generator.validator import validate_topology_config
+
+            stage_started = time.perf_counter()
+            expanded_topology = validate_topology_config(
+                config,
+                cache.expand(config_path, config) if cache is not None else None,
+            )
+            logger.info(
+                "Configuration is valid (%d nodes, %d links) in %.2fs",
+                expanded_topology.num_nodes,
+                expanded_topology.num_links,
+                time.perf_counter() - stage_started,
+            )
+        elif (
+            cache is not None
+            and config.is_multi_fabric
+            and only in (None, "render", "cutsheet")
+        ):
+            # Rebuild only the fabrics whose outputs are not cached yet
+            from topology_generator.incremental import write_outputs_incremental
+
+            write_outputs_incremental(
+                config,
+                output_dir,
+                cache,
+                output_format,
+                jobs=jobs,
+                graph_backend=graph_backend,
+                render=only in (None, "render"),
+                cutsheet=only in (None, "cutsheet"),
+            )
+        else:
+            # Generate network topology
+            from topology_generator.topology_generator import generate_topology
+
+            stage_started = time.perf_counter()
+            topology = generate_topology(
+                config,
+                graph_backend=graph_backend,
+                expanded_topology=(
+                    cache.expand(config_path, config) if cache is not None else None
+                ),
+            )
+            logger.info(
+                "Successfully generated topology in %.2fs",
+                time.perf_counter() - stage_started,
+            )
+
+            if only != "graph":
+                # Render the diagram and stream the cut-sheet; the two stages
+                # overlap when both run
+                from topology_generator.pipeline import write_outputs
+
+                write_outputs(
+                    topology,
+                    output_dir,
+                    output_format,
+                    jobs=jobs,
+                    render=only in (None, "render"),
+                    cutsheet=only in (None, "cutsheet"),
+                )
+
+        logger.info("Finished in %.2fs", time.perf_counter() - started)
 
-        # Generate network topology
-        from topology_generator.topology_generator import generate_topology
+    except Exception:
+        logger.exception("Error during execution")
+        raise
 
-        topology = generate_topology(config)
-        logger.info("Successfully generated topology")
 
-        # Visualize the topology
-        from topology_generator.rendering import visualize_topology
+def run_check(config_path: str, cache: "ConfigCache | None" = None) -> None:
+    """
+    Validate port budgets analytically and print topology statistics.
+
+    Stops after config parsing and closed-form capacity validation; no graph,
+    renderer, pandas or output directory is ever created. A ``cache`` skips
+    parsing for configs that were loaded before.
 
-        visualize_topology(topology, output_dir)
-        logger.info("Successfully visualized topology")
+    Raises:
+        SystemExit: With the validation errors when the config is invalid.
+    """
+    from topology_generator.capacity import validate_topology_capacity
+    from topology_generator.capacity_report import format_capacity_report
+    from topology_generator.config_types import InvalidTopologyConfig
+    from topology_generator.file_handler import load_config_from_file
+    from topology_generator.validator import TopologyValidationError
 
-        # Create port mapping documentation
-        from topology_generator.port_mapper import create_port_mapping, save_to_excel
+    try:
+        capacity = validate_topology_capacity(load_config_from_file(config_path, cache))
+    except (InvalidTopologyConfig, TopologyValidationError) as exc:
+        raise SystemExit(f"Topology check failed:\n{exc}") from exc
+    print(format_capacity_report(capacity))
 
-        port_mapping = create_port_mapping(topology)
 
-        # Save the port mapping in Excel format
-        save_to_excel(port_mapping, output_dir)
-        logger.info("Successfully created cut-sheet/port-mapping")
+def _config_cache(cache: bool, cache_dir: str | None) -> "ConfigCache | None":
+    if not cache and cache_dir is None:
+        return None
+    from topology_generator.config_cache import ConfigCache
 
-    except Exception:
-        logger.exception("Error during execution")
-        raise
+    return ConfigCache(cache_dir)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import repeat
+from typing import TypeVar
+
+from topology_generator.graph_metadata import TopologyGraph
+
+
+TaskT = TypeVar("TaskT")
+ResultT = TypeVar("ResultT")
+
+_worker_graph: TopologyGraph | None = None
+
+
+def resolve_worker_count(jobs: int | None, task_count: int) -> int:
+    """Return how many worker processes to use for ``task_count`` tasks.
+
+    ``jobs=None`` means one worker per CPU.
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError("jobs must be at least 1.")
+    return max(1, min(task_count, jobs or os.cpu_count() or 1))
+
+
+def map_with_graph(
+    graph: TopologyGraph,
+    function: Callable[[TopologyGraph, TaskT], ResultT],
+    tasks: Sequence[TaskT],
+    jobs: int | None = 1,
+) -> list[ResultT]:
+    """Call ``function(graph, task)`` for every task and return results in order.
+
+    With more than one worker the tasks run in a process pool. The graph is
+    handed to each worker once through the pool initializer, which is free
+    under the ``fork`` start method, rather than pickled with every task.
+    ``function`` must be a module-level callable (or a ``functools.partial``
+    of one) so it can be sent to the workers.
+    """
+    workers = resolve_worker_count(jobs, len(tasks))
+    if workers <= 1:
+        return [function(graph, task) for task in tasks]
+
+    with graph_executor(graph, workers) as executor:
+        return list(executor.map(_call_with_worker_graph, repeat(function), tasks))
+
+
+def graph_executor(graph: TopologyGraph, workers: int) -> ProcessPoolExecutor:
+    """Return a process pool whose workers already hold ``graph``.
+
+    Submit work to it with ``submit_with_graph``.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(graph,),
+    )
+
+
+def submit_with_graph(
+    executor: ProcessPoolExecutor,
+    function: Callable[[TopologyGraph, TaskT], ResultT],
+    task: TaskT,
+) -> Future[ResultT]:
+    """Schedule ``function(graph, task)`` on a pool from ``graph_executor``."""
+    return executor.submit(_call_with_worker_graph, function, task)
+
+
+def _init_worker(graph: TopologyGraph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _call_with_worker_graph(
+    function: Callable[[TopologyGraph, TaskT], ResultT],
+    task: TaskT,
+) -> ResultT:
+    assert _worker_graph is not None
+    return function(_worker_graph, task)
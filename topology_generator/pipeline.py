@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from os import PathLike
+
+from topology_generator.graph_metadata import TopologyGraph
+from topology_generator.parallel import graph_executor, submit_with_graph
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OutputTimings:
+    """Wall-clock seconds spent producing the diagram and the cut-sheet.
+
+    A stage that was skipped has ``None`` for its time, and a skipped
+    cut-sheet also has ``None`` for ``row_count``.
+    """
+
+    render_seconds: float | None
+    cutsheet_seconds: float | None
+    total_seconds: float
+    row_count: int | None
+
+
+def write_outputs(
+    graph: TopologyGraph,
+    output_dir: str | PathLike[str],
+    output_format: str = "xlsx",
+    jobs: int | None = None,
+    render: bool = True,
+    cutsheet: bool = True,
+) -> OutputTimings:
+    """Render the diagram and write the cut-sheet for a finished graph.
+
+    Both stages only read the graph, so when both run and ``jobs`` is not 1
+    the diagram is rendered in a subprocess while the cut-sheet is written in
+    this process. A stage's modules (Matplotlib for the diagram, the cut-sheet
+    writers for the cut-sheet) are only imported when it runs. Per-stage and
+    total wall-clock times are logged and returned.
+    """
+    started = time.perf_counter()
+    render_seconds: float | None = None
+    cutsheet_seconds: float | None = None
+    row_count: int | None = None
+    if render and cutsheet and jobs != 1:
+        with graph_executor(graph, 1) as executor:
+            render_future = submit_with_graph(executor, _render, (output_dir, jobs))
+            row_count, cutsheet_seconds = _write_cutsheet(
+                graph, output_dir, output_format, jobs
+            )
+            render_seconds = render_future.result()
+        logger.info("Successfully visualized topology in %.2fs", render_seconds)
+    else:
+        if render:
+            render_seconds = _render(graph, (output_dir, jobs))
+            logger.info("Successfully visualized topology in %.2fs", render_seconds)
+        if cutsheet:
+            row_count, cutsheet_seconds = _write_cutsheet(
+                graph, output_dir, output_format, jobs
+            )
+
+    timings = OutputTimings(
+        render_seconds=render_seconds,
+        cutsheet_seconds=cutsheet_seconds,
+        total_seconds=time.perf_counter() - started,
+        row_count=row_count,
+    )
+    logger.info("Output stages finished in %.2fs", timings.total_seconds)
+    return timings
+
+
+def _render(
+    graph: TopologyGraph,
+    task: tuple[str | PathLike[str], int | None],
+) -> float:
+    from topology_generator.render_environment import use_agg_backend_in_worker
+    from topology_generator.rendering import visualize_topology
+
+    output_dir, jobs = task
+    use_agg_backend_in_worker()
+    started = time.perf_counter()
+    visualize_topology(graph, output_dir, jobs=jobs)
+    return time.perf_counter() - started
+
+
+def _write_cutsheet(
+    graph: TopologyGraph,
+    output_dir: str | PathLike[str],
+    output_format: str,
+    jobs: int | None,
+) -> tuple[int, float]:
+    from topology_generator.cutsheet_formats import write_port_mapping
+
+    started = time.perf_counter()
+    row_count = write_port_mapping(graph, output_dir, output_format, jobs=jobs)
+    seconds = time.perf_counter() - started
+    logger.info(
+        "Successfully created cut-sheet/port-mapping (%d cables) in %.2fs",
+        row_count,
+        seconds,
+    )
+    return row_count, seconds
@@ -1,30 +1,45 @@
+from __future__ import annotations
+
+import logging
 from os import PathLike
 from pathlib import Path
-from collections.abc import Mapping
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
-from typing import cast
+from functools import cached_property, partial
+from itertools import islice
+from typing import TYPE_CHECKING, cast
+from weakref import WeakKeyDictionary
 
-import networkx as nx
-import pandas as pd
+import numpy as np
+import numpy.typing as npt
 
 from topology_generator.graph_metadata import (
     EdgeAttrs,
     LinkBundleAttrs,
     NodeAttrs,
     OrientedEdgeAllocation,
+    PortRange,
+    TopologyGraph,
     cable_bandwidth_gb,
     fabric_name_for_edge,
     flatten_node_attrs_for_fabric,
+    has_canonical_edge_order,
     is_multi_fabric_graph,
     link_bundle_attrs,
-    natural_sort_key,
     node_group_label,
-    node_sort_key,
+    sort_node_items,
 )
+from topology_generator.parallel import map_with_graph, resolve_worker_count
 from topology_generator.topology_generator import (
+    build_fabric_output_name,
     get_fabric_names,
 )
 
+if TYPE_CHECKING:
+    # pandas and openpyxl are imported where they are used, so callers that
+    # only stream CSV never pay for them.
+    import pandas as pd
+
 
 PORT_MAPPING_COLUMNS = [
     "source_serial_number",
@@ -41,56 +56,115 @@ PORT_MAPPING_COLUMNS = [
     "cable_number",
 ]
 MULTI_FABRIC_PORT_MAPPING_COLUMNS = ["fabric", *PORT_MAPPING_COLUMNS]
+EXCEL_SHEET_NAME = "Sheet1"
+# One row of every sheet is taken by the header.
+EXCEL_MAX_DATA_ROWS = 1_048_575
+
+logger = logging.getLogger(__name__)
+
+_SHARD_EDGES_BY_GRAPH: WeakKeyDictionary[
+    TopologyGraph,
+    tuple[int, dict[str, list[tuple[str, str, dict[str, object]]]]],
+] = WeakKeyDictionary()
 
 
 @dataclass(frozen=True)
 class PortMappingContext:
     fabric_name: str | None
     node_attrs_by_id: dict[str, NodeAttrs]
-    node_sort_keys: dict[str, tuple[object, ...]]
+    group_labels: dict[str, str]
+    edges_in_order: bool = False
+
+    @cached_property
+    def node_ranks(self) -> dict[str, int]:
+        """Per-node positions in cut-sheet order, only built when edges need sorting."""
+        return {
+            node_id: rank
+            for rank, (node_id, _) in enumerate(
+                sort_node_items(self.node_attrs_by_id.items())
+            )
+        }
+
+
+@dataclass(frozen=True)
+class BundleAllocation:
+    """One link bundle oriented lower layer to upper layer for the cut-sheet."""
+
+    source_node_id: str
+    target_node_id: str
+    source_ports: Sequence[int]
+    target_ports: Sequence[int]
+    source_lane_units: int
+    target_lane_units: int
+    cable_bandwidth_gb: float
+
+
+@dataclass(frozen=True)
+class PortMappingShard:
+    """One cut-sheet workbook covering a contiguous run of cable rows."""
+
+    filename: str
+    fabric_name: str | None
+    first_row: int
+    row_count: int
+    first_cable_number: int
 
 
-def extract_port_mapping_rows(graph: nx.Graph) -> list[dict[str, object]]:
+@dataclass(frozen=True)
+class FabricRowBlock:
+    """One fabric's rows from ``iter_fabric_rows``, counted up front.
+
+    ``rows`` may be a one-shot iterator, such as rows streamed from a cache
+    file; the block writers read it once, in order.
+    """
+
+    row_count: int
+    rows: Iterable[tuple[object, ...]]
+
+
+def extract_port_mapping_rows(graph: TopologyGraph) -> list[dict[str, object]]:
     """Extract stable, per-cable mapping rows from the topology graph."""
+    columns = port_mapping_columns(graph)
+    return [dict(zip(columns, values)) for values in iter_port_mapping_values(graph)]
+
+
+def iter_port_mapping_values(graph: TopologyGraph) -> Iterator[tuple[object, ...]]:
+    """Yield per-cable row values in ``port_mapping_columns(graph)`` order.
+
+    Rows are produced lazily, so callers can stream the cut-sheet without
+    materialising every cable at once.
+    """
     if not is_multi_fabric_graph(graph):
-        context = _build_port_mapping_context(graph)
-        single_fabric_rows, _ = _extract_rows_for_context(
-            context,
-            list(graph.edges(data=True)),
-            cable_counter=1,
-        )
-        return single_fabric_rows
+        yield from _iter_fabric_values(graph, None, graph.edges(data=True), 1)
+        return
 
-    rows: list[dict[str, object]] = []
-    cable_counter = 1
-    edges_by_fabric: dict[str, list[tuple[str, str, dict[str, object]]]] = {
-        fabric_name: [] for fabric_name in get_fabric_names(graph)
-    }
-    for source_node_id, target_node_id, attrs in graph.edges(data=True):
-        fabric_name = fabric_name_for_edge(cast(EdgeAttrs, attrs))
-        if fabric_name is None:
-            continue
-        edges_by_fabric[fabric_name].append((source_node_id, target_node_id, attrs))
+    cable_number = 1
+    for fabric_name, edges in _edges_by_fabric(graph).items():
+        yield from _iter_fabric_values(graph, fabric_name, edges, cable_number)
+        cable_number += _count_edge_cables(edges)
 
-    for fabric_name in get_fabric_names(graph):
-        context = _build_port_mapping_context(graph, fabric_name)
-        fabric_rows, cable_counter = _extract_rows_for_context(
-            context,
-            edges_by_fabric[fabric_name],
-            cable_counter,
-        )
-        rows.extend(fabric_rows)
-    return rows
 
+def port_mapping_columns(graph: TopologyGraph) -> list[str]:
+    """Return the cut-sheet column names for ``graph``."""
+    if is_multi_fabric_graph(graph):
+        return MULTI_FABRIC_PORT_MAPPING_COLUMNS
+    return PORT_MAPPING_COLUMNS
 
-def create_port_mapping(graph: nx.Graph) -> pd.DataFrame:
-    """Create a port mapping from the network topology graph."""
-    columns = (
-        MULTI_FABRIC_PORT_MAPPING_COLUMNS
-        if is_multi_fabric_graph(graph)
-        else PORT_MAPPING_COLUMNS
-    )
-    return pd.DataFrame(extract_port_mapping_rows(graph), columns=columns)
+
+def create_port_mapping(graph: TopologyGraph) -> pd.DataFrame:
+    """Create a port mapping from the network topology graph.
+
+    Columns are built directly from edge bundles as typed arrays: categorical
+    node IDs, group labels and fabric names, int32 ports and lane units, and
+    float bandwidth.
+    """
+    builder = _PortMappingFrameBuilder()
+    if not is_multi_fabric_graph(graph):
+        builder.add_context(_build_port_mapping_context(graph), graph.edges(data=True))
+    else:
+        for fabric_name, edges in _edges_by_fabric(graph).items():
+            builder.add_context(_build_port_mapping_context(graph, fabric_name), edges)
+    return builder.to_frame(port_mapping_columns(graph))
 
 
 def save_to_excel(
@@ -104,76 +178,532 @@ def save_to_excel(
     df.to_excel(output_dir / filename, index=False)
 
 
-def _extract_rows_for_context(
-    context: PortMappingContext,
+def plan_port_mapping_shards(
+    graph: TopologyGraph,
+    filename: str = "port_mapping.xlsx",
+    max_rows_per_sheet: int = EXCEL_MAX_DATA_ROWS,
+) -> list[PortMappingShard]:
+    """Split the cut-sheet into workbooks that each fit in one Excel sheet.
+
+    A cut-sheet that fits keeps the single ``filename`` workbook. Larger ones
+    are split per fabric and then into numbered parts named after the
+    fabric's output name, e.g. ``port_mapping_backend_1.xlsx``. Cable numbers
+    stay continuous across shards.
+    """
+    if max_rows_per_sheet < 1:
+        raise ValueError("max_rows_per_sheet must be at least 1.")
+
+    return _plan_shards(_rows_by_fabric(graph), filename, max_rows_per_sheet)
+
+
+def _plan_shards(
+    rows_by_fabric: Mapping[str | None, int],
+    filename: str,
+    max_rows_per_sheet: int,
+) -> list[PortMappingShard]:
+    total_rows = sum(rows_by_fabric.values())
+    if total_rows <= max_rows_per_sheet:
+        return [PortMappingShard(filename, None, 0, total_rows, 1)]
+
+    output_name = Path(filename)
+    shards: list[PortMappingShard] = []
+    cable_number = 1
+    for fabric_name, row_count in rows_by_fabric.items():
+        prefix = output_name.stem
+        if fabric_name is not None:
+            prefix = f"{prefix}_{build_fabric_output_name(fabric_name)}"
+        for part, first_row in enumerate(range(0, row_count, max_rows_per_sheet), start=1):
+            shard_rows = min(max_rows_per_sheet, row_count - first_row)
+            shards.append(
+                PortMappingShard(
+                    filename=f"{prefix}_{part}{output_name.suffix}",
+                    fabric_name=fabric_name,
+                    first_row=first_row,
+                    row_count=shard_rows,
+                    first_cable_number=cable_number,
+                )
+            )
+            cable_number += shard_rows
+    return shards
+
+
+def plan_fabric_port_mapping_parts(
+    graph: TopologyGraph,
+    filename: str,
+) -> list[PortMappingShard]:
+    """Split a multi-fabric cut-sheet into one part per fabric, in fabric order.
+
+    Each part records the cable number its first row takes in the merged
+    cut-sheet, so parts built independently concatenate into exactly the
+    rows ``iter_port_mapping_values`` yields.
+    """
+    output_name = Path(filename)
+    parts: list[PortMappingShard] = []
+    cable_number = 1
+    for fabric_name, edges in _edges_by_fabric(graph).items():
+        row_count = _count_edge_cables(edges)
+        parts.append(
+            PortMappingShard(
+                filename=(
+                    f".{output_name.stem}_{build_fabric_output_name(fabric_name)}.part"
+                ),
+                fabric_name=fabric_name,
+                first_row=0,
+                row_count=row_count,
+                first_cable_number=cable_number,
+            )
+        )
+        cable_number += row_count
+    return parts
+
+
+def iter_fabric_rows(
+    graph: TopologyGraph,
+    fabric_name: str,
+) -> Iterator[tuple[object, ...]]:
+    """Yield one fabric's cut-sheet rows without the trailing ``cable_number``.
+
+    ``iter_numbered_blocks`` turns such per-fabric blocks back into numbered
+    rows, so a block stays valid when other fabrics gain or lose cables.
+    """
+    return _iter_fabric_rows(graph, fabric_name, _edges_by_fabric(graph)[fabric_name])
+
+
+def fabric_row_blocks(graph: TopologyGraph) -> dict[str, FabricRowBlock]:
+    """Return every fabric's ``iter_fabric_rows`` output as a counted block.
+
+    The edges are grouped by fabric once for all blocks; each block's rows
+    are built only as they are read.
+    """
+    return {
+        fabric_name: FabricRowBlock(
+            _count_edge_cables(edges),
+            _iter_fabric_rows(graph, fabric_name, edges),
+        )
+        for fabric_name, edges in _edges_by_fabric(graph).items()
+    }
+
+
+def iter_numbered_blocks(
+    blocks: Iterable[FabricRowBlock],
+) -> Iterator[tuple[object, ...]]:
+    """Append cable numbers to row blocks, continuing from block to block."""
+    cable_number = 1
+    for block in blocks:
+        for values in block.rows:
+            yield (*values, cable_number)
+            cable_number += 1
+
+
+def write_port_mapping_excel_blocks(
+    blocks: Mapping[str, FabricRowBlock],
+    output_path: str | PathLike[str],
+    filename: str = "port_mapping.xlsx",
+    max_rows_per_sheet: int = EXCEL_MAX_DATA_ROWS,
+) -> int:
+    """Write per-fabric row blocks from ``iter_fabric_rows`` as Excel workbooks.
+
+    Numbering and sharding match ``write_port_mapping_excel`` for the graph
+    the blocks came from. Each block's rows are streamed once, in order, so
+    memory stays flat. Returns the number of cable rows written.
+    """
+    if max_rows_per_sheet < 1:
+        raise ValueError("max_rows_per_sheet must be at least 1.")
+
+    output_dir = Path(output_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    shards = _plan_shards(
+        {fabric_name: block.row_count for fabric_name, block in blocks.items()},
+        filename,
+        max_rows_per_sheet,
+    )
+    # A fabric's shards are planned in row order, so each one continues
+    # reading where the previous one stopped.
+    fabric_rows = {fabric_name: iter(block.rows) for fabric_name, block in blocks.items()}
+    for shard in shards:
+        if shard.fabric_name is None:
+            values = iter_numbered_blocks(blocks.values())
+        else:
+            values = (
+                (*row_values, cable_number)
+                for cable_number, row_values in enumerate(
+                    islice(fabric_rows[shard.fabric_name], shard.row_count),
+                    start=shard.first_cable_number,
+                )
+            )
+        _save_workbook(
+            output_dir / shard.filename,
+            MULTI_FABRIC_PORT_MAPPING_COLUMNS,
+            values,
+        )
+    return sum(shard.row_count for shard in shards)
+
+
+def iter_shard_values(
+    graph: TopologyGraph,
+    shard: PortMappingShard,
+) -> Iterator[tuple[object, ...]]:
+    """Yield the cut-sheet value tuples covered by ``shard``.
+
+    Bundles before ``shard.first_row`` are skipped by their cable counts, so
+    a later shard does not build the rows of the shards before it.
+    """
+    edges: Iterable[tuple[str, str, dict[str, object]]]
+    if shard.fabric_name is not None:
+        edges = _shard_edges_by_fabric(graph)[shard.fabric_name]
+    elif not is_multi_fabric_graph(graph):
+        edges = graph.edges(data=True)
+    else:
+        # Only a cut-sheet that fits in one shard spans every fabric.
+        values = iter_port_mapping_values(graph)
+        return islice(values, shard.first_row, shard.first_row + shard.row_count)
+    values = _iter_fabric_values(
+        graph,
+        shard.fabric_name,
+        edges,
+        shard.first_cable_number,
+        first_row=shard.first_row,
+    )
+    return islice(values, shard.row_count)
+
+
+def write_port_mapping_excel(
+    graph: TopologyGraph,
+    output_path: str | PathLike[str],
+    filename: str = "port_mapping.xlsx",
+    max_rows_per_sheet: int = EXCEL_MAX_DATA_ROWS,
+    jobs: int | None = None,
+) -> int:
+    """Stream the port mapping for ``graph`` straight into Excel workbooks.
+
+    Uses openpyxl's write-only mode, so memory stays flat regardless of the
+    cable count. Cut-sheets over ``max_rows_per_sheet`` rows are sharded per
+    ``plan_port_mapping_shards`` and the shards are written by up to ``jobs``
+    worker processes (default: one per CPU). Returns the number of cable rows
+    written.
+    """
+    output_dir = Path(output_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    shards = plan_port_mapping_shards(graph, filename, max_rows_per_sheet)
+    row_count = sum(shard.row_count for shard in shards)
+    if len(shards) > 1:
+        logger.info(
+            "Cut-sheet has %d rows; writing %d workbooks with %d workers",
+            row_count,
+            len(shards),
+            resolve_worker_count(jobs, len(shards)),
+        )
+    map_with_graph(graph, partial(_write_shard, output_dir=output_dir), shards, jobs)
+    return row_count
+
+
+def _write_shard(graph: TopologyGraph, shard: PortMappingShard, output_dir: Path) -> None:
+    _save_workbook(
+        output_dir / shard.filename,
+        port_mapping_columns(graph),
+        iter_shard_values(graph, shard),
+    )
+
+
+def _save_workbook(
+    output_file: Path,
+    columns: list[str],
+    values: Iterable[tuple[object, ...]],
+) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(EXCEL_SHEET_NAME)
+    worksheet.append(columns)
+    for row_values in values:
+        worksheet.append(row_values)
+    workbook.save(output_file)
+
+
+def _rows_by_fabric(graph: TopologyGraph) -> dict[str | None, int]:
+    if not is_multi_fabric_graph(graph):
+        return {None: _count_edge_cables(graph.edges(data=True))}
+    return {
+        fabric_name: _count_edge_cables(edges)
+        for fabric_name, edges in _edges_by_fabric(graph).items()
+    }
+
+
+def _edges_by_fabric(
+    graph: TopologyGraph,
+) -> dict[str, list[tuple[str, str, dict[str, object]]]]:
+    edges_by_fabric: dict[str, list[tuple[str, str, dict[str, object]]]] = {
+        fabric_name: [] for fabric_name in get_fabric_names(graph)
+    }
+    for source_node_id, target_node_id, attrs in graph.edges(data=True):
+        fabric_name = fabric_name_for_edge(cast(EdgeAttrs, attrs))
+        if fabric_name is None:
+            continue
+        edges_by_fabric[fabric_name].append((source_node_id, target_node_id, attrs))
+    return edges_by_fabric
+
+
+def _shard_edges_by_fabric(
+    graph: TopologyGraph,
+) -> dict[str, list[tuple[str, str, dict[str, object]]]]:
+    """Return ``_edges_by_fabric(graph)``, grouped once per process.
+
+    Shard workers are handed the same graph for every shard they write. The
+    grouping is rebuilt if the graph's edge count changes.
+    """
+    edge_count = graph.number_of_edges()
+    cached = _SHARD_EDGES_BY_GRAPH.get(graph)
+    if cached is not None and cached[0] == edge_count:
+        return cached[1]
+    edges_by_fabric = _edges_by_fabric(graph)
+    _SHARD_EDGES_BY_GRAPH[graph] = (edge_count, edges_by_fabric)
+    return edges_by_fabric
+
+
+def _count_edge_cables(edges: Iterable[tuple[str, str, dict[str, object]]]) -> int:
+    return sum(
+        _require_int(bundle, "num_cables")
+        for _, _, attrs in edges
+        for bundle in link_bundle_attrs(cast(EdgeAttrs, attrs))
+    )
+
+
+def _iter_fabric_rows(
+    graph: TopologyGraph,
+    fabric_name: str,
     edges: list[tuple[str, str, dict[str, object]]],
-    cable_counter: int,
-) -> tuple[list[dict[str, object]], int]:
-    rows: list[dict[str, object]] = []
-    edge_bundles: list[tuple[str, str, LinkBundleAttrs, int]] = []
-    for source_node_id, target_node_id, attrs in edges:
-        for bundle_index, bundle in enumerate(link_bundle_attrs(cast(EdgeAttrs, attrs))):
-            edge_bundles.append((source_node_id, target_node_id, bundle, bundle_index))
-
-    sorted_edge_bundles = sorted(
-        edge_bundles,
-        key=lambda edge_bundle: (
-            _edge_sort_key(context, edge_bundle[0], edge_bundle[1]),
-            edge_bundle[3],
-        ),
+) -> Iterator[tuple[object, ...]]:
+    context = _build_port_mapping_context(graph, fabric_name)
+    for values in _iter_values_for_context(context, edges):
+        yield (fabric_name, *values)
+
+
+def _iter_fabric_values(
+    graph: TopologyGraph,
+    fabric_name: str | None,
+    edges: Iterable[tuple[str, str, dict[str, object]]],
+    first_cable_number: int,
+    first_row: int = 0,
+) -> Iterator[tuple[object, ...]]:
+    context = _build_port_mapping_context(graph, fabric_name)
+    fabric_prefix = () if fabric_name is None else (fabric_name,)
+    for cable_number, values in enumerate(
+        _iter_values_for_context(context, edges, first_row),
+        start=first_cable_number,
+    ):
+        yield (*fabric_prefix, *values, cable_number)
+
+
+def _iter_values_for_context(
+    context: PortMappingContext,
+    edges: Iterable[tuple[str, str, dict[str, object]]],
+    first_row: int = 0,
+) -> Iterator[tuple[object, ...]]:
+    for allocation in _iter_bundle_allocations(context, edges, first_row):
+        source_group = context.group_labels[allocation.source_node_id]
+        target_group = context.group_labels[allocation.target_node_id]
+        for source_port, target_port in zip(
+            allocation.source_ports,
+            allocation.target_ports,
+        ):
+            yield (
+                None,
+                source_group,
+                allocation.source_node_id,
+                source_port,
+                allocation.source_lane_units,
+                target_port,
+                allocation.target_lane_units,
+                allocation.target_node_id,
+                target_group,
+                None,
+                allocation.cable_bandwidth_gb,
+            )
+
+
+def _iter_bundle_allocations(
+    context: PortMappingContext,
+    edges: Iterable[tuple[str, str, dict[str, object]]],
+    first_row: int = 0,
+) -> Iterator[BundleAllocation]:
+    """Yield oriented bundles in cut-sheet order, one per run of cables.
+
+    Graphs from ``generate_topology`` already list edges in that order, so
+    only graphs built elsewhere are sorted. The first ``first_row`` cables are
+    skipped: whole bundles by their ``num_cables``, then the leading cables
+    of the bundle the skip ends in.
+    """
+    rows_to_skip = first_row
+    edge_bundles: Iterable[tuple[str, str, LinkBundleAttrs, int]] = (
+        (source_node_id, target_node_id, bundle, bundle_index)
+        for source_node_id, target_node_id, attrs in edges
+        for bundle_index, bundle in enumerate(link_bundle_attrs(cast(EdgeAttrs, attrs)))
     )
+    if not context.edges_in_order:
+        edge_bundles = _sort_edge_bundles(context, list(edge_bundles))
 
-    for source_node_id, target_node_id, bundle_attrs, _ in sorted_edge_bundles:
+    for source_node_id, target_node_id, bundle_attrs, _ in edge_bundles:
+        num_cables = _require_int(bundle_attrs, "num_cables")
+        if rows_to_skip >= num_cables:
+            rows_to_skip -= num_cables
+            continue
         oriented = _orient_edge_allocation(
             context,
             source_node_id,
             target_node_id,
             bundle_attrs,
         )
-        source_node_id = oriented["source_node_id"]
-        target_node_id = oriented["target_node_id"]
+        _validate_edge_allocation(
+            oriented["source_node_id"],
+            oriented["target_node_id"],
+            oriented["source_ports"],
+            oriented["target_ports"],
+            num_cables,
+        )
         source_ports = oriented["source_ports"]
         target_ports = oriented["target_ports"]
-        source_lane_units = oriented["source_lane_units"]
-        target_lane_units = oriented["target_lane_units"]
-
-        _validate_edge_allocation(
-            source_node_id,
-            target_node_id,
-            source_ports,
-            target_ports,
-            _require_int(bundle_attrs, "num_cables"),
+        if rows_to_skip:
+            source_ports = source_ports[rows_to_skip:]
+            target_ports = target_ports[rows_to_skip:]
+            rows_to_skip = 0
+        yield BundleAllocation(
+            source_node_id=oriented["source_node_id"],
+            target_node_id=oriented["target_node_id"],
+            source_ports=source_ports,
+            target_ports=target_ports,
+            source_lane_units=oriented["source_lane_units"],
+            target_lane_units=oriented["target_lane_units"],
+            cable_bandwidth_gb=cable_bandwidth_gb(bundle_attrs),
         )
 
-        for source_port, target_port in zip(source_ports, target_ports):
-            rows.append(
-                {
-                    **(
-                        {"fabric": context.fabric_name}
-                        if context.fabric_name is not None
-                        else {}
-                    ),
-                    "source_serial_number": None,
-                    "source_group": _node_group_label(context, source_node_id),
-                    "source_node_id": source_node_id,
-                    "source_node_port": source_port,
-                    "source_lane_units": source_lane_units,
-                    "target_node_port": target_port,
-                    "target_lane_units": target_lane_units,
-                    "target_node_id": target_node_id,
-                    "target_group": _node_group_label(context, target_node_id),
-                    "target_serial_number": None,
-                    "cable_bandwidth_gb": cable_bandwidth_gb(bundle_attrs),
-                    "cable_number": cable_counter,
-                }
+
+class _PortMappingFrameBuilder:
+    """Accumulate cut-sheet columns one bundle at a time.
+
+    Per-cable values are only materialised as numpy arrays in ``to_frame``;
+    node IDs, group labels and fabric names are stored as category codes.
+    """
+
+    def __init__(self) -> None:
+        self.categories: dict[str, int] = {}
+        self.fabric_codes: list[int] = []
+        self.source_codes: list[int] = []
+        self.target_codes: list[int] = []
+        self.source_group_codes: list[int] = []
+        self.target_group_codes: list[int] = []
+        self.source_lane_units: list[int] = []
+        self.target_lane_units: list[int] = []
+        self.bandwidths_gb: list[float] = []
+        self.cable_counts: list[int] = []
+        self.source_ports: list[Sequence[int]] = []
+        self.target_ports: list[Sequence[int]] = []
+
+    def add_context(
+        self,
+        context: PortMappingContext,
+        edges: Iterable[tuple[str, str, dict[str, object]]],
+    ) -> None:
+        fabric_code = self._code(context.fabric_name or "")
+        for allocation in _iter_bundle_allocations(context, edges):
+            self.fabric_codes.append(fabric_code)
+            self.source_codes.append(self._code(allocation.source_node_id))
+            self.target_codes.append(self._code(allocation.target_node_id))
+            self.source_group_codes.append(
+                self._code(context.group_labels[allocation.source_node_id])
+            )
+            self.target_group_codes.append(
+                self._code(context.group_labels[allocation.target_node_id])
             )
-            cable_counter += 1
+            self.source_lane_units.append(allocation.source_lane_units)
+            self.target_lane_units.append(allocation.target_lane_units)
+            self.bandwidths_gb.append(allocation.cable_bandwidth_gb)
+            self.cable_counts.append(len(allocation.source_ports))
+            self.source_ports.append(allocation.source_ports)
+            self.target_ports.append(allocation.target_ports)
+
+    def to_frame(self, columns: list[str]) -> pd.DataFrame:
+        import pandas as pd
+
+        counts = np.asarray(self.cable_counts, dtype=np.int64)
+        row_count = int(counts.sum())
+        categories = pd.Index(list(self.categories), dtype=object)
+        empty_serials = np.full(row_count, None, dtype=object)
+        data: dict[str, object] = {
+            "fabric": _categorical_column(self.fabric_codes, counts, categories),
+            "source_serial_number": empty_serials,
+            "source_group": _categorical_column(
+                self.source_group_codes, counts, categories
+            ),
+            "source_node_id": _categorical_column(self.source_codes, counts, categories),
+            "source_node_port": _port_column(self.source_ports, counts),
+            "source_lane_units": np.repeat(
+                np.asarray(self.source_lane_units, dtype=np.int32), counts
+            ),
+            "target_node_port": _port_column(self.target_ports, counts),
+            "target_lane_units": np.repeat(
+                np.asarray(self.target_lane_units, dtype=np.int32), counts
+            ),
+            "target_node_id": _categorical_column(self.target_codes, counts, categories),
+            "target_group": _categorical_column(
+                self.target_group_codes, counts, categories
+            ),
+            "target_serial_number": empty_serials.copy(),
+            "cable_bandwidth_gb": np.repeat(
+                np.asarray(self.bandwidths_gb, dtype=np.float64), counts
+            ),
+            "cable_number": np.arange(1, row_count + 1, dtype=np.int64),
+        }
+        return pd.DataFrame({column: data[column] for column in columns})
+
+    def _code(self, value: str) -> int:
+        return self.categories.setdefault(value, len(self.categories))
 
-    return rows, cable_counter
+
+def _categorical_column(
+    codes: list[int],
+    counts: npt.NDArray[np.int64],
+    categories: pd.Index,
+) -> pd.Categorical:
+    """Repeat per-bundle category codes per cable, keeping only used categories."""
+    import pandas as pd
+
+    cable_codes = np.repeat(np.asarray(codes, dtype=np.int64), counts)
+    used_codes = np.unique(cable_codes)
+    return pd.Categorical.from_codes(
+        np.searchsorted(used_codes, cable_codes),
+        categories=categories[used_codes],
+    )
+
+
+def _port_column(
+    ports: list[Sequence[int]],
+    counts: npt.NDArray[np.int64],
+) -> npt.NDArray[np.int32]:
+    """Expand per-bundle port sequences into one int32 column.
+
+    Port ranges are expanded arithmetically; explicit port lists are copied
+    into their slice afterwards.
+    """
+    starts = np.zeros(len(ports), dtype=np.int64)
+    strides = np.zeros(len(ports), dtype=np.int64)
+    explicit: list[int] = []
+    for index, bundle_ports in enumerate(ports):
+        if isinstance(bundle_ports, PortRange):
+            starts[index] = bundle_ports.start
+            strides[index] = bundle_ports.stride
+        else:
+            explicit.append(index)
+
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    position = np.arange(offsets[-1], dtype=np.int64) - np.repeat(offsets[:-1], counts)
+    column = np.repeat(starts, counts) + np.repeat(strides, counts) * position
+    for index in explicit:
+        column[offsets[index] : offsets[index + 1]] = ports[index]
+    return column.astype(np.int32)
 
 
 def _build_port_mapping_context(
-    graph: nx.Graph,
+    graph: TopologyGraph,
     fabric_name: str | None = None,
 ) -> PortMappingContext:
     node_attrs_by_id = {
@@ -181,35 +711,46 @@ def _build_port_mapping_context(
         for node_id, raw_attrs in graph.nodes(data=True)
         if (attrs := flatten_node_attrs_for_fabric(raw_attrs, fabric_name)) is not None
     }
-    natural_sort_keys = {node_id: natural_sort_key(node_id) for node_id in node_attrs_by_id}
-    node_sort_keys = {
-        node_id: node_sort_key(
-            node_id,
-            node_attrs_by_id[node_id],
-            natural_sort_keys[node_id],
-        )
-        for node_id in node_attrs_by_id
-    }
     return PortMappingContext(
         fabric_name=fabric_name,
         node_attrs_by_id=node_attrs_by_id,
-        node_sort_keys=node_sort_keys,
+        group_labels={
+            node_id: node_group_label(attrs) for node_id, attrs in node_attrs_by_id.items()
+        },
+        edges_in_order=has_canonical_edge_order(graph),
     )
 
 
-def _edge_sort_key(
+def _sort_edge_bundles(
     context: PortMappingContext,
-    source: str,
-    target: str,
-) -> tuple[tuple[object, ...], tuple[object, ...]]:
-    lower_node, upper_node = sorted(
-        (source, target),
-        key=context.node_sort_keys.__getitem__,
+    edge_bundles: list[tuple[str, str, LinkBundleAttrs, int]],
+) -> list[tuple[str, str, LinkBundleAttrs, int]]:
+    """Order bundles by lower node rank, upper node rank, then bundle index."""
+    node_ranks = context.node_ranks
+    count = len(edge_bundles)
+    source_ranks = np.fromiter(
+        (node_ranks[edge_bundle[0]] for edge_bundle in edge_bundles),
+        dtype=np.int64,
+        count=count,
+    )
+    target_ranks = np.fromiter(
+        (node_ranks[edge_bundle[1]] for edge_bundle in edge_bundles),
+        dtype=np.int64,
+        count=count,
     )
-    return (
-        context.node_sort_keys[lower_node],
-        context.node_sort_keys[upper_node],
+    bundle_indexes = np.fromiter(
+        (edge_bundle[3] for edge_bundle in edge_bundles),
+        dtype=np.int64,
+        count=count,
+    )
+    order = np.lexsort(
+        (
+            bundle_indexes,
+            np.maximum(source_ranks, target_ranks),
+            np.minimum(source_ranks, target_ranks),
+        )
     )
+    return [edge_bundles[index] for index in order]
 
 
 def _should_swap_edge_orientation(
@@ -228,8 +769,8 @@ def _orient_edge_allocation(
     target: str,
     attrs: Mapping[str, object],
 ) -> OrientedEdgeAllocation:
-    source_ports = _require_int_list(attrs, "source_ports")
-    target_ports = _require_int_list(attrs, "target_ports")
+    source_ports = _require_port_sequence(attrs, "source_ports")
+    target_ports = _require_port_sequence(attrs, "target_ports")
     source_lane_units = _require_int(attrs, "source_lane_units_per_cable")
     target_lane_units = _require_int(attrs, "target_lane_units_per_cable")
 
@@ -256,8 +797,8 @@ def _orient_edge_allocation(
 def _validate_edge_allocation(
     source_node_id: str,
     target_node_id: str,
-    source_ports: list[int],
-    target_ports: list[int],
+    source_ports: Sequence[int],
+    target_ports: Sequence[int],
     num_cables: int,
 ) -> None:
     if len(source_ports) != len(target_ports):
@@ -276,14 +817,14 @@ def _node_attrs(context: PortMappingContext, node_id: str) -> NodeAttrs:
     return context.node_attrs_by_id[node_id]
 
 
-def _node_group_label(context: PortMappingContext, node_id: str) -> str:
-    return node_group_label(_node_attrs(context, node_id))
-
-
-def _require_int_list(attrs: Mapping[str, object], key: str) -> list[int]:
+def _require_port_sequence(attrs: Mapping[str, object], key: str) -> Sequence[int]:
     value = attrs.get(key)
+    if isinstance(value, PortRange):
+        return value
     if not isinstance(value, list) or not all(isinstance(item, int) for item in value):
-        raise ValueError(f"Edge attribute {key!r} must be a list of integers.")
+        raise ValueError(
+            f"Edge attribute {key!r} must be a port range or a list of integers."
+        )
     return cast(list[int], value)
 
 
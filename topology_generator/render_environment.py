@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib
+import multiprocessing
 import os
 import tempfile
 from dataclasses import dataclass
@@ -69,3 +70,15 @@ def load_matplotlib() -> MatplotlibBindings:
         Arc=patches.Arc,
         Rectangle=patches.Rectangle,
     )
+
+
+def use_agg_backend_in_worker() -> None:
+    """Switch Matplotlib to the non-interactive Agg backend in worker processes.
+
+    Render workers draw straight to PNG files, so they must never try to open
+    a display even when the parent process has one.
+    """
+    if multiprocessing.parent_process() is None:
+        return
+    os.environ["MPLBACKEND"] = "Agg"
+    load_matplotlib().plt.switch_backend("Agg")
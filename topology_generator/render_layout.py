@@ -7,7 +7,7 @@ import networkx as nx
 
 from topology_generator.graph_metadata import (
     node_attrs,
-    node_sort_key,
+    sort_node_items,
     total_edge_bandwidth_gb,
 )
 from topology_generator.render_formatting import (
@@ -70,7 +70,7 @@ def build_layout_profile(total_group_count: int) -> LayoutProfile:
 
 
 def build_render_summary(graph: nx.Graph) -> RenderSummary:
-    sorted_node_items = sorted(graph.nodes(data=True), key=_node_sort_key)
+    sorted_node_items = sort_node_items(graph.nodes(data=True))
 
     grouped_layer_nodes: dict[int, dict[int, list[str]]] = {}
     global_layer_nodes: dict[int, list[str]] = {}
@@ -863,11 +863,6 @@ def _compute_layer_heights(
     return heights
 
 
-def _node_sort_key(item: tuple[str, dict[str, Any]]) -> tuple[object, ...]:
-    node, data = item
-    return node_sort_key(node, data)
-
-
 def compute_group_container_bounds(
     graph: nx.Graph,
     positions: dict[str, tuple[float, float]],
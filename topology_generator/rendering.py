@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from os import PathLike
 
-import networkx as nx
-
-from topology_generator.graph_metadata import fabric_names, is_multi_fabric_graph
+from topology_generator.graph_metadata import (
+    TopologyGraph,
+    fabric_names,
+    is_multi_fabric_graph,
+)
+from topology_generator.parallel import map_with_graph
 from topology_generator.render_drawing import visualize_single_topology
+from topology_generator.render_environment import use_agg_backend_in_worker
 from topology_generator.render_layout import build_render_summary, calculate_layout
 from topology_generator.topology_generator import (
     build_fabric_output_name,
@@ -20,21 +24,22 @@ def build_topology_title(fabric_name: str | None = None) -> str:
 
 
 def visualize_topology(
-    graph: nx.Graph,
+    graph: TopologyGraph,
     output_dir: str | PathLike[str] | None = None,
+    jobs: int | None = 1,
 ) -> None:
+    """Render one PNG per fabric, or a single PNG for single-fabric graphs.
+
+    Fabrics are independent, so with ``jobs`` other than 1 they are rendered
+    in a process pool (``None`` means one worker per CPU).
+    """
     if is_multi_fabric_graph(graph):
-        for fabric_name in fabric_names(graph):
-            fabric_graph = get_fabric_view(graph, fabric_name)
-            render_summary = build_render_summary(fabric_graph)
-            visualize_single_topology(
-                fabric_graph,
-                calculate_layout(fabric_graph, render_summary),
-                output_dir,
-                filename=f"topology_{build_fabric_output_name(fabric_name)}.png",
-                title=build_topology_title(fabric_name),
-                render_summary=render_summary,
-            )
+        map_with_graph(
+            graph,
+            _render_fabric,
+            [(fabric_name, output_dir) for fabric_name in fabric_names(graph)],
+            jobs,
+        )
         return
 
     render_summary = build_render_summary(graph)
@@ -45,3 +50,21 @@ def visualize_topology(
         title=build_topology_title(),
         render_summary=render_summary,
     )
+
+
+def _render_fabric(
+    graph: TopologyGraph,
+    task: tuple[str, str | PathLike[str] | None],
+) -> None:
+    fabric_name, output_dir = task
+    use_agg_backend_in_worker()
+    fabric_graph = get_fabric_view(graph, fabric_name)
+    render_summary = build_render_summary(fabric_graph)
+    visualize_single_topology(
+        fabric_graph,
+        calculate_layout(fabric_graph, render_summary),
+        output_dir,
+        filename=f"topology_{build_fabric_output_name(fabric_name)}.png",
+        title=build_topology_title(fabric_name),
+        render_summary=render_summary,
+    )
@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from typing import Generic, TypeVar
+from urllib.parse import parse_qs, urlsplit
+
+import yaml
+
+from topology_generator.config_types import InvalidTopologyConfig, TopologyConfig
+from topology_generator.expander import ExpandedTopology
+from topology_generator.validator import TopologyValidationError
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_ENTRIES = 64
+DEFAULT_MAX_BODY_BYTES = 16 * 2**20
+CUTSHEET_CONTENT_TYPES = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv; charset=utf-8",
+    "csv.gz": "application/gzip",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+_KeyT = TypeVar("_KeyT")
+_ValueT = TypeVar("_ValueT")
+
+_worker_expansions: LRUCache[str, ExpandedTopology] | None = None
+
+
+class ServiceError(Exception):
+    """A request the service rejects, with the HTTP status to answer with."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        self.status = status
+        super().__init__(message)
+
+    def __reduce__(self) -> tuple[type[ServiceError], tuple[HTTPStatus, str]]:
+        return type(self), (self.status, str(self))
+
+
+class LRUCache(Generic[_KeyT, _ValueT]):
+    """A thread-safe mapping that drops its least recently used entries."""
+
+    def __init__(self, max_entries: int):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[_KeyT, _ValueT] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_create(self, key: _KeyT, create: Callable[[], _ValueT]) -> _ValueT:
+        """Return the entry for ``key``, storing ``create()`` on a miss.
+
+        ``create`` runs under the lock, so it should be cheap, such as
+        submitting work and returning its future.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            value = create()
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+
+    def discard(self, key: _KeyT, value: _ValueT) -> None:
+        """Remove ``key`` if it still maps to ``value``."""
+        with self._lock:
+            if self._entries.get(key) is value:
+                del self._entries[key]
+
+
+class TopologyService:
+    """Validate, export and render configs sent as YAML bytes, with warm caches.
+
+    Parsed configs, validation results and rendered diagrams are kept in LRU
+    caches keyed by a hash of the YAML bytes. Validation results and diagrams
+    are cached as futures, so concurrent requests for the same config share
+    one computation. Validation, graph building, cut-sheet writing and
+    rendering run in a process pool forked after the heavy modules are
+    imported. Workers are sent the YAML bytes, never a pickled expansion, and
+    each keeps its own LRU cache of validated expansions.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+    ):
+        from topology_generator.batch import preload_modules
+
+        preload_modules()
+        self.configs: LRUCache[str, Future[TopologyConfig]] = LRUCache(max_entries)
+        self.validations: LRUCache[str, Future[dict[str, object]]] = LRUCache(
+            max_entries
+        )
+        self.diagrams: LRUCache[str, Future[dict[str, bytes]]] = LRUCache(max_entries)
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(max_entries,),
+        )
+        # Under fork the first submit starts every worker. Do it now, before
+        # request threads exist that could hold locks while forking.
+        self._executor.submit(int).result()
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> TopologyService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def validate(self, content: bytes) -> dict[str, object]:
+        """Return node and link counts for a valid config."""
+        self._config(content)
+        key = _content_key(content)
+        return _wait(
+            self.validations,
+            key,
+            self.validations.get_or_create(
+                key,
+                lambda: self._executor.submit(_validate, content),
+            ),
+        )
+
+    def cutsheet(self, content: bytes, output_format: str = "xlsx") -> tuple[str, bytes]:
+        """Return the cut-sheet file name and bytes in ``output_format``.
+
+        Excel output that needs more than one workbook is returned as a zip.
+        """
+        if output_format not in CUTSHEET_CONTENT_TYPES:
+            raise ServiceError(
+                HTTPStatus.BAD_REQUEST,
+                f"Unknown output format {output_format!r}; expected one of "
+                f"{', '.join(CUTSHEET_CONTENT_TYPES)}.",
+            )
+        self.validate(content)
+        return self._executor.submit(_write_cutsheet, content, output_format).result()
+
+    def render(self, content: bytes, fabric_name: str | None = None) -> bytes:
+        """Return the PNG diagram of a single-fabric config or of one fabric.
+
+        All of a config's diagrams are rendered together on first use, so
+        requests for its other fabrics are served from the cache.
+        """
+        config = self._config(content)
+        if config.is_multi_fabric and fabric_name not in config.fabric_names:
+            raise ServiceError(
+                HTTPStatus.BAD_REQUEST,
+                f"Pass fabric as one of {', '.join(config.fabric_names)}.",
+            )
+        if not config.is_multi_fabric and fabric_name is not None:
+            raise ServiceError(
+                HTTPStatus.BAD_REQUEST, "Single-fabric configs have no fabrics."
+            )
+
+        key = _content_key(content)
+        self.validate(content)
+        diagrams = _wait(
+            self.diagrams,
+            key,
+            self.diagrams.get_or_create(
+                key,
+                lambda: self._executor.submit(_render_diagrams, content),
+            ),
+        )
+        return diagrams[fabric_name or ""]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "configs": len(self.configs),
+            "validations": len(self.validations),
+            "diagrams": len(self.diagrams),
+        }
+
+    def _config(self, content: bytes) -> TopologyConfig:
+        key = _content_key(content)
+        parsed: Future[TopologyConfig] = Future()
+        future = self.configs.get_or_create(key, lambda: parsed)
+        if future is parsed:
+            # Parse outside the cache lock; concurrent requests for the same
+            # bytes wait on the future instead of parsing again.
+            try:
+                parsed.set_result(_parse_config(content))
+            except Exception as exc:
+                parsed.set_exception(exc)
+        return _wait(self.configs, key, future)
+
+
+class TopologyRequestHandler(BaseHTTPRequestHandler):
+    """Routes ``POST /validate``, ``/cutsheet`` and ``/render`` and ``GET /health``.
+
+    POST bodies are the YAML config, at most the server's ``max_body_bytes``.
+    ``/cutsheet`` takes ``?format=`` and ``/render`` takes ``?fabric=`` for
+    multi-fabric configs.
+    """
+
+    server: TopologyServer
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path != "/health":
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {self.path!r}.")
+            return
+        self._send_json(
+            HTTPStatus.OK,
+            {"status": "ok", "cache": self.server.service.stats()},
+        )
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        try:
+            content_length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self._send_error(HTTPStatus.BAD_REQUEST, "Invalid Content-Length header.")
+            return
+        if content_length > self.server.max_body_bytes:
+            # The body is left unread, so the connection cannot be reused.
+            self.close_connection = True
+            self._send_error(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"Request body of {content_length} bytes exceeds the "
+                f"{self.server.max_body_bytes}-byte limit.",
+            )
+            return
+        content = self.rfile.read(content_length)
+        service = self.server.service
+        try:
+            if url.path == "/validate":
+                self._send_json(HTTPStatus.OK, service.validate(content))
+            elif url.path == "/cutsheet":
+                filename, body = service.cutsheet(content, query.get("format", "xlsx"))
+                content_type = (
+                    "application/zip"
+                    if filename.endswith(".zip")
+                    else CUTSHEET_CONTENT_TYPES[query.get("format", "xlsx")]
+                )
+                self._send_bytes(HTTPStatus.OK, content_type, body, filename)
+            elif url.path == "/render":
+                body = service.render(content, query.get("fabric"))
+                self._send_bytes(HTTPStatus.OK, "image/png", body)
+            else:
+                self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {self.path!r}.")
+        except ServiceError as exc:
+            self._send_error(exc.status, str(exc))
+        except (InvalidTopologyConfig, TopologyValidationError) as exc:
+            self._send_error(HTTPStatus.UNPROCESSABLE_ENTITY, str(exc))
+        except ImportError as exc:
+            self._send_error(HTTPStatus.NOT_IMPLEMENTED, str(exc))
+        except Exception:
+            logger.exception("Error while serving %s", self.path)
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, "Internal server error.")
+
+    def log_message(self, format: str, *args: object) -> None:
+        logger.info("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: HTTPStatus, payload: dict[str, object]) -> None:
+        self._send_bytes(
+            status,
+            "application/json",
+            json.dumps(payload).encode("utf-8"),
+        )
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def _send_bytes(
+        self,
+        status: HTTPStatus,
+        content_type: str,
+        body: bytes,
+        filename: str | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if filename is not None:
+            self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TopologyServer(ThreadingHTTPServer):
+    """Serves each request on its own thread against one ``TopologyService``."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        service: TopologyService,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ):
+        self.service = service
+        self.max_body_bytes = max_body_bytes
+        super().__init__(address, TopologyRequestHandler)
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int | None = None,
+    max_entries: int = DEFAULT_CACHE_ENTRIES,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+) -> None:
+    """Serve the HTTP API until interrupted."""
+    with (
+        TopologyService(workers, max_entries) as service,
+        TopologyServer((host, port), service, max_body_bytes) as server,
+    ):
+        logger.info("Serving topology generator on http://%s:%d", *server.server_address[:2])
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down")
+
+
+def run_serve_command(args: argparse.Namespace) -> None:
+    """Run ``topology-generator serve`` from arguments of ``parse_serve_args``."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    serve(args.host, args.port, args.workers, args.cache_entries, args.max_body_bytes)
+
+
+def _wait(
+    cache: LRUCache[str, Future[_ValueT]],
+    key: str,
+    future: Future[_ValueT],
+) -> _ValueT:
+    try:
+        return future.result()
+    except Exception:
+        # Keep failures out of the cache so a retry recomputes them.
+        cache.discard(key, future)
+        raise
+
+
+def _content_key(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _parse_config(content: bytes) -> TopologyConfig:
+    try:
+        raw_config = yaml.safe_load(content.decode("utf-8"))
+    except (UnicodeDecodeError, yaml.YAMLError) as exc:
+        raise ServiceError(HTTPStatus.BAD_REQUEST, f"Invalid YAML: {exc}") from exc
+    return TopologyConfig.from_mapping(raw_config)
+
+
+def _init_worker(max_entries: int) -> None:
+    global _worker_expansions
+    _worker_expansions = LRUCache(max_entries)
+
+
+def _worker_expanded_topology(content: bytes) -> ExpandedTopology:
+    """Return the validated expansion of ``content``, cached in this worker."""
+    from topology_generator.validator import validate_topology_config
+
+    assert _worker_expansions is not None
+    # A worker runs one task at a time, so validating under the cache lock
+    # blocks nothing.
+    return _worker_expansions.get_or_create(
+        _content_key(content),
+        lambda: validate_topology_config(_parse_config(content)),
+    )
+
+
+def _validate(content: bytes) -> dict[str, object]:
+    expanded_topology = _worker_expanded_topology(content)
+    return {
+        "valid": True,
+        "nodes": expanded_topology.num_nodes,
+        "links": expanded_topology.num_links,
+        "fabrics": list(expanded_topology.config.fabric_names),
+    }
+
+
+def _write_cutsheet(content: bytes, output_format: str) -> tuple[str, bytes]:
+    from topology_generator.cutsheet_formats import write_port_mapping
+    from topology_generator.topology_generator import generate_topology
+
+    expanded_topology = _worker_expanded_topology(content)
+    graph = generate_topology(
+        expanded_topology.config,
+        expanded_topology=expanded_topology,
+    )
+    with tempfile.TemporaryDirectory() as output_dir:
+        write_port_mapping(graph, output_dir, output_format, jobs=1)
+        output_files = sorted(Path(output_dir).iterdir())
+        if len(output_files) == 1:
+            return output_files[0].name, output_files[0].read_bytes()
+
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for output_file in output_files:
+                zip_file.write(output_file, output_file.name)
+        return "port_mapping.zip", archive.getvalue()
+
+
+def _render_diagrams(content: bytes) -> dict[str, bytes]:
+    from topology_generator.render_environment import use_agg_backend_in_worker
+    from topology_generator.rendering import visualize_topology
+    from topology_generator.topology_generator import (
+        build_fabric_output_name,
+        generate_topology,
+    )
+
+    use_agg_backend_in_worker()
+    expanded_topology = _worker_expanded_topology(content)
+    config = expanded_topology.config
+    graph = generate_topology(config, expanded_topology=expanded_topology)
+    with tempfile.TemporaryDirectory() as output_dir:
+        visualize_topology(graph, output_dir, jobs=1)
+        if not config.is_multi_fabric:
+            return {"": (Path(output_dir) / "topology.png").read_bytes()}
+        return {
+            fabric_name: (
+                Path(output_dir) / f"topology_{build_fabric_output_name(fabric_name)}.png"
+            ).read_bytes()
+            for fabric_name in config.fabric_names
+        }
@@ -1,6 +1,6 @@
 import logging
 from collections.abc import Mapping
-from typing import Any, cast
+from typing import cast
 
 import networkx as nx
 
@@ -9,21 +9,37 @@ from topology_generator.config_types import (
     TopologyConfig,
     ensure_topology_config,
 )
-from topology_generator.expander import ExpandedNode, ExpandedTopology, expand_topology
+from topology_generator.expander import (
+    ExpandedTopology,
+    expand_topology,
+)
 from topology_generator.graph_metadata import (
+    GraphAttrs,
     LinkBundleAttrs,
-    PortPoolAttrs,
+    PortRange,
+    TopologyGraph,
+    build_node_attrs,
+    build_shared_gpu_node_attrs,
+    check_known_fabric,
     fabric_name_for_edge,
     fabric_names,
     flatten_node_attrs_for_fabric,
     graph_attrs,
+    has_canonical_edge_order,
     link_bundle_attrs,
     is_multi_fabric_graph as _is_multi_fabric_graph,
+    set_canonical_edge_order,
+)
+from topology_generator.validator import (
+    NodeUsage,
+    validate_expanded_topology,
+    validate_expanded_topology_arrays,
 )
-from topology_generator.validator import NodeUsage, validate_expanded_topology
 
 logger = logging.getLogger(__name__)
 
+GRAPH_BACKENDS = ("networkx", "compact")
+
 
 class ContiguousLaneAllocator:
     """Allocate the lowest available contiguous lane span for each cable."""
@@ -46,21 +62,67 @@ class ContiguousLaneAllocator:
             f"{self._total_lane_units} available units."
         )
 
+    def allocate_many(self, lane_units: int, count: int) -> range:
+        """Allocate ``count`` adjacent spans and return their one-based start lanes."""
+        if lane_units <= 0:
+            raise ValueError("lane_units must be greater than zero.")
 
-def generate_topology(config: Mapping[str, object] | TopologyConfig) -> nx.Graph:
-    """Generate a network topology graph from validated YAML config."""
+        start_index = self._next_free_lane
+        end_index = start_index + lane_units * count
+        if end_index <= self._total_lane_units:
+            self._next_free_lane = end_index
+            return range(start_index + 1, end_index + 1, lane_units)
+        raise ValueError(
+            f"Unable to allocate {count} x {lane_units} contiguous lane units from "
+            f"{self._total_lane_units} available units."
+        )
+
+
+def generate_topology(
+    config: Mapping[str, object] | TopologyConfig,
+    graph_backend: str = "networkx",
+    expanded_topology: ExpandedTopology | None = None,
+) -> TopologyGraph:
+    """Generate a network topology graph from validated YAML config.
+
+    ``graph_backend="compact"`` returns a read-only ``CompactTopologyGraph``
+    with the same nodes, edges and port allocations as the ``nx.Graph``.
+    Pass ``expanded_topology`` to reuse an existing expansion of ``config``,
+    such as one loaded from the config cache.
+    """
+    if graph_backend not in GRAPH_BACKENDS:
+        raise ValueError(
+            f"Unknown graph backend {graph_backend!r}; expected one of {GRAPH_BACKENDS!r}."
+        )
     topology_config = ensure_topology_config(config)
     logger.info("Starting network topology generation")
 
-    expanded_topology = expand_topology(topology_config)
+    if expanded_topology is None:
+        expanded_topology = expand_topology(topology_config)
+    metadata: GraphAttrs = {
+        "is_multi_fabric": topology_config.is_multi_fabric,
+        "fabric_names": topology_config.fabric_names,
+    }
+
+    if graph_backend == "compact":
+        from topology_generator.compact_graph import build_compact_graph
+
+        compact_graph = build_compact_graph(
+            expanded_topology,
+            validate_expanded_topology_arrays(expanded_topology),
+            dict(metadata),
+        )
+        set_canonical_edge_order(compact_graph, expanded_topology.has_canonical_link_order)
+        logger.info("Network topology generation completed")
+        return compact_graph
+
     usage_by_node = validate_expanded_topology(expanded_topology)
 
     graph = nx.Graph()
-    metadata = graph_attrs(graph)
-    metadata["is_multi_fabric"] = topology_config.is_multi_fabric
-    metadata["fabric_names"] = topology_config.fabric_names
+    graph_attrs(graph).update(metadata)
     _add_expanded_nodes(graph, expanded_topology, usage_by_node)
     _add_expanded_links(graph, expanded_topology)
+    set_canonical_edge_order(graph, expanded_topology.has_canonical_link_order)
 
     logger.info("Network topology generation completed")
     return graph
@@ -74,14 +136,12 @@ def is_multi_fabric_graph(graph: nx.Graph) -> bool:
     return _is_multi_fabric_graph(graph)
 
 
-def get_fabric_view(graph: nx.Graph, fabric_name: str) -> nx.Graph:
+def get_fabric_view(graph: TopologyGraph, fabric_name: str) -> TopologyGraph:
+    if not isinstance(graph, nx.Graph):
+        return graph.fabric_view(fabric_name)
     if not _is_multi_fabric_graph(graph):
         return graph.copy()
-    known_fabrics = get_fabric_names(graph)
-    if fabric_name not in known_fabrics:
-        raise KeyError(
-            f"Unknown fabric {fabric_name!r}; available fabrics are {known_fabrics!r}."
-        )
+    check_known_fabric(get_fabric_names(graph), fabric_name)
 
     fabric_view = nx.Graph()
     fabric_view.graph.update(graph.graph)
@@ -104,6 +164,7 @@ def get_fabric_view(graph: nx.Graph, fabric_name: str) -> nx.Graph:
             continue
         fabric_view.add_edge(source, target, **attrs)
 
+    set_canonical_edge_order(fabric_view, has_canonical_edge_order(graph))
     return fabric_view
 
 
@@ -120,142 +181,98 @@ def _add_expanded_nodes(
     expanded_topology: ExpandedTopology,
     usage_by_node: dict[str, NodeUsage],
 ) -> None:
-    for node in expanded_topology.nodes:
-        usage = usage_by_node[node.node_id]
-        node_attrs = _build_node_attrs(node, usage)
-
-        if not node.is_shared_gpu_node:
-            graph.add_node(node.graph_node_id, **node_attrs)
-            continue
-
-        if node.graph_node_id not in graph:
-            graph.add_node(
-                node.graph_node_id,
-                layer_index=node.layer_index,
-                layer_name=node.layer_name,
-                placement=node.placement,
-                placement_scope=None,
-                scope_names=(),
-                scope_indexes=(),
-                scope_labels=(),
-                scope_key=(),
-                group_name=None,
-                group_index=None,
-                group_label=None,
-                node_ordinal=node.physical_node_ordinal,
-                physical_node_ordinal=node.physical_node_ordinal,
-                group_order=None,
-                is_shared_gpu_node=True,
-                fabric_metrics={},
+    for expanded_layer in expanded_topology.layers:
+        for node_index in range(expanded_layer.node_start, expanded_layer.node_stop):
+            node_id = expanded_topology.node_ids[node_index]
+            graph_node_id = expanded_topology.graph_node_ids[node_index]
+            usage = usage_by_node[node_id]
+            node_attrs = build_node_attrs(
+                expanded_topology,
+                expanded_layer,
+                node_index,
+                usage,
             )
 
-        fabric_metrics = dict(graph.nodes[node.graph_node_id]["fabric_metrics"])
-        fabric_metrics[node.fabric_name] = node_attrs
-        graph.nodes[node.graph_node_id]["fabric_metrics"] = fabric_metrics
-
-
-def _build_node_attrs(node: ExpandedNode, usage: NodeUsage) -> dict[str, Any]:
-    port_pools = _build_port_pool_attrs(node, usage)
-    return {
-        "layer_index": node.layer_index,
-        "layer_name": node.layer_name,
-        "placement": node.placement,
-        "placement_scope": node.placement_scope,
-        "scope_names": node.scope_names,
-        "scope_indexes": node.scope_indexes,
-        "scope_labels": node.scope_labels,
-        "scope_key": node.scope_key,
-        "group_name": node.group_name,
-        "group_index": node.group_index,
-        "group_label": node.group_label,
-        "group_order": node.group_index,
-        "node_ordinal": node.node_ordinal,
-        "physical_node_ordinal": node.physical_node_ordinal,
-        "aggregate_bandwidth_gb": usage.total_bandwidth_gb,
-        "aggregate_bandwidth_down": usage.bandwidth_down_gb,
-        "aggregate_bandwidth_up": usage.bandwidth_up_gb,
-        "port_pools": port_pools,
-        "supported_port_bandwidths_gb": node.supported_port_bandwidths_gb,
-        "used_bandwidth_gb": usage.total_bandwidth_gb,
-        "fabric": node.fabric_name,
-        "is_shared_gpu_node": node.is_shared_gpu_node,
-    }
+            if not expanded_layer.is_shared_gpu_node:
+                graph.add_node(graph_node_id, **node_attrs)
+                continue
 
+            if graph_node_id not in graph:
+                graph.add_node(graph_node_id, **build_shared_gpu_node_attrs(node_attrs))
 
-def _build_port_pool_attrs(
-    node: ExpandedNode,
-    usage: NodeUsage,
-) -> tuple[PortPoolAttrs, ...]:
-    pool_attrs: list[PortPoolAttrs] = []
-    lane_offset = 0
-    for port_pool in node.port_pools:
-        used_lane_units = usage.required_lane_units_for_pool(port_pool.name)
-        pool_attrs.append(
-            {
-                "name": port_pool.name,
-                "total_lane_units": port_pool.total_lane_units,
-                "used_lane_units": used_lane_units,
-                "port_offset": lane_offset,
-                "base_lane_bandwidth_gb": port_pool.base_lane_bandwidth_gb,
-                "supported_port_bandwidths_gb": port_pool.supported_port_bandwidths_gb,
-            }
-        )
-        lane_offset += port_pool.total_lane_units
-    return tuple(pool_attrs)
+            fabric_metrics = dict(graph.nodes[graph_node_id]["fabric_metrics"])
+            fabric_metrics[expanded_layer.fabric_name] = node_attrs
+            graph.nodes[graph_node_id]["fabric_metrics"] = fabric_metrics
 
 
 def _add_expanded_links(graph: nx.Graph, expanded_topology: ExpandedTopology) -> None:
-    node_lookup = {node.node_id: node for node in expanded_topology.nodes}
-    allocators: dict[tuple[str, str | None, str], ContiguousLaneAllocator] = {}
-    for node in expanded_topology.nodes:
-        for port_pool in node.port_pools:
-            allocator_key = _allocator_key(node, port_pool.name)
-            if allocator_key not in allocators:
-                allocators[allocator_key] = ContiguousLaneAllocator(port_pool.total_lane_units)
-
-    for link in expanded_topology.links:
-        source_node = node_lookup[link.source_node_id]
-        target_node = node_lookup[link.target_node_id]
-        source_port_offset = source_node.port_pool_offset(link.port_pool)
-        target_port_offset = target_node.port_pool_offset(link.port_pool)
-        source_ports = [
-            source_port_offset
-            + allocators[_allocator_key(source_node, link.port_pool)].allocate(
-                link.source_lane_units_per_cable
+    num_nodes = expanded_topology.num_nodes
+    allocators = _build_lane_allocators(expanded_topology)
+
+    for block in expanded_topology.iter_link_blocks():
+        link = expanded_topology.link_specs[block.spec_id]
+        source_port_offset = expanded_topology.layers[
+            link.source_layer_id
+        ].layer.port_pool_offset(link.port_pool)
+        target_port_offset = expanded_topology.layers[
+            link.target_layer_id
+        ].layer.port_pool_offset(link.port_pool)
+        slot_base = link.pool_id * num_nodes
+
+        for source_index, target_index in block.iter_index_pairs():
+            source_lanes = allocators[slot_base + source_index].allocate_many(
+                link.source_lane_units_per_cable,
+                link.num_cables,
             )
-            for _ in range(link.num_cables)
-        ]
-        target_ports = [
-            target_port_offset
-            + allocators[_allocator_key(target_node, link.port_pool)].allocate(
-                link.target_lane_units_per_cable
+            target_lanes = allocators[slot_base + target_index].allocate_many(
+                link.target_lane_units_per_cable,
+                link.num_cables,
+            )
+
+            bundle_attrs: LinkBundleAttrs = {
+                "port_pool": link.port_pool,
+                "source_ports": PortRange.from_range(source_lanes, source_port_offset),
+                "target_ports": PortRange.from_range(target_lanes, target_port_offset),
+                "num_cables": link.num_cables,
+                "cable_bandwidth_gb": link.cable_bandwidth_gb,
+                "source_lane_units_per_cable": link.source_lane_units_per_cable,
+                "target_lane_units_per_cable": link.target_lane_units_per_cable,
+                "fabric": link.fabric_name,
+            }
+            _add_link_bundle(
+                graph,
+                expanded_topology.graph_node_ids[source_index],
+                expanded_topology.graph_node_ids[target_index],
+                bundle_attrs,
             )
-            for _ in range(link.num_cables)
-        ]
-
-        bundle_attrs: LinkBundleAttrs = {
-            "port_pool": link.port_pool,
-            "source_ports": source_ports,
-            "target_ports": target_ports,
-            "num_cables": link.num_cables,
-            "cable_bandwidth_gb": link.cable_bandwidth_gb,
-            "source_lane_units_per_cable": link.source_lane_units_per_cable,
-            "target_lane_units_per_cable": link.target_lane_units_per_cable,
-            "fabric": link.fabric_name,
-        }
-        _add_link_bundle(
-            graph,
-            link.source_graph_node_id,
-            link.target_graph_node_id,
-            bundle_attrs,
-        )
 
 
-def _allocator_key(node: ExpandedNode, port_pool: str) -> tuple[str, str | None, str]:
-    normalized_pool_name = normalize_identifier(port_pool)
-    if node.is_shared_gpu_node:
-        return node.graph_node_id, node.fabric_name, normalized_pool_name
-    return node.graph_node_id, None, normalized_pool_name
+def _build_lane_allocators(
+    expanded_topology: ExpandedTopology,
+) -> list[ContiguousLaneAllocator]:
+    """Resolve every (node, linked pool) pair to slot ``pool_id * num_nodes + node``.
+
+    Expanded node indexes already separate shared GPU nodes per fabric, so each
+    slot owns an independent lane budget. Slots for pools a node does not have
+    share a zero-capacity allocator.
+    """
+    num_nodes = expanded_topology.num_nodes
+    pool_ids = {
+        pool_name: pool_id for pool_id, pool_name in enumerate(expanded_topology.pool_names)
+    }
+    unavailable_allocator = ContiguousLaneAllocator(0)
+    allocators = [unavailable_allocator] * (len(pool_ids) * num_nodes)
+    for expanded_layer in expanded_topology.layers:
+        for port_pool in expanded_layer.layer.port_pools:
+            pool_id = pool_ids.get(normalize_identifier(port_pool.name))
+            if pool_id is None:
+                continue
+            slot_base = pool_id * num_nodes
+            for node_index in range(expanded_layer.node_start, expanded_layer.node_stop):
+                allocators[slot_base + node_index] = ContiguousLaneAllocator(
+                    port_pool.total_lane_units
+                )
+    return allocators
 
 
 def _add_link_bundle(
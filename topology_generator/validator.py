@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+import numpy as np
+import numpy.typing as npt
+
 from topology_generator.config_identifiers import normalize_identifier
-from topology_generator.expander import ExpandedTopology
+from topology_generator.config_types import TopologyConfig
+from topology_generator.expander import ExpandedTopology, expand_topology
 
 
 @dataclass(frozen=True)
@@ -31,76 +35,159 @@ class TopologyValidationError(ValueError):
         self.errors = tuple(sorted(set(errors)))
         super().__init__("\n".join(self.errors))
 
+    def __reduce__(self) -> tuple[type[TopologyValidationError], tuple[list[str]]]:
+        # Rebuild from the error list, so the message survives worker processes.
+        return type(self), (list(self.errors),)
 
-def build_node_usage(expanded_topology: ExpandedTopology) -> dict[str, NodeUsage]:
-    usage = {node.node_id: NodeUsage() for node in expanded_topology.nodes}
 
-    for link in expanded_topology.links:
+@dataclass(frozen=True)
+class NodeUsageArrays:
+    """Per-node usage accumulated into integer-indexed columns.
+
+    Row ``pool_id`` of ``required_lane_units`` and ``bundle_counts`` follows
+    ``ExpandedTopology.pool_names``; columns follow ``ExpandedTopology.node_ids``.
+    """
+
+    required_lane_units: npt.NDArray[np.int64]
+    bundle_counts: npt.NDArray[np.int64]
+    bandwidth_up_gb: npt.NDArray[np.float64]
+    bandwidth_down_gb: npt.NDArray[np.float64]
+
+    def node_usage(
+        self,
+        expanded_topology: ExpandedTopology,
+        node_index: int,
+    ) -> NodeUsage:
+        return NodeUsage(
+            required_lane_units_by_pool={
+                pool_name: int(self.required_lane_units[pool_id, node_index])
+                for pool_id, pool_name in enumerate(expanded_topology.pool_names)
+                if self.bundle_counts[pool_id, node_index]
+            },
+            bandwidth_up_gb=float(self.bandwidth_up_gb[node_index]),
+            bandwidth_down_gb=float(self.bandwidth_down_gb[node_index]),
+        )
+
+
+def build_node_usage_arrays(expanded_topology: ExpandedTopology) -> NodeUsageArrays:
+    """Accumulate lane units and bandwidth per node without per-bundle objects.
+
+    Each link block is a full mesh, so every source node in it gains one bundle
+    per target node and vice versa; a block therefore contributes a single
+    weighted add over its contiguous source and target index ranges.
+    """
+    num_nodes = expanded_topology.num_nodes
+    num_pools = len(expanded_topology.pool_names)
+    arrays = NodeUsageArrays(
+        required_lane_units=np.zeros((num_pools, num_nodes), dtype=np.int64),
+        bundle_counts=np.zeros((num_pools, num_nodes), dtype=np.int64),
+        bandwidth_up_gb=np.zeros(num_nodes, dtype=np.float64),
+        bandwidth_down_gb=np.zeros(num_nodes, dtype=np.float64),
+    )
+
+    for block in expanded_topology.iter_link_blocks():
+        link = expanded_topology.link_specs[block.spec_id]
         bundle_bandwidth = link.num_cables * link.cable_bandwidth_gb
-        normalized_pool_name = normalize_identifier(link.port_pool)
+        source_fan_out = block.target_stop - block.target_start
+        target_fan_in = block.source_stop - block.source_start
+        source_slice = slice(block.source_start, block.source_stop)
+        target_slice = slice(block.target_start, block.target_stop)
 
-        source_usage = usage[link.source_node_id]
-        source_pool_usage = dict(source_usage.required_lane_units_by_pool)
-        source_pool_usage[normalized_pool_name] = source_pool_usage.get(normalized_pool_name, 0) + (
-            link.num_cables * link.source_lane_units_per_cable
-        )
-        usage[link.source_node_id] = NodeUsage(
-            required_lane_units_by_pool=source_pool_usage,
-            bandwidth_up_gb=source_usage.bandwidth_up_gb + bundle_bandwidth,
-            bandwidth_down_gb=source_usage.bandwidth_down_gb,
+        arrays.required_lane_units[link.pool_id, source_slice] += (
+            source_fan_out * link.num_cables * link.source_lane_units_per_cable
         )
+        arrays.bundle_counts[link.pool_id, source_slice] += source_fan_out
+        arrays.bandwidth_up_gb[source_slice] += source_fan_out * bundle_bandwidth
 
-        target_usage = usage[link.target_node_id]
-        target_pool_usage = dict(target_usage.required_lane_units_by_pool)
-        target_pool_usage[normalized_pool_name] = target_pool_usage.get(normalized_pool_name, 0) + (
-            link.num_cables * link.target_lane_units_per_cable
-        )
-        usage[link.target_node_id] = NodeUsage(
-            required_lane_units_by_pool=target_pool_usage,
-            bandwidth_up_gb=target_usage.bandwidth_up_gb,
-            bandwidth_down_gb=target_usage.bandwidth_down_gb + bundle_bandwidth,
+        arrays.required_lane_units[link.pool_id, target_slice] += (
+            target_fan_in * link.num_cables * link.target_lane_units_per_cable
         )
+        arrays.bundle_counts[link.pool_id, target_slice] += target_fan_in
+        arrays.bandwidth_down_gb[target_slice] += target_fan_in * bundle_bandwidth
 
-    return usage
+    return arrays
+
+
+def build_node_usage(expanded_topology: ExpandedTopology) -> dict[str, NodeUsage]:
+    return _node_usage_by_id(expanded_topology, build_node_usage_arrays(expanded_topology))
 
 
 def validate_expanded_topology(expanded_topology: ExpandedTopology) -> dict[str, NodeUsage]:
-    node_lookup = {node.node_id: node for node in expanded_topology.nodes}
-    usage = build_node_usage(expanded_topology)
+    return _node_usage_by_id(
+        expanded_topology,
+        validate_expanded_topology_arrays(expanded_topology),
+    )
+
+
+def validate_expanded_topology_arrays(
+    expanded_topology: ExpandedTopology,
+) -> NodeUsageArrays:
+    """Validate the expanded topology and return usage as columns, not per-node objects.
+
+    Only port-pool capacity is checked here. Config validation and
+    ``expand_topology`` already reject cable bandwidths a port pool cannot
+    carry, so every link spec has valid lane units per cable.
+    """
+    arrays = build_node_usage_arrays(expanded_topology)
     errors: list[str] = []
 
-    for link in expanded_topology.links:
-        source_node = node_lookup[link.source_node_id]
-        target_node = node_lookup[link.target_node_id]
-        if (
-            source_node.lane_units_for_pool_bandwidth(link.port_pool, link.cable_bandwidth_gb)
-            is None
-        ):
-            errors.append(
-                f"{source_node.node_id} does not support {link.cable_bandwidth_gb:g} GB/s cables "
-                f"in port pool {link.port_pool!r}"
-            )
-        if (
-            target_node.lane_units_for_pool_bandwidth(link.port_pool, link.cable_bandwidth_gb)
-            is None
-        ):
-            errors.append(
-                f"{target_node.node_id} does not support {link.cable_bandwidth_gb:g} GB/s cables "
-                f"in port pool {link.port_pool!r}"
-            )
-
-    for node_id, node in node_lookup.items():
-        node_usage = usage[node_id]
-        for port_pool in node.port_pools:
-            required_lane_units = node_usage.required_lane_units_for_pool(port_pool.name)
-            if required_lane_units <= port_pool.total_lane_units:
-                continue
+    pool_ids = {
+        pool_name: pool_id for pool_id, pool_name in enumerate(expanded_topology.pool_names)
+    }
+    for expanded_layer in expanded_topology.layers:
+        layer_pools = [
+            (port_pool, pool_id)
+            for port_pool in expanded_layer.layer.port_pools
+            if (pool_id := pool_ids.get(normalize_identifier(port_pool.name))) is not None
+        ]
+        if not layer_pools:
+            continue
+        layer_lane_units = arrays.required_lane_units[
+            [pool_id for _, pool_id in layer_pools],
+            expanded_layer.node_start : expanded_layer.node_stop,
+        ]
+        total_lane_units = np.array(
+            [port_pool.total_lane_units for port_pool, _ in layer_pools]
+        )
+        # Layers own contiguous node ranges in node order, so walking each
+        # layer node by node, then pool by pool, reports errors per node.
+        over_capacity = (layer_lane_units > total_lane_units[:, np.newaxis]).T
+        for offset, pool_index in np.argwhere(over_capacity):
+            port_pool, _ = layer_pools[pool_index]
+            node_id = expanded_topology.node_ids[expanded_layer.node_start + offset]
             errors.append(
-                f"{node_id} port pool {port_pool.name!r} requires {required_lane_units} "
+                f"{node_id} port pool {port_pool.name!r} requires "
+                f"{int(layer_lane_units[pool_index, offset])} "
                 f"lane units but has {port_pool.total_lane_units}"
             )
 
     if errors:
         raise TopologyValidationError(errors)
 
-    return usage
+    return arrays
+
+
+def validate_topology_config(
+    config: TopologyConfig | dict[str, object],
+    expanded_topology: ExpandedTopology | None = None,
+) -> ExpandedTopology:
+    """Expand ``config`` and validate it without building a graph.
+
+    Raises ``TopologyValidationError`` exactly where ``generate_topology``
+    would, but never imports a graph backend. An existing expansion of
+    ``config`` can be passed in as ``expanded_topology``.
+    """
+    if expanded_topology is None:
+        expanded_topology = expand_topology(config)
+    validate_expanded_topology_arrays(expanded_topology)
+    return expanded_topology
+
+
+def _node_usage_by_id(
+    expanded_topology: ExpandedTopology,
+    arrays: NodeUsageArrays,
+) -> dict[str, NodeUsage]:
+    return {
+        node_id: arrays.node_usage(expanded_topology, node_index)
+        for node_index, node_id in enumerate(expanded_topology.node_ids)
+    }